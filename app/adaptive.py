@@ -0,0 +1,179 @@
+"""
+Adaptive page fetching: plain HTTP first, Chromium only when a page needs it.
+
+Rendering every page in a browser and waiting for the network to go idle is by
+far the slowest step of a fast-mode run, and most documentation generators
+(Sphinx, MkDocs, Hugo, Jekyll) serve complete HTML anyway. ``AdaptiveCrawler``
+fetches each page over pooled HTTP and checks whether the response already
+holds the content (``looks_server_rendered``: enough visible text, a main
+content element, no bare SPA mount point). Server-rendered HTML goes straight
+into crawl4ai's content processing, so the Markdown comes out of the same
+pipeline as a rendered page. Everything else is fetched again in a real browser,
+which is only launched once the first page needs it.
+
+Once a page is found to need JavaScript, its URL template (see
+``url_template``) is remembered and later pages of the same family go directly
+to the browser instead of paying for a wasted HTTP fetch. A changed page's
+response to a revalidation request can be handed over with ``offer``, so it is
+not requested a second time.
+
+Usage examples:
+    async with open_crawler(browser_config, render="auto") as crawler:
+        result = await crawler.arun(url, config=run_config)
+    crawler.static, crawler.rendered  # pages served without/with a browser
+    Revalidator(store, scheduler, on_changed=crawler.offer)
+"""
+
+import httpx
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CrawlResult
+
+from .config import get_http_client
+from .constants import MAX_CONCURRENT_REQUESTS, MAX_CONTENT_LENGTH
+from .fast_discovery import SharedCrawler
+from .url_clusters import url_template
+from .utils.html_scan import LinkExtractor, looks_server_rendered
+from .utils.logging import get_logger
+
+logger = get_logger("adaptive")
+
+
+class AdaptiveCrawler:
+    """Drop-in for ``AsyncWebCrawler.arun`` that renders only when needed.
+
+    Used as an async context manager that owns the HTTP client and the lazily
+    started browser.
+
+    Attributes:
+        static: Pages converted from their plain HTTP response
+        rendered: Pages fetched with the browser
+        browser_templates: URL templates whose pages need JavaScript
+    """
+
+    def __init__(
+        self,
+        browser_config: BrowserConfig | None = None,
+        concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        self.static = 0
+        self.rendered = 0
+        self.browser_templates: set[str] = set()
+        self._browser = SharedCrawler(browser_config)
+        # Never started: only its HTML processing is used for static pages
+        self._processor = AsyncWebCrawler(config=browser_config)
+        self._concurrency = concurrency
+        self._client: httpx.AsyncClient | None = None
+        self._offered: dict[str, tuple[str, httpx.Response]] = {}
+
+    async def __aenter__(self) -> "AdaptiveCrawler":
+        await self._browser.__aenter__()
+        self._client = get_http_client(max_connections=self._concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await self._browser.__aexit__(*exc_info)
+        logger.debug(
+            f"Adaptive fetching: {self.static} pages without a browser, "
+            f"{self.rendered} rendered"
+        )
+
+    async def arun(self, url: str, config: CrawlerRunConfig) -> CrawlResult:
+        """Fetch and process one page, rendering it only if necessary."""
+        template = url_template(url)
+        if template not in self.browser_templates:
+            page = self._offered.pop(url, None) or await self._fetch_static(url)
+            if page is not None:
+                html, response = page
+                extractor = LinkExtractor(str(response.url))
+                extractor.feed(html)
+                extractor.close()
+                if looks_server_rendered(extractor, len(html)):
+                    self.static += 1
+                    return await self._process(url, html, response, config)
+                logger.info(f"{url} needs JavaScript, rendering {template} pages")
+                self.browser_templates.add(template)
+
+        self.rendered += 1
+        crawler = await self._browser.get()
+        return await crawler.arun(url, config=config)
+
+    async def offer(self, url: str, response: httpx.Response) -> None:
+        """Keep a page's already open HTTP response for the next ``arun(url)``.
+
+        Meant for the full response a changed page sends to a conditional
+        request. Responses that could not be converted without a browser are
+        ignored, and so are pages whose template already needs one.
+        """
+        if url_template(url) in self.browser_templates:
+            return
+        try:
+            page = await self._read_static(url, response)
+        except httpx.HTTPError as e:
+            logger.debug(f"Could not read offered response for {url}: {e}")
+            return
+        if page is not None:
+            self._offered[url] = page
+
+    async def _fetch_static(self, url: str) -> tuple[str, httpx.Response] | None:
+        """GET a page; None when the browser should handle it instead."""
+        if self._client is None:
+            return None
+        try:
+            async with self._client.stream("GET", url) as response:
+                return await self._read_static(url, response)
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}, rendering instead: {e}")
+            return None
+
+    async def _read_static(
+        self, url: str, response: httpx.Response
+    ) -> tuple[str, httpx.Response] | None:
+        """Read a streamed HTML response; None when the browser should handle it.
+
+        Errors, non-HTML responses and pages longer than MAX_CONTENT_LENGTH
+        characters are left to the browser.
+        """
+        content_type = response.headers.get("content-type", "")
+        if response.status_code >= 400 or "html" not in content_type.lower():
+            # The browser reports errors and downloads the usual way
+            return None
+        chunks = []
+        read = 0
+        async for text in response.aiter_text():
+            chunks.append(text)
+            read += len(text)
+            if read > MAX_CONTENT_LENGTH:
+                # Converting a truncated page would silently drop content
+                logger.debug(f"{url} is too large to read, rendering instead")
+                return None
+        return "".join(chunks), response
+
+    async def _process(
+        self, url: str, html: str, response: httpx.Response, config: CrawlerRunConfig
+    ) -> CrawlResult:
+        final_url = str(response.url)
+        result = await self._processor.aprocess_html(
+            url=final_url,
+            html=html,
+            extracted_content=None,
+            config=config,
+            screenshot_data=None,
+            pdf_data=None,
+            verbose=False,
+        )
+        result.url = url
+        result.redirected_url = final_url
+        result.status_code = response.status_code
+        result.response_headers = dict(response.headers)
+        return result
+
+
+def open_crawler(
+    browser_config: BrowserConfig, render: str
+) -> AsyncWebCrawler | AdaptiveCrawler:
+    """Create the page fetcher for a ``--render`` mode ("browser" or "auto")."""
+    if render == "auto":
+        return AdaptiveCrawler(browser_config)
+    return AsyncWebCrawler(config=browser_config)
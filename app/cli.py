@@ -29,8 +29,12 @@ import asyncio
 import os
 import sys
 import tempfile
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from datetime import datetime
 from pathlib import Path
 from typing import Annotated
+from urllib.parse import urlparse
 
 import typer
 from crawl4ai import LLMConfig
@@ -46,24 +50,66 @@ from .config import get_browser_config
 from .constants import (
     DEFAULT_API_KEY_ENV,
     DEFAULT_BASE_URL,
+    DEFAULT_DISCOVERY_DEPTH,
+    DEFAULT_DISCOVERY_STRATEGY,
+    DEFAULT_HOST_RATE,
+    DEFAULT_LLM_CACHE_MB,
+    DEFAULT_LLM_CONCURRENCY,
     DEFAULT_LLM_MODEL,
     DEFAULT_MAX_TOKENS,
+    DEFAULT_RENDER_MODE,
+    DEFAULT_SEED_CONCURRENCY,
     DEFAULT_TIMEOUT_MS,
+    DEFAULT_URL_ORDER,
+    INVENTORY_FILENAME,
+    LLMS_TXT_FILENAME,
+    MAX_CONCURRENT_REQUESTS,
 )
-from .fast_discovery import extract_links_fast, save_links_to_file
+from .fast_discovery import SharedCrawler, extract_links_fast, save_links_to_file
 from .fast_processing import process_urls_fast
+from .frontier import CrawlFrontier
+from .http_discovery import extract_links_http
+from .index_discovery import extract_links_inventory, extract_links_llms_txt
+from .link_graph import LinkGraph
+from .llm_cache import LlmCache
+from .nav_discovery import extract_nav_toc, save_toc
+from .pipeline import UrlChannel
+from .politeness import HostScheduler
+from .probe import UrlProber
 from .processing import process_urls_batch, read_urls_from_file
+from .sitemap_discovery import extract_links_sitemap, parse_lastmod
+from .url_clusters import ClusterStats, cluster_report, cluster_urls, sample_clusters
+from .utils.dedup import UrlDeduplicator
 from .utils.exceptions import ConfigError, FileIOError
 from .utils.logging import CleanConsole, set_logging_verbosity
-from .utils.url_helpers import clean_url_for_display
+from .utils.scope import ScopeRules
+from .utils.url_helpers import clean_url_for_display, url_to_filename
+from .utils.url_table import UrlTable
 from .utils.validation import (
+    validate_bloom_capacity,
+    validate_cache_size,
+    validate_concurrency,
+    validate_crawl_depth,
+    validate_discovery_strategy,
     validate_file_path,
     validate_filename,
+    validate_frontier_path,
+    validate_graph_path,
+    validate_host_rate,
+    validate_iso_date,
+    validate_llm_rate_limit,
+    validate_max_pages,
     validate_model_name,
     validate_output_directory,
+    validate_pin_version,
+    validate_render_mode,
+    validate_sample_size,
+    validate_scope_rules,
     validate_start_line,
     validate_timeout,
+    validate_toc_path,
     validate_url,
+    validate_url_order,
 )
 
 load_dotenv()
@@ -147,6 +193,19 @@ def print_summary_report(summary: dict):
     summary_table.add_row(
         ":hourglass_done: [cyan]Total Processed[/cyan]", str(total_processed)
     )
+    if unchanged_count := len(summary.get("unchanged_urls", [])):
+        summary_table.add_row(
+            ":recycle: [cyan]Unchanged (reused)[/cyan]", str(unchanged_count)
+        )
+    if duplicate_count := len(summary.get("duplicate_urls", [])):
+        summary_table.add_row(
+            ":link: [cyan]Aliases (skipped)[/cyan]", str(duplicate_count)
+        )
+    if skipped_count := summary.get("skipped_urls", 0):
+        summary_table.add_row(
+            ":fast-forward_button: [yellow]Skipped (scope)[/yellow]",
+            str(skipped_count),
+        )
 
     rich_console.print("\n")
     rich_console.print(summary_table)
@@ -164,6 +223,53 @@ def print_summary_report(summary: dict):
         )
         rich_console.print(failed_panel)
 
+    if clusters := summary.get("clusters"):
+        print_cluster_report(clusters)
+
+
+def print_cluster_report(clusters: list[ClusterStats]) -> None:
+    """Prints per-template results of a --sample run with full-run estimates."""
+    table = Table(
+        title="[bold #b8bb26]Sample Run by URL Template[/bold #b8bb26]",
+        show_header=True,
+        header_style="bold #83a598",
+        border_style="#458588",
+    )
+    table.add_column("Template", style="dim", overflow="fold")
+    table.add_column("URLs", justify="right")
+    table.add_column("Sampled", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("s/page", justify="right")
+    table.add_column("chars/pg", justify="right")
+    table.add_column("Est. time", justify="right")
+    table.add_column("Est. chars", justify="right")
+
+    # Templates of a single-host run read better without the host
+    hosts = {stats.template.split("/", 1)[0] for stats in clusters}
+    for stats in clusters:
+        table.add_row(
+            "/" + stats.template.split("/", 1)[1]
+            if len(hosts) == 1
+            else stats.template,
+            str(stats.total),
+            str(stats.sampled),
+            f"{stats.failure_rate:.0%}",
+            f"{stats.seconds_per_page:.1f}",
+            f"{stats.chars_per_page:,.0f}",
+            f"{stats.estimated_seconds / 60:.1f} min",
+            f"{stats.estimated_chars / 1000:,.0f}k",
+        )
+
+    total_urls = sum(stats.total for stats in clusters)
+    total_minutes = sum(stats.estimated_seconds for stats in clusters) / 60
+    total_chars = sum(stats.estimated_chars for stats in clusters)
+    rich_console.print(table)
+    rich_console.print(
+        f"Full run estimate for {total_urls} URLs: {total_minutes:.1f} page-minutes "
+        f"of fetching and conversion (before concurrency), "
+        f"{total_chars:,.0f} chars of Markdown"
+    )
+
 
 # --- Typer Commands ---
 
@@ -197,16 +303,145 @@ def global_options(
 @app.command()
 def discover(
     start_url: Annotated[
-        str, typer.Argument(help="The starting URL to crawl for documentation links.")
-    ],
+        str | None,
+        typer.Argument(
+            help="The starting URL to crawl for documentation links (omit when using --seeds)."
+        ),
+    ] = None,
     output_file: Annotated[
         str,
         typer.Option(
             "-o",
             "--output-file",
-            help="Output file to save discovered URLs. Extension determines format (.txt or .csv).",
+            help="Output file to save discovered URLs. Extension determines format (.txt, .csv, .json or .ndjson/.jsonl).",
         ),
     ] = "urls.txt",
+    depth: Annotated[
+        int,
+        typer.Option(
+            "--depth",
+            help="Link levels to crawl. 1 scans only the start page; higher values crawl discovered pages breadth-first.",
+        ),
+    ] = DEFAULT_DISCOVERY_DEPTH,
+    max_pages: Annotated[
+        int | None,
+        typer.Option(
+            "--max-pages",
+            help="Stop discovery once this many unique URLs have been found.",
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Maximum number of pages fetched at once during a multi-level crawl.",
+        ),
+    ] = MAX_CONCURRENT_REQUESTS,
+    strategy: Annotated[
+        str,
+        typer.Option(
+            "--strategy",
+            help="Discovery strategy: 'auto' reads a Sphinx objects.inv, sitemaps or llms.txt and falls back to crawling, 'sitemap' reads sitemaps only, 'index' reads objects.inv or llms.txt (crawling if there is neither), 'nav' reads the sidebar table of contents in reading order (crawling only if there is none), 'http' crawls without a browser (escalating for JS-rendered sites), 'crawl' always uses the browser.",
+        ),
+    ] = DEFAULT_DISCOVERY_STRATEGY,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="Only keep sitemap entries modified on or after this date (YYYY-MM-DD).",
+        ),
+    ] = None,
+    frontier: Annotated[
+        str | None,
+        typer.Option(
+            "--frontier",
+            help="SQLite file that stores crawl progress. Re-running with the same file resumes an interrupted discovery.",
+        ),
+    ] = None,
+    bloom_capacity: Annotated[
+        int | None,
+        typer.Option(
+            "--bloom-capacity",
+            help="De-duplicate URLs with a fixed-memory Bloom filter sized for this many URLs instead of an exact set. Meant for million-URL crawls; about 1 in 1000 new URLs may be dropped as a false duplicate.",
+        ),
+    ] = None,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--include",
+            help="Only keep URLs whose path matches this rule: a path prefix ('/en/5.2/'), a glob ('*/topics/*') or 're:REGEX'. Repeatable.",
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude",
+            help="Drop URLs whose path matches this rule (same syntax as --include). Repeatable.",
+        ),
+    ] = None,
+    auto_scope: Annotated[
+        bool,
+        typer.Option(
+            "--auto-scope/--no-auto-scope",
+            help="Only follow links under the start URL's directory, like sitemap discovery does.",
+        ),
+    ] = False,
+    collapse_versions: Annotated[
+        bool,
+        typer.Option(
+            "--collapse-versions/--keep-versions",
+            help="Keep one URL per page when the site publishes it under several version or language prefixes ('/en/5.2/', '/en/dev/', '/fr/5.2/'). The first one found is kept; a prefix is only collapsed once it has been seen on several pages.",
+        ),
+    ] = True,
+    pin_version: Annotated[
+        str | None,
+        typer.Option(
+            "--pin-version",
+            help="Only keep versioned pages of this version, e.g. '5.2', 'stable' or 'en/5.2'. Unversioned pages are kept.",
+        ),
+    ] = None,
+    order: Annotated[
+        str,
+        typer.Option(
+            "--order",
+            help="Order of the saved URLs: 'discovery' (as found), 'indegree' or 'pagerank' (most-linked pages first, so a capped or interrupted scrape gets the important pages). Ranking needs a crawl, not a sitemap.",
+        ),
+    ] = DEFAULT_URL_ORDER,
+    graph: Annotated[
+        str | None,
+        typer.Option(
+            "--graph",
+            help="Export the internal link graph found while crawling: a .csv edge list (source,target) or .npz adjacency arrays.",
+        ),
+    ] = None,
+    toc: Annotated[
+        str | None,
+        typer.Option(
+            "--toc",
+            help="With --strategy nav, export the navigation tree: a nested Markdown list (.md) or JSON entries with url, title and level (.json).",
+        ),
+    ] = None,
+    seeds: Annotated[
+        str | None,
+        typer.Option(
+            "--seeds",
+            help="File of start URLs (one per line, or .csv). Seeds are discovered concurrently in one shared browser and merged into a single de-duplicated list.",
+        ),
+    ] = None,
+    per_seed: Annotated[
+        bool,
+        typer.Option(
+            "--per-seed",
+            help="With --seeds, write one output file per seed next to --output-file instead of a merged list.",
+        ),
+    ] = False,
+    seed_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--seed-concurrency",
+            help="With --seeds, maximum number of seeds discovered at once. Seeds on the same host always run one after another.",
+        ),
+    ] = DEFAULT_SEED_CONCURRENCY,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -236,6 +471,27 @@ def discover(
       [#8ec07c]➤ Discover and save to a custom file:[/]
         [dim]$ scribe discover https://fastapi.tiangolo.com/ -o custom-urls.txt[/dim]
 
+      [#8ec07c]➤ Only list pages changed since a date (sitemap lastmod):[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --strategy sitemap --since 2025-01-01[/dim]
+
+      [#8ec07c]➤ Crawl three link levels deep with 8 concurrent tabs:[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --depth 3 --concurrency 8 --max-pages 2000[/dim]
+
+      [#8ec07c]➤ Skip release notes and internals, staying under the start path:[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --depth 3 --auto-scope --exclude /en/5.2/releases/ --exclude '*/internals/*'[/dim]
+
+      [#8ec07c]➤ List the most-linked pages first and export the link graph:[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --strategy http --depth 3 --order pagerank --graph links.csv[/dim]
+
+      [#8ec07c]➤ List pages in the sidebar's reading order and save the tree:[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --strategy nav --toc toc.md[/dim]
+
+      [#8ec07c]➤ Make a large crawl resumable after a crash or Ctrl-C:[/]
+        [dim]$ scribe discover https://docs.djangoproject.com/en/5.2/ --depth 5 --frontier django.db[/dim]
+
+      [#8ec07c]➤ Discover several sites at once into one merged list:[/]
+        [dim]$ scribe discover --seeds seeds.txt --depth 2 -o all-urls.txt[/dim]
+
       [#8ec07c]➤ Run with verbose output for debugging:[/]
         [dim]$ scribe discover https://fastapi.tiangolo.com/ -v[/dim]
 
@@ -243,14 +499,59 @@ def discover(
     """
 
     # Validate inputs before processing
-    validate_and_exit_on_error(validate_url, start_url, "start_url")
+    seed_urls = None
+    if seeds is not None:
+        if start_url is not None:
+            console.print_error("Pass either a start URL or --seeds, not both")
+            raise typer.Exit(1)
+        if frontier or graph or toc:
+            console.print_error("--frontier, --graph and --toc need a single start URL")
+            raise typer.Exit(1)
+        validate_and_exit_on_error(validate_file_path, seeds, "seeds")
+        validate_and_exit_on_error(
+            validate_concurrency, seed_concurrency, "seed_concurrency"
+        )
+    elif start_url is None:
+        console.print_error("Missing start URL (or pass --seeds FILE)")
+        raise typer.Exit(1)
+    else:
+        validate_and_exit_on_error(validate_url, start_url, "start_url")
     validate_and_exit_on_error(validate_filename, output_file, "output_file")
+    validate_and_exit_on_error(validate_crawl_depth, depth, "depth")
+    validate_and_exit_on_error(validate_max_pages, max_pages, "max_pages")
+    validate_and_exit_on_error(validate_concurrency, concurrency, "concurrency")
+    validate_and_exit_on_error(validate_discovery_strategy, strategy, "strategy")
+    validate_and_exit_on_error(validate_iso_date, since, "since")
+    validate_and_exit_on_error(validate_frontier_path, frontier, "frontier")
+    validate_and_exit_on_error(
+        validate_bloom_capacity, bloom_capacity, "bloom_capacity"
+    )
+    validate_and_exit_on_error(validate_scope_rules, include, "include")
+    validate_and_exit_on_error(validate_scope_rules, exclude, "exclude")
+    validate_and_exit_on_error(validate_pin_version, pin_version, "pin_version")
+    validate_and_exit_on_error(validate_url_order, order, "order")
+    validate_and_exit_on_error(validate_graph_path, graph, "graph")
+    validate_and_exit_on_error(validate_toc_path, toc, "toc")
+    if toc and strategy != "nav":
+        console.print_error("--toc needs --strategy nav")
+        raise typer.Exit(1)
+    if seeds is not None:
+        try:
+            seed_urls = list(read_urls_from_file(seeds))
+        except FileIOError as e:
+            console.print_error(str(e))
+            raise typer.Exit(1) from e
+        if not seed_urls:
+            console.print_error(f"No valid seed URLs in {seeds}")
+            raise typer.Exit(1)
 
     # Determine format from file extension
     if output_file.lower().endswith(".csv"):
         fmt = "csv"
     elif output_file.lower().endswith(".json"):
         fmt = "json"
+    elif output_file.lower().endswith((".ndjson", ".jsonl")):
+        fmt = "ndjson"
     else:
         fmt = "txt"
 
@@ -259,6 +560,24 @@ def discover(
         output_file=output_file,
         verbose=verbose,
         csv_format=(fmt == "csv"),  # Keeps backward compatibility
+        depth=depth,
+        max_pages=max_pages,
+        concurrency=concurrency,
+        strategy=strategy,
+        since=since,
+        frontier=frontier,
+        bloom_capacity=bloom_capacity,
+        include=include,
+        exclude=exclude,
+        auto_scope=auto_scope,
+        collapse_versions=collapse_versions,
+        pin_version=pin_version,
+        order=order,
+        graph=graph,
+        toc=toc,
+        seeds=seed_urls,
+        per_seed=per_seed,
+        seed_concurrency=seed_concurrency,
     )
     result = asyncio.run(discover_command(args))
     raise typer.Exit(result)
@@ -284,10 +603,19 @@ def scrape(
     start_at: Annotated[
         int,
         typer.Option(
-            help="Start processing from URL index (0-based)",
+            help="Start processing from URL index (0-based). Duplicate spellings of a URL in the input file are dropped first, so the index counts unique URLs.",
             rich_help_panel="Processing Options",
         ),
     ] = 0,
+    sample: Annotated[
+        int | None,
+        typer.Option(
+            "--sample",
+            metavar="N",
+            help="Preview run: group the URLs into page families by URL shape, process N URLs from each family and report time, output size and failure rate per family with estimates for the full list.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = None,
     fast: Annotated[
         bool,
         typer.Option(
@@ -296,6 +624,30 @@ def scrape(
             rich_help_panel="Processing Options",
         ),
     ] = False,
+    revalidate: Annotated[
+        bool,
+        typer.Option(
+            "--revalidate/--no-revalidate",
+            help="Re-check pages scraped into this output directory before with ETag/Last-Modified, and keep the existing Markdown for pages the server reports unchanged. A changed page costs an extra request when rendered in the browser; with --render auto the check's response is converted directly.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = True,
+    probe: Annotated[
+        bool,
+        typer.Option(
+            "--probe/--no-probe",
+            help="Send a HEAD request to every URL first and skip non-HTML and dead (4xx) pages before they reach the browser.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = False,
+    render: Annotated[
+        str,
+        typer.Option(
+            "--render",
+            help="'browser' renders every page in Chromium; 'auto' fetches pages over plain HTTP and only renders the ones that need JavaScript, remembering that per URL template. Much faster on static documentation sites.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = DEFAULT_RENDER_MODE,
     prompt: Annotated[
         str,
         typer.Option(
@@ -336,6 +688,38 @@ def scrape(
             rich_help_panel="LLM Configuration",
         ),
     ] = DEFAULT_MAX_TOKENS,
+    llm_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--llm-concurrency",
+            help="Pages filtered by the LLM at once. Raise it as far as your provider's rate limits allow.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = DEFAULT_LLM_CONCURRENCY,
+    llm_rpm: Annotated[
+        int | None,
+        typer.Option(
+            "--llm-rpm",
+            help="Requests per minute allowed by your LLM provider. Calls are paced to stay under it instead of hitting 429s.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = None,
+    llm_tpm: Annotated[
+        int | None,
+        typer.Option(
+            "--llm-tpm",
+            help="Tokens per minute allowed by your LLM provider, estimated from each page's HTML size.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = None,
+    llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--llm-cache/--no-llm-cache",
+            help="Reuse LLM results for HTML already filtered with the same model and prompt. See 'scribe cache'.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = True,
     timeout: Annotated[
         int,
         typer.Option(
@@ -365,6 +749,30 @@ def scrape(
             rich_help_panel="Browser Control",
         ),
     ] = None,
+    host_rate: Annotated[
+        float,
+        typer.Option(
+            "--host-rate",
+            help="Requests per second sent to any one host. Hosts are fetched in parallel, and a robots.txt Crawl-delay lowers this further.",
+            rich_help_panel="Browser Control",
+        ),
+    ] = DEFAULT_HOST_RATE,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--include",
+            help="Only keep URLs whose path matches this rule: a path prefix ('/en/5.2/'), a glob ('*/topics/*') or 're:REGEX'. Repeatable.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude",
+            help="Drop URLs whose path matches this rule (same syntax as --include). Repeatable.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = None,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -412,6 +820,15 @@ def scrape(
     validate_and_exit_on_error(validate_output_directory, output_dir, "output_dir")
     validate_and_exit_on_error(validate_start_line, start_at + 1, "start_at")
     validate_and_exit_on_error(validate_timeout, timeout, "timeout")
+    validate_and_exit_on_error(validate_scope_rules, include, "include")
+    validate_and_exit_on_error(validate_scope_rules, exclude, "exclude")
+    validate_and_exit_on_error(validate_host_rate, host_rate, "host_rate")
+    validate_and_exit_on_error(validate_sample_size, sample, "sample")
+    validate_and_exit_on_error(validate_render_mode, render, "render")
+
+    validate_and_exit_on_error(validate_concurrency, llm_concurrency, "llm_concurrency")
+    validate_and_exit_on_error(validate_llm_rate_limit, llm_rpm, "llm_rpm")
+    validate_and_exit_on_error(validate_llm_rate_limit, llm_tpm, "llm_tpm")
 
     # Validate model only if not using fast mode
     if not fast:
@@ -429,6 +846,7 @@ def scrape(
             input_file=input_file_path,
             output_dir=output_dir,
             start_at=start_at,
+            sample=sample,
             prompt=prompt,
             timeout=timeout,
             wait=wait,
@@ -436,9 +854,19 @@ def scrape(
             api_key_env=api_key_env,
             base_url=base_url,
             max_tokens=max_tokens,
+            llm_concurrency=llm_concurrency,
+            llm_rpm=llm_rpm,
+            llm_tpm=llm_tpm,
+            llm_cache=llm_cache,
             session=session,
             session_id=session_id,
+            host_rate=host_rate,
             fast=fast,
+            revalidate=revalidate,
+            probe=probe,
+            render=render,
+            include=include,
+            exclude=exclude,
             verbose=verbose,
             debug=debug,
         )
@@ -491,6 +919,15 @@ def process(
             rich_help_panel="Processing Options",
         ),
     ] = 0,
+    sample: Annotated[
+        int | None,
+        typer.Option(
+            "--sample",
+            metavar="N",
+            help="Preview run: group the URLs into page families by URL shape, process N URLs from each family and report time, output size and failure rate per family with estimates for the full list.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = None,
     fast: Annotated[
         bool,
         typer.Option(
@@ -499,6 +936,38 @@ def process(
             rich_help_panel="Processing Options",
         ),
     ] = False,
+    revalidate: Annotated[
+        bool,
+        typer.Option(
+            "--revalidate/--no-revalidate",
+            help="Re-check pages scraped into this output directory before with ETag/Last-Modified, and keep the existing Markdown for pages the server reports unchanged. A changed page costs an extra request when rendered in the browser; with --render auto the check's response is converted directly.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = True,
+    probe: Annotated[
+        bool,
+        typer.Option(
+            "--probe/--no-probe",
+            help="Send a HEAD request to every URL first and skip non-HTML and dead (4xx) pages before they reach the browser.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = False,
+    render: Annotated[
+        str,
+        typer.Option(
+            "--render",
+            help="'browser' renders every page in Chromium; 'auto' fetches pages over plain HTTP and only renders the ones that need JavaScript, remembering that per URL template. Much faster on static documentation sites.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = DEFAULT_RENDER_MODE,
+    pipeline: Annotated[
+        bool,
+        typer.Option(
+            "--pipeline/--no-pipeline",
+            help="Scrape URLs while discovery is still running instead of waiting for the full list.",
+            rich_help_panel="Processing Options",
+        ),
+    ] = True,
     prompt: Annotated[
         str,
         typer.Option(
@@ -539,6 +1008,118 @@ def process(
             rich_help_panel="LLM Configuration",
         ),
     ] = DEFAULT_MAX_TOKENS,
+    llm_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--llm-concurrency",
+            help="Pages filtered by the LLM at once. Raise it as far as your provider's rate limits allow.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = DEFAULT_LLM_CONCURRENCY,
+    llm_rpm: Annotated[
+        int | None,
+        typer.Option(
+            "--llm-rpm",
+            help="Requests per minute allowed by your LLM provider. Calls are paced to stay under it instead of hitting 429s.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = None,
+    llm_tpm: Annotated[
+        int | None,
+        typer.Option(
+            "--llm-tpm",
+            help="Tokens per minute allowed by your LLM provider, estimated from each page's HTML size.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = None,
+    llm_cache: Annotated[
+        bool,
+        typer.Option(
+            "--llm-cache/--no-llm-cache",
+            help="Reuse LLM results for HTML already filtered with the same model and prompt. See 'scribe cache'.",
+            rich_help_panel="LLM Configuration",
+        ),
+    ] = True,
+    depth: Annotated[
+        int,
+        typer.Option(
+            "--depth",
+            help="Link levels to crawl during discovery (1 = start page only).",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = DEFAULT_DISCOVERY_DEPTH,
+    max_pages: Annotated[
+        int | None,
+        typer.Option(
+            "--max-pages",
+            help="Stop discovery once this many unique URLs have been found.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Maximum number of pages fetched at once during discovery.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = MAX_CONCURRENT_REQUESTS,
+    strategy: Annotated[
+        str,
+        typer.Option(
+            "--strategy",
+            help="Discovery strategy: 'auto' (objects.inv, sitemap or llms.txt, then crawl), 'sitemap', 'index' (objects.inv or llms.txt), 'nav' (sidebar TOC in reading order), 'http' or 'crawl'.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = DEFAULT_DISCOVERY_STRATEGY,
+    include: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--include",
+            help="Only keep URLs whose path matches this rule: a path prefix ('/en/5.2/'), a glob ('*/topics/*') or 're:REGEX'. Repeatable.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude",
+            help="Drop URLs whose path matches this rule (same syntax as --include). Repeatable.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = None,
+    auto_scope: Annotated[
+        bool,
+        typer.Option(
+            "--auto-scope/--no-auto-scope",
+            help="Only follow links under the start URL's directory, like sitemap discovery does.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = False,
+    collapse_versions: Annotated[
+        bool,
+        typer.Option(
+            "--collapse-versions/--keep-versions",
+            help="Keep one URL per page when the site publishes it under several version or language prefixes ('/en/5.2/', '/en/dev/', '/fr/5.2/'). The first one found is kept; a prefix is only collapsed once it has been seen on several pages.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = True,
+    pin_version: Annotated[
+        str | None,
+        typer.Option(
+            "--pin-version",
+            help="Only keep versioned pages of this version, e.g. '5.2', 'stable' or 'en/5.2'. Unversioned pages are kept.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = None,
+    order: Annotated[
+        str,
+        typer.Option(
+            "--order",
+            help="Scrape order: 'discovery' (as found), 'indegree' or 'pagerank' (most-linked pages first). Ranking waits for discovery to finish.",
+            rich_help_panel="Discovery Options",
+        ),
+    ] = DEFAULT_URL_ORDER,
     timeout: Annotated[
         int,
         typer.Option(
@@ -568,6 +1149,14 @@ def process(
             rich_help_panel="Browser Control",
         ),
     ] = None,
+    host_rate: Annotated[
+        float,
+        typer.Option(
+            "--host-rate",
+            help="Requests per second sent to any one host. Hosts are fetched in parallel, and a robots.txt Crawl-delay lowers this further.",
+            rich_help_panel="Browser Control",
+        ),
+    ] = DEFAULT_HOST_RATE,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -601,10 +1190,27 @@ def process(
     """
     # This logic matches your original file exactly.
     debug = ctx.obj.get("debug", False)
+
+    validate_and_exit_on_error(validate_crawl_depth, depth, "depth")
+    validate_and_exit_on_error(validate_max_pages, max_pages, "max_pages")
+    validate_and_exit_on_error(validate_concurrency, concurrency, "concurrency")
+    validate_and_exit_on_error(validate_discovery_strategy, strategy, "strategy")
+    validate_and_exit_on_error(validate_scope_rules, include, "include")
+    validate_and_exit_on_error(validate_scope_rules, exclude, "exclude")
+    validate_and_exit_on_error(validate_pin_version, pin_version, "pin_version")
+    validate_and_exit_on_error(validate_host_rate, host_rate, "host_rate")
+    validate_and_exit_on_error(validate_sample_size, sample, "sample")
+    validate_and_exit_on_error(validate_render_mode, render, "render")
+    validate_and_exit_on_error(validate_url_order, order, "order")
+    validate_and_exit_on_error(validate_concurrency, llm_concurrency, "llm_concurrency")
+    validate_and_exit_on_error(validate_llm_rate_limit, llm_rpm, "llm_rpm")
+    validate_and_exit_on_error(validate_llm_rate_limit, llm_tpm, "llm_tpm")
+
     args = argparse.Namespace(
         start_url=start_url,
         output_dir=output_dir,
         start_at=start_at,
+        sample=sample,
         prompt=prompt,
         timeout=timeout,
         wait=wait,
@@ -612,9 +1218,28 @@ def process(
         api_key_env=api_key_env,
         base_url=base_url,
         max_tokens=max_tokens,
+        llm_concurrency=llm_concurrency,
+        llm_rpm=llm_rpm,
+        llm_tpm=llm_tpm,
+        llm_cache=llm_cache,
+        depth=depth,
+        max_pages=max_pages,
+        concurrency=concurrency,
+        strategy=strategy,
+        include=include,
+        exclude=exclude,
+        auto_scope=auto_scope,
+        collapse_versions=collapse_versions,
+        pin_version=pin_version,
+        order=order,
         session=session,
         session_id=session_id,
+        host_rate=host_rate,
         fast=fast,
+        revalidate=revalidate,
+        probe=probe,
+        render=render,
+        pipeline=pipeline,
         verbose=verbose,
         debug=debug,
     )
@@ -628,17 +1253,253 @@ def process(
     raise typer.Exit(code=0)
 
 
+cache_app = typer.Typer(
+    name="cache",
+    no_args_is_help=True,
+    rich_markup_mode="rich",
+    help="""
+:floppy_disk: [bold #fabd2f]LLM Cache[/bold #fabd2f]
+
+[#458588]Inspect or trim the cache of LLM results shared by all scrape and process runs.[/]
+    """,
+)
+app.add_typer(cache_app)
+
+
+@cache_app.command("stats")
+def cache_stats():
+    """
+    Show the size and hit rate of the LLM result cache.
+    """
+    try:
+        with LlmCache() as cache:
+            stats = cache.stats()
+            path = cache.path
+    except FileIOError as e:
+        console.print_error(f"Could not open LLM cache: {e}")
+        raise typer.Exit(1) from e
+
+    lookups = stats["hits"] + stats["misses"]
+    table = Table(
+        title="[bold #b8bb26]LLM Cache[/bold #b8bb26]",
+        show_header=False,
+        border_style="#458588",
+    )
+    table.add_column("Field", style="dim")
+    table.add_column("Value", justify="right")
+    table.add_row("Location", path)
+    table.add_row("Entries", f"{stats['entries']:,}")
+    table.add_row(
+        "Size",
+        f"{stats['bytes'] / 1024 / 1024:,.1f} MB of {stats['max_bytes'] / 1024 / 1024:,.0f} MB",
+    )
+    table.add_row("Hits", f"{stats['hits']:,}")
+    table.add_row("Misses", f"{stats['misses']:,}")
+    table.add_row("Hit rate", f"{stats['hits'] / lookups:.0%}" if lookups else "-")
+    if stats["oldest_used"]:
+        table.add_row(
+            "Least recently used",
+            datetime.fromtimestamp(stats["oldest_used"]).strftime("%Y-%m-%d %H:%M"),
+        )
+    rich_console.print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_mb: Annotated[
+        int,
+        typer.Option(
+            "--max-mb",
+            help="Trim the cache to this many megabytes, dropping the least recently used results first.",
+        ),
+    ] = DEFAULT_LLM_CACHE_MB,
+    all_entries: Annotated[
+        bool,
+        typer.Option("--all", help="Remove every cached result."),
+    ] = False,
+):
+    """
+    Remove least recently used LLM results until the cache fits the size limit.
+    """
+    validate_and_exit_on_error(validate_cache_size, max_mb, "max_mb")
+    try:
+        with LlmCache() as cache:
+            removed, freed = cache.prune(0 if all_entries else max_mb * 1024 * 1024)
+            remaining = cache.stats()
+    except FileIOError as e:
+        console.print_error(f"Could not open LLM cache: {e}")
+        raise typer.Exit(1) from e
+    console.print_success(
+        f"Removed {removed:,} cached results ({freed / 1024 / 1024:,.1f} MB); "
+        f"{remaining['entries']:,} left ({remaining['bytes'] / 1024 / 1024:,.1f} MB)"
+    )
+
+
 # --- Core Logic Functions ---
 
 
+async def _run_discovery(
+    args: argparse.Namespace,
+    console: CleanConsole,
+    on_discovered: Callable[[list[str]], Awaitable[None]] | None = None,
+    browser: SharedCrawler | None = None,
+) -> list[str]:
+    """Discover URLs with the configured strategy and report what was skipped.
+
+    ``on_discovered`` receives crawled URLs while the crawl is still running;
+    sitemap results only become available once discovery returns. ``browser``
+    lets several discoveries share one Chromium instance.
+    """
+    strategy = getattr(args, "strategy", DEFAULT_DISCOVERY_STRATEGY)
+    max_pages = getattr(args, "max_pages", None)
+    concurrency = getattr(args, "concurrency", MAX_CONCURRENT_REQUESTS)
+    frontier_path = getattr(args, "frontier", None)
+    dedup = UrlDeduplicator(capacity=getattr(args, "bloom_capacity", None))
+    scope = ScopeRules(
+        getattr(args, "include", None),
+        getattr(args, "exclude", None),
+        args.start_url if getattr(args, "auto_scope", False) else None,
+        skip_files=True,
+        collapse_versions=getattr(args, "collapse_versions", True),
+        pin_version=getattr(args, "pin_version", None),
+    )
+    order = getattr(args, "order", DEFAULT_URL_ORDER)
+    graph_path = getattr(args, "graph", None)
+    graph = LinkGraph() if graph_path or order != DEFAULT_URL_ORDER else None
+
+    found_urls: list[str] = []
+    if strategy in ("auto", "index"):
+        # Sphinx inventories list every document, so they go before sitemaps
+        found_urls = await extract_links_inventory(
+            args.start_url, args.verbose, dedup=dedup, scope=scope
+        )
+        index_name = INVENTORY_FILENAME
+        if not found_urls and strategy == "index":
+            found_urls = await extract_links_llms_txt(
+                args.start_url, args.verbose, dedup=dedup, scope=scope
+            )
+            index_name = LLMS_TXT_FILENAME
+        if found_urls:
+            console.print_info(f"Found {len(found_urls)} URLs in {index_name}")
+            if max_pages:
+                found_urls = found_urls[:max_pages]
+        elif strategy == "index":
+            console.print_info(
+                f"No {INVENTORY_FILENAME} or {LLMS_TXT_FILENAME} found, "
+                "falling back to link crawling"
+            )
+
+    if not found_urls and strategy in ("auto", "sitemap"):
+        found_urls = await extract_links_sitemap(
+            args.start_url,
+            args.verbose,
+            since=parse_lastmod(getattr(args, "since", None)),
+            concurrency=concurrency,
+            dedup=dedup,
+            scope=scope,
+        )
+        if found_urls:
+            console.print_info(f"Found {len(found_urls)} URLs in sitemap")
+            if max_pages:
+                found_urls = found_urls[:max_pages]
+        elif strategy == "auto":
+            # llms.txt is often a curated subset, so a sitemap comes first
+            found_urls = await extract_links_llms_txt(
+                args.start_url, args.verbose, dedup=dedup, scope=scope
+            )
+            if found_urls:
+                console.print_info(
+                    f"Found {len(found_urls)} URLs in {LLMS_TXT_FILENAME}"
+                )
+                if max_pages:
+                    found_urls = found_urls[:max_pages]
+            else:
+                console.print_info(
+                    "No sitemap or page index found, falling back to link crawling"
+                )
+
+    if strategy == "nav":
+        toc = await extract_nav_toc(
+            args.start_url,
+            args.verbose,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            dedup=dedup,
+            scope=scope,
+        )
+        found_urls = [entry.url for entry in toc]
+        if toc:
+            console.print_info(f"Found {len(toc)} pages in the navigation TOC")
+            if toc_path := getattr(args, "toc", None):
+                save_toc(toc, toc_path)
+                console.print_info(f"Navigation tree saved to {toc_path}")
+        else:
+            console.print_info("No navigation TOC found, falling back to link crawling")
+            if getattr(args, "toc", None):
+                console.print_warning(f"No navigation tree to save to {args.toc}")
+
+    if not found_urls and strategy != "sitemap":
+        # "auto"/"http" try plain HTTP first and escalate to the browser
+        # themselves when the site is JavaScript-rendered
+        extract_links = (
+            extract_links_fast if strategy == "crawl" else extract_links_http
+        )
+        found_urls = await extract_links(
+            args.start_url,
+            args.verbose,
+            depth=getattr(args, "depth", DEFAULT_DISCOVERY_DEPTH),
+            max_pages=max_pages,
+            concurrency=concurrency,
+            frontier_path=frontier_path,
+            dedup=dedup,
+            scope=scope,
+            graph=graph,
+            on_discovered=on_discovered,
+            browser=browser,
+        )
+        if frontier_path:
+            with CrawlFrontier(frontier_path, args.start_url) as frontier:
+                counts = frontier.stats()
+            console.print_info(
+                f"Frontier {frontier_path}: {counts['crawled']} crawled, "
+                f"{counts['pending']} pending, {counts['failed']} failed"
+            )
+    if scope.total_skipped:
+        reasons = ", ".join(f"{n} {why}" for why, n in scope.skipped.items())
+        console.print_info(f"Skipped {scope.total_skipped} URLs ({reasons})")
+    if dedup.duplicates:
+        console.print_info(
+            f"Skipped {dedup.duplicates} duplicate URLs after canonicalization"
+        )
+    if graph is not None and len(graph):
+        if graph_path:
+            graph.save(graph_path)
+            console.print_info(
+                f"Link graph: {len(graph)} pages, {graph.edge_count} links "
+                f"saved to {graph_path}"
+            )
+        if order != DEFAULT_URL_ORDER:
+            found_urls = graph.rank_urls(found_urls, order)
+            console.print_info(f"Ordered {len(found_urls)} URLs by {order}")
+    elif graph is not None and found_urls:
+        console.print_warning(
+            "No link graph was collected (sitemap discovery or a single-page "
+            "scan); keeping discovery order"
+        )
+    return found_urls
+
+
 async def discover_command(args: argparse.Namespace) -> int:
     """Execute the URL discovery command."""
     # This function is identical to your original.
     console = CleanConsole()
     set_logging_verbosity(verbose=args.verbose)
+    seeds = getattr(args, "seeds", None)
     console.print_phase(
         "DISCOVERY",
-        f"Finding internal links from {clean_url_for_display(args.start_url)}",
+        f"Finding internal links from {len(seeds)} seed URLs"
+        if seeds
+        else f"Finding internal links from {clean_url_for_display(args.start_url)}",
     )
 
     # Determine format and display appropriate info
@@ -646,19 +1507,25 @@ async def discover_command(args: argparse.Namespace) -> int:
         fmt = "csv"
     elif args.output_file.lower().endswith(".json"):
         fmt = "json"
+    elif args.output_file.lower().endswith((".ndjson", ".jsonl")):
+        fmt = "ndjson"
     else:
         fmt = "txt"
     format_desc = (
         "JSON format"
         if fmt == "json"
+        else "NDJSON format"
+        if fmt == "ndjson"
         else "CSV format"
         if fmt == "csv"
         else "text format"
     )
     console.print_info(f"Output file: {args.output_file} ({format_desc})")
 
+    if seeds:
+        return await _discover_seeds_command(args, console, fmt)
     try:
-        found_urls: list[str] = await extract_links_fast(args.start_url, args.verbose)
+        found_urls = await _run_discovery(args, console)
         if found_urls:
             save_links_to_file(found_urls, args.output_file, args.verbose, fmt=fmt)
             console.print_success(f"Discovery finished. Found {len(found_urls)} URLs.")
@@ -671,6 +1538,98 @@ async def discover_command(args: argparse.Namespace) -> int:
         return 1
 
 
+async def _discover_seeds(
+    args: argparse.Namespace, console: CleanConsole, browser: SharedCrawler
+) -> list[list[str]]:
+    """Discover every URL in ``args.seeds``, returning one URL list per seed.
+
+    Seeds on the same host run one after another while different hosts run
+    concurrently, at most ``seed_concurrency`` seeds at a time. Hosts queue
+    for a free slot in turn, so one large site cannot starve the others. A
+    failed seed is reported and yields an empty list.
+    """
+    seeds: list[str] = args.seeds
+    results: list[list[str]] = [[] for _ in seeds]
+    hosts: dict[str, list[int]] = {}
+    for index, seed in enumerate(seeds):
+        hosts.setdefault(urlparse(seed).netloc.lower(), []).append(index)
+    slots = asyncio.Semaphore(
+        getattr(args, "seed_concurrency", DEFAULT_SEED_CONCURRENCY)
+    )
+
+    async def discover_host(indexes: list[int]) -> None:
+        for index in indexes:
+            seed_args = argparse.Namespace(**{**vars(args), "start_url": seeds[index]})
+            async with slots:
+                try:
+                    results[index] = await _run_discovery(
+                        seed_args, console, browser=browser
+                    )
+                except Exception as e:
+                    console.print_warning(
+                        f"Discovery of {clean_url_for_display(seeds[index])} failed: {e}"
+                    )
+                    continue
+            console.print_info(
+                f"{clean_url_for_display(seeds[index])}: {len(results[index])} URLs"
+            )
+
+    await asyncio.gather(*(discover_host(indexes) for indexes in hosts.values()))
+    return results
+
+
+async def _discover_seeds_command(
+    args: argparse.Namespace, console: CleanConsole, fmt: str
+) -> int:
+    """Discover a batch of seeds and save a merged or per-seed URL list."""
+    try:
+        async with SharedCrawler() as browser:
+            results = await _discover_seeds(args, console, browser)
+        console.print_info(
+            f"Discovered {len(args.seeds)} seeds with "
+            f"{browser.launches} browser launch(es)"
+        )
+
+        if getattr(args, "per_seed", False):
+            output = Path(args.output_file)
+            saved = 0
+            for index, (seed, urls) in enumerate(
+                zip(args.seeds, results, strict=True), start=1
+            ):
+                if not urls:
+                    continue
+                seed_file = output.with_name(
+                    f"{output.stem}-{url_to_filename(seed, index, extension=output.suffix)}"
+                )
+                save_links_to_file(urls, str(seed_file), args.verbose, fmt=fmt)
+                saved += 1
+            if not saved:
+                console.print_warning("No valid URLs extracted.")
+                return 1
+            console.print_success(
+                f"Discovery finished. Saved {saved} of {len(args.seeds)} seed files "
+                f"next to {args.output_file}."
+            )
+            return 0
+
+        # Seeds keep their given order and each seed its own URL order
+        dedup = UrlDeduplicator(capacity=getattr(args, "bloom_capacity", None))
+        merged = [url for urls in results for url in urls if dedup.add(url)]
+        if not merged:
+            console.print_warning("No valid URLs extracted.")
+            return 1
+        if dedup.duplicates:
+            console.print_info(
+                f"Merged {dedup.duplicates} URLs found under more than one seed"
+            )
+        save_links_to_file(merged, args.output_file, args.verbose, fmt=fmt)
+        console.print_success(f"Discovery finished. Found {len(merged)} URLs.")
+        return 0
+    except Exception as e:
+        console.print_error(f"Discovery failed: {e}")
+        return 1
+
+
 async def scrape_command(args: argparse.Namespace) -> dict:
     """Execute the URL scraping and conversion command."""
     # This function is identical to your original.
@@ -704,11 +1663,92 @@ async def scrape_command(args: argparse.Namespace) -> dict:
             "failed_urls": [("config", "start_at out of bounds")],
         }
 
-    urls_to_process = urls_to_scrape[args.start_at :]
+    scope = ScopeRules(
+        getattr(args, "include", None),
+        getattr(args, "exclude", None),
+        skip_files=True,
+    )
+    # Only URLs that pass the rules are rebuilt as strings from the table
+    urls_to_process = scope.filter(
+        urls_to_scrape[index] for index in range(args.start_at, len(urls_to_scrape))
+    )
+    if scope.total_skipped:
+        reasons = ", ".join(f"{n} {why}" for why, n in scope.skipped.items())
+        console.print_info(f"Skipped {scope.total_skipped} URLs ({reasons})")
+    skipped = scope.total_skipped
+
+    if getattr(args, "probe", False) and urls_to_process:
+        async with (
+            HostScheduler(
+                rate=getattr(args, "host_rate", DEFAULT_HOST_RATE)
+            ) as scheduler,
+            UrlProber(scheduler) as prober,
+        ):
+            urls_to_process = await prober.filter(urls_to_process)
+        _report_probes(prober, console)
+        skipped += prober.total_dropped
+
     if not urls_to_process:
-        console.print_error(f"No URLs left to process after --start-at {args.start_at}")
+        console.print_error("No URLs left to process after filtering")
         return {"successful_urls": [], "failed_urls": []}
 
+    if per_cluster := getattr(args, "sample", None):
+        clusters = cluster_urls(urls_to_process)
+        total = len(urls_to_process)
+        urls_to_process = sample_clusters(clusters, per_cluster)
+        console.print_info(
+            f"Sampling {len(urls_to_process)} of {total} URLs: up to {per_cluster} "
+            f"from each of {len(clusters)} URL templates"
+        )
+        # Reused pages would report no timing, so a preview renders everything
+        args.revalidate = False
+
+    # Files are numbered by input position, so dropped URLs leave gaps
+    positions = (
+        _input_positions(urls_to_scrape, urls_to_process, args.start_at)
+        if skipped or per_cluster
+        else None
+    )
+    summary = await _scrape_urls(args, urls_to_process, console, positions)
+    if skipped:
+        summary["skipped_urls"] = skipped
+    if per_cluster:
+        summary["clusters"] = cluster_report(clusters, urls_to_process, summary)
+    return summary
+
+
+def _input_positions(urls: UrlTable, kept: list[str], start_at: int) -> list[int]:
+    """Return the 1-based input position of each kept URL (its first occurrence)."""
+    first_seen: dict[str, int] = {}
+    for position in range(start_at, len(urls)):
+        first_seen.setdefault(urls[position], position + 1)
+    return [first_seen[url] for url in kept]
+
+
+def _report_probes(prober: UrlProber, console: CleanConsole) -> None:
+    """Tell the user how many browser fetches the HEAD probes saved."""
+    if not prober.probed:
+        return
+    reasons = ", ".join(f"{n} {why}" for why, n in prober.dropped.items())
+    console.print_info(
+        f"HEAD probes dropped {prober.total_dropped} of {prober.probed} URLs"
+        + (f" ({reasons})" if reasons else "")
+        + f", avoiding {prober.total_dropped} browser fetches"
+    )
+
+
+async def _scrape_urls(
+    args: argparse.Namespace,
+    urls: list[str] | UrlChannel,
+    console: CleanConsole,
+    positions: list[int] | None = None,
+) -> dict:
+    """Convert URLs to Markdown with the fast or LLM processor.
+
+    ``positions`` gives each URL's 1-based place in the input list when
+    filtering removed some; files are numbered by it.
+    """
+    is_debug = getattr(args, "debug", False)
     output_dir = Path(args.output_dir)
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -720,10 +1760,11 @@ async def scrape_command(args: argparse.Namespace) -> dict:
 
     if args.fast:
         summary = await process_urls_fast(
-            urls_to_scrape=urls_to_process,
+            urls_to_scrape=urls,
             args=args,
             output_dir=output_dir,
             browser_config=browser_config,
+            positions=positions,
         )
     else:
         llm_config = LLMConfig(
@@ -740,11 +1781,12 @@ async def scrape_command(args: argparse.Namespace) -> dict:
             verbose=False,
         )
         summary = await process_urls_batch(
-            urls_to_scrape=urls_to_process,
+            urls_to_scrape=urls,
             args=args,
             output_dir=output_dir,
             llm_content_filter=llm_content_filter,
             browser_config=browser_config,
+            positions=positions,
         )
     return summary
 
@@ -754,15 +1796,108 @@ async def process_command(args: argparse.Namespace) -> dict:
     set_logging_verbosity(verbose=args.verbose)
     console.print_phase("UNIFIED PROCESSING", "Discovery + Scraping pipeline")
 
+    discover_args = argparse.Namespace(
+        start_url=args.start_url,
+        verbose=args.verbose,
+        depth=args.depth,
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        strategy=args.strategy,
+        include=args.include,
+        exclude=args.exclude,
+        auto_scope=args.auto_scope,
+        collapse_versions=getattr(args, "collapse_versions", True),
+        pin_version=getattr(args, "pin_version", None),
+        order=getattr(args, "order", DEFAULT_URL_ORDER),
+    )
+    if not getattr(args, "pipeline", True):
+        return await _process_sequentially(args, discover_args)
+    if getattr(args, "sample", None):
+        # Sampling per URL template needs the complete URL list
+        console.print_info("--sample waits for discovery to finish")
+        return await _process_sequentially(args, discover_args)
+    if discover_args.order != DEFAULT_URL_ORDER:
+        # Ranking needs the complete link graph before the first page is scraped
+        console.print_info(
+            f"--order {discover_args.order} waits for discovery to finish"
+        )
+        return await _process_sequentially(args, discover_args)
+
+    _check_api_key(args)
+    args.start_at = max(0, args.start_at)
+    channel = UrlChannel(start_at=args.start_at)
+
+    async def discover_into_channel() -> list[str]:
+        async with AsyncExitStack() as stack:
+            put_many = channel.put_many
+            if getattr(args, "probe", False):
+                # Non-HTML and dead URLs never enter the channel
+                scheduler = await stack.enter_async_context(
+                    HostScheduler(rate=getattr(args, "host_rate", DEFAULT_HOST_RATE))
+                )
+                prober = await stack.enter_async_context(UrlProber(scheduler))
+                stack.callback(_report_probes, prober, console)
+
+                async def put_many(urls: list[str]) -> None:
+                    await channel.put_many(await prober.filter(urls))
+
+            return await discover_and_put(put_many)
+
+    async def discover_and_put(
+        put_many: Callable[[list[str]], Awaitable[None]],
+    ) -> list[str]:
+        try:
+            found_urls = await _run_discovery(
+                discover_args, console, on_discovered=put_many
+            )
+            # Sitemap discovery hands over its URLs only once it is done
+            await put_many(found_urls)
+            if found_urls:
+                console.print_success(
+                    f"Discovery finished. Found {len(found_urls)} URLs."
+                )
+            return found_urls
+        except Exception as e:
+            console.print_error(f"Discovery failed: {e}")
+            return []
+        finally:
+            channel.close()
+
+    # Scraping starts on the first discovered URL instead of the full list
+    discovery = asyncio.create_task(discover_into_channel())
+    try:
+        summary = await _scrape_urls(args, channel, console)
+    finally:
+        discovery.cancel()  # no-op unless scraping stopped early
+        await asyncio.wait([discovery])
+
+    found_urls = [] if discovery.cancelled() else discovery.result()
+    if not len(channel) and found_urls:
+        console.print_error(
+            f"--start-at index {args.start_at} is out of bounds for {len(found_urls)} URLs."
+        )
+        return {
+            "successful_urls": [],
+            "failed_urls": [("config", "start_at out of bounds")],
+        }
+    if not len(channel):
+        console.print_error("Discovery phase failed")
+        return {
+            "successful_urls": [],
+            "failed_urls": [("discovery", "Failed to find any URLs")],
+        }
+    return summary
+
+
+async def _process_sequentially(
+    args: argparse.Namespace, discover_args: argparse.Namespace
+) -> dict:
+    """Run discovery to completion, then scrape its saved URL list."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp_file:
         temp_file_path = tmp_file.name
 
     try:
-        discover_args = argparse.Namespace(
-            start_url=args.start_url,
-            output_file=temp_file_path,
-            verbose=args.verbose,
-        )
+        discover_args.output_file = temp_file_path
         discover_result = await discover_command(discover_args)
         if discover_result != 0:
             console.print_error("Discovery phase failed")
@@ -771,16 +1906,7 @@ async def process_command(args: argparse.Namespace) -> dict:
                 "failed_urls": [("discovery", "Failed to find any URLs")],
             }
 
-        if not args.fast:
-            api_key: str | None = os.getenv(args.api_key_env)
-            if not api_key:
-                raise ConfigError(f"API key env var '{args.api_key_env}' not found!")
-            console.print_info(
-                f"🔑 Found API key in env var: [bold lime]{args.api_key_env}[/bold lime]"
-            )
-        else:
-            console.print_info("⚡ Fast mode enabled - no API key needed")
-
+        _check_api_key(args)
         scrape_args = argparse.Namespace(**vars(args))
         scrape_args.input_file = temp_file_path
 
@@ -793,6 +1919,19 @@ async def process_command(args: argparse.Namespace) -> dict:
             pass
 
 
+def _check_api_key(args: argparse.Namespace) -> None:
+    """Fail early when LLM mode has no API key, before any crawling."""
+    if not args.fast:
+        api_key: str | None = os.getenv(args.api_key_env)
+        if not api_key:
+            raise ConfigError(f"API key env var '{args.api_key_env}' not found!")
+        console.print_info(
+            f"🔑 Found API key in env var: [bold lime]{args.api_key_env}[/bold lime]"
+        )
+    else:
+        console.print_info("⚡ Fast mode enabled - no API key needed")
+
+
 def main():
     """Main entry point for the ScrollScribe CLI application."""
     try:
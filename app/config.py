@@ -9,8 +9,11 @@ Note:
     These configuration utilities are shared by both LLM-based and fast processing pipelines.
 """
 
+import httpx
 from crawl4ai import BrowserConfig, CacheMode, CrawlerRunConfig
 
+from .constants import DISCOVERY_TIMEOUT_MS, HTTP_USER_AGENT, MAX_CONCURRENT_REQUESTS
+
 
 def get_browser_config(headless: bool = True, verbose: bool = False) -> BrowserConfig:
     """Create and return a standardized BrowserConfig for crawl4ai.
@@ -30,6 +33,34 @@ def get_browser_config(headless: bool = True, verbose: bool = False) -> BrowserC
     )
 
 
+def get_http_client(
+    timeout_ms: int = DISCOVERY_TIMEOUT_MS,
+    max_connections: int = MAX_CONCURRENT_REQUESTS,
+) -> httpx.AsyncClient:
+    """Create a pooled async HTTP client for browserless fetches.
+
+    Used for lightweight requests (robots.txt, sitemaps, static HTML) where
+    launching a browser would be wasted work. Callers own the client and should
+    use it as an async context manager so pooled connections are closed.
+
+    Args:
+        timeout_ms (int): Per-request timeout in milliseconds.
+        max_connections (int): Maximum number of pooled connections.
+
+    Returns:
+        httpx.AsyncClient: Configured client that follows redirects.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout_ms / 1000,
+        follow_redirects=True,
+        headers={"User-Agent": HTTP_USER_AGENT},
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
 def silence_noisy_libraries():
     """Suppress excessive logging output from third-party libraries.
 
@@ -51,6 +51,23 @@ MAX_FILENAME_LENGTH = 100
 DEFAULT_EXTENSION = ".md"
 """Default file extension for processed content"""
 
+LINK_FILE_FORMATS = ("txt", "json", "ndjson", "csv")
+"""Formats `save_links_to_file` can write discovered URLs in"""
+
+CSV_METADATA_FIELDS = [
+    "url",
+    "path",
+    "depth",
+    "keywords",
+    "filename_part",
+    "md_filename",
+    "discovered_at",
+]
+"""Header row of discovered-URL CSV files"""
+
+METADATA_BATCH_SIZE = 1000
+"""URLs whose metadata is computed and written together when saving URL lists"""
+
 # Rate Limiting & Performance
 DEFAULT_BATCH_SIZE = 10
 """Default batch size for processing multiple URLs"""
@@ -58,6 +75,127 @@ DEFAULT_BATCH_SIZE = 10
 MAX_CONCURRENT_REQUESTS = 5
 """Maximum number of concurrent network requests"""
 
+# Discovery
+DEFAULT_DISCOVERY_DEPTH = 1
+"""Default number of link levels crawled by discovery (1 = start page only)"""
+
+MAX_DISCOVERY_DEPTH = 10
+"""Upper bound for --depth to keep breadth-first crawls bounded"""
+
+DISCOVERY_STRATEGIES = ["auto", "sitemap", "index", "nav", "http", "crawl"]
+"""Discovery strategies: page indexes/sitemap then HTTP, sitemap only, objects.inv or llms.txt, navigation TOC, browserless HTTP, browser"""
+
+DEFAULT_DISCOVERY_STRATEGY = "auto"
+"""Default discovery strategy"""
+
+NAV_MIN_PAGES = 5
+"""Internal links a sidebar needs before it is trusted as the site's table of contents"""
+
+NAV_CHECK_PAGES = 3
+"""Pages whose navigation is compared with the start page's to detect a collapsed TOC"""
+
+DEFAULT_SEED_CONCURRENCY = 4
+"""Seed URLs discovered at once by `scribe discover --seeds`"""
+
+DEFAULT_FRONTIER_BATCH_SIZE = 500
+"""Buffered frontier writes per SQLite transaction (also the BFS fetch chunk)"""
+
+HTTP_USER_AGENT = "ScrollScribe/0.4 (+https://github.com/JamesN-dev/scrollscribe)"
+"""User-Agent sent with browserless HTTP requests (robots.txt, sitemaps)"""
+
+MIN_STATIC_TEXT_CHARS = 200
+"""Pages with less visible text than this are treated as JavaScript-rendered"""
+
+MIN_STATIC_TEXT_DENSITY = 0.02
+"""Visible text per HTML character below which a page without a main-content
+element is treated as JavaScript-rendered"""
+
+RENDER_MODES = ["browser", "auto"]
+"""Page fetching: always render in Chromium, or plain HTTP with browser fallback"""
+
+DEFAULT_RENDER_MODE = "browser"
+"""Default page fetching mode for scrape/process"""
+
+DEFAULT_SITEMAP_PATHS = ["/sitemap.xml", "/sitemap_index.xml"]
+"""Well-known sitemap locations tried when robots.txt does not list any"""
+
+MAX_SITEMAP_NESTING = 3
+"""Maximum depth of sitemap index files pointing to further index files"""
+
+INVENTORY_FILENAME = "objects.inv"
+"""Sphinx inventory listing every document of a Sphinx site"""
+
+LLMS_TXT_FILENAME = "llms.txt"
+"""Markdown index of a site's pages published for language models"""
+
+MAX_INDEX_BYTES = 20 * 1024 * 1024
+"""Largest objects.inv or llms.txt body read during discovery"""
+
+# Politeness Constants
+DEFAULT_HOST_RATE = 4.0
+"""Default requests per second allowed to a single host while scraping"""
+
+DEFAULT_HOST_BURST = 4
+"""Requests a host may receive back-to-back before its rate limit applies"""
+
+MAX_CRAWL_DELAY = 60.0
+"""Upper bound (seconds) honoured for a robots.txt Crawl-delay"""
+
+PROBE_CONCURRENCY = 16
+"""Maximum HEAD probes in flight when pre-checking URLs before rendering"""
+
+HTML_CONTENT_TYPES = ["text/html", "application/xhtml+xml"]
+"""Content types a HEAD probe accepts as renderable pages"""
+
+PROBE_INCONCLUSIVE_STATUSES = [401, 403, 405, 408, 429]
+"""4xx answers to a HEAD probe that do not prove the page is dead"""
+
+VALIDATORS_FILENAME = ".scrollscribe-validators.json"
+"""File in the output directory holding ETag/Last-Modified validators per URL"""
+
+REDIRECTS_FILENAME = ".scrollscribe-redirects.json"
+"""File in the output directory mapping redirecting and aliased URLs to their page"""
+
+PIPELINE_QUEUE_SIZE = 256
+"""Discovered URLs buffered between discovery and scraping in `scribe process`"""
+
+DEFAULT_LLM_CONCURRENCY = 4
+"""Default number of pages filtered by the LLM at once (`--llm-concurrency`)"""
+
+CHARS_PER_TOKEN = 4
+"""Rough characters per LLM token, for estimating a page's token cost"""
+
+LLM_CACHE_DIR_ENV = "SCROLLSCRIBE_CACHE_DIR"
+"""Environment variable overriding the directory of the LLM result cache"""
+
+LLM_CACHE_FILENAME = "llm-cache.db"
+"""SQLite file holding cached LLM results, inside the cache directory"""
+
+DEFAULT_LLM_CACHE_MB = 512
+"""Size the LLM result cache is trimmed to, least recently used entries first"""
+
+LLM_QUEUE_SIZE = 8
+"""Fetched pages waiting for a free LLM worker before fetching pauses"""
+
+WRITE_QUEUE_SIZE = 32
+"""Filtered pages waiting to be written to disk"""
+
+# Link Graph Constants
+URL_ORDERS = ["discovery", "indegree", "pagerank"]
+"""Ways to order discovered URLs: as found, or most-linked pages first"""
+
+DEFAULT_URL_ORDER = "discovery"
+"""Default order of the discovered URL list"""
+
+PAGERANK_DAMPING = 0.85
+"""Probability that a PageRank random surfer follows a link"""
+
+PAGERANK_TOLERANCE = 1e-6
+"""L1 change between PageRank iterations below which it has converged"""
+
+PAGERANK_MAX_ITERATIONS = 100
+"""Upper bound on PageRank power iterations"""
+
 # Retry Configuration
 MAX_RETRY_ATTEMPTS = 3
 """Maximum number of retry attempts for failed operations"""
@@ -114,3 +252,38 @@ EXCLUDED_URL_EXTENSIONS = [
     ".rpm",
 ]
 """File extensions to exclude from URL processing"""
+
+TRACKING_QUERY_PARAMS = frozenset(
+    {"gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_ga", "_gl", "ref_src"}
+)
+"""Query parameters that only track visitors and never change page content"""
+
+TRACKING_QUERY_PREFIXES = ("utm_",)
+"""Query parameter prefixes stripped during URL canonicalization"""
+
+INDEX_FILENAMES = frozenset(
+    {"index.html", "index.htm", "index.php", "default.htm", "default.aspx"}
+)
+"""Directory index documents treated as the same page as their directory"""
+
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+"""False-positive rate of the optional Bloom filter used for URL de-duplication"""
+
+SCOPE_REGEX_PREFIX = "re:"
+"""Marks an --include/--exclude rule as a regular expression"""
+
+VERSION_KEYWORDS = [
+    "dev",
+    "latest",
+    "stable",
+    "main",
+    "master",
+    "trunk",
+    "nightly",
+    "next",
+    "current",
+]
+"""Path segments that name a documentation version rather than a page"""
+
+VERSION_PREFIX_MIN_PAGES = 3
+"""Pages a version/language prefix must be seen on before its pages are collapsed"""
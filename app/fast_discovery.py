@@ -6,31 +6,104 @@ Fetches only internal documentation links using fresh content (no caching, no LL
 
 Supports saving discovered links as ordered lists to either:
 - Plain text files (.txt), one URL per line (default)
-- Headerless single-column CSV files (.csv), preserving discovery order
+- CSV files (.csv) with a header row and per-URL metadata columns
+- JSON arrays (.json) or newline-delimited JSON (.ndjson/.jsonl) of URL metadata
+
+By default only the start page is scanned. Passing ``depth > 1`` switches to a
+breadth-first crawl that fans out over discovered internal pages with a bounded
+number of concurrent browser tabs, still returning one ordered, de-duplicated list.
 
 Usage examples:
     links = await extract_links_fast("https://docs.python.org/")
+    links = await extract_links_fast("https://docs.python.org/", depth=3, max_pages=500)
     save_links_to_file(links, "urls.txt")          # Save as TXT (default)
     save_links_to_file(links, "urls.csv", fmt="csv")  # Save as CSV
+    save_links_to_file(links, "urls.ndjson", fmt="ndjson")  # One JSON object per line
 """
 
+import asyncio
+import csv
+import json
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import AsyncExitStack
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
 from rich.console import Console
 
+from app.constants import (
+    CSV_METADATA_FIELDS,
+    DEFAULT_DISCOVERY_DEPTH,
+    LINK_FILE_FORMATS,
+    MAX_CONCURRENT_REQUESTS,
+    METADATA_BATCH_SIZE,
+)
+from app.frontier import crawl_breadth_first, open_frontier
+from app.link_graph import LinkGraph
+from app.utils.dedup import UrlDeduplicator
 from app.utils.error_classification import classify_error_type, should_retry_error
 from app.utils.exceptions import InvalidUrlError, NetworkError
 from app.utils.logging import CleanConsole
 from app.utils.retry import retry_network
+from app.utils.scope import ScopeRules
 from app.utils.url_helpers import (
     analyze_url_metadata,
     clean_url_for_display,
 )
 
 
+class SharedCrawler:
+    """One browser shared by several discoveries, launched on first use.
+
+    Multi-seed discovery passes a single instance to every seed, so a batch of
+    start URLs costs at most one Chromium launch, and none at all when every
+    seed is served by sitemaps or plain HTTP.
+
+    Attributes:
+        launches: Number of browsers started (0 or 1)
+    """
+
+    def __init__(self, config: BrowserConfig | None = None):
+        self.config = config
+        self.launches = 0
+        self._crawler: AsyncWebCrawler | None = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "SharedCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._crawler is not None:
+            await self._crawler.close()
+            self._crawler = None
+
+    async def get(self) -> AsyncWebCrawler:
+        """Return the shared crawler, starting the browser if needed."""
+        async with self._lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(config=self.config)
+                await crawler.start()
+                self._crawler = crawler
+                self.launches += 1
+        return self._crawler
+
+
 @retry_network
-async def extract_links_fast(start_url: str, verbose: bool = False) -> list[str]:
+async def extract_links_fast(
+    start_url: str,
+    verbose: bool = False,
+    depth: int = DEFAULT_DISCOVERY_DEPTH,
+    max_pages: int | None = None,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    frontier_path: str | None = None,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+    graph: LinkGraph | None = None,
+    on_discovered: Callable[[list[str]], Awaitable[None]] | None = None,
+    browser: SharedCrawler | None = None,
+) -> list[str]:
     """
     Async fast link discovery using Crawl4AI.
     Returns an ordered list of internal links (hrefs as strings).
@@ -39,6 +112,21 @@ async def extract_links_fast(start_url: str, verbose: bool = False) -> list[str]
     Args:
         start_url: The starting URL to scrape for links
         verbose: Enable verbose logging output
+        depth: Number of link levels to crawl. 1 scans only the start page,
+            2 also scans every page linked from it, and so on.
+        max_pages: Stop once this many unique URLs have been discovered
+            (None for no limit)
+        concurrency: Maximum number of pages fetched at once during a
+            multi-level crawl
+        frontier_path: SQLite file that persists crawl state so an interrupted
+            discovery can be resumed (None keeps it in memory)
+        dedup: Canonical seen-set shared with the caller, e.g. to read duplicate
+            statistics or to use a Bloom filter (a fresh exact set when None)
+        scope: Include/exclude rules applied to links before they are queued
+        graph: Records every internal link between accepted pages
+        on_discovered: Async callback receiving URLs as they are discovered
+        browser: Browser shared with other discoveries (a private one is
+            launched and closed when None)
 
     Returns:
         Ordered list of unique internal URLs found on the page
@@ -49,7 +137,33 @@ async def extract_links_fast(start_url: str, verbose: bool = False) -> list[str]
     """
     console = CleanConsole()
     try:
-        return await _extract_links_async(start_url, verbose)
+        if (
+            depth <= 1
+            and frontier_path is None
+            and graph is None
+            and on_discovered is None
+            and browser is None
+        ):
+            links = await _extract_links_async(start_url, verbose)
+            if scope:
+                links = scope.filter(links)
+            if dedup is not None:
+                dedup.add(start_url)
+                links = [clean for url in links if (clean := dedup.add(url))]
+            return links[:max_pages] if max_pages else links
+        return await _crawl_links_bfs(
+            start_url,
+            verbose,
+            depth,
+            max_pages,
+            concurrency,
+            frontier_path,
+            dedup,
+            scope,
+            graph,
+            on_discovered,
+            browser,
+        )
     except Exception as e:
         # Map unexpected errors to appropriate ScrollScribe exceptions
         error_type = classify_error_type(str(e))
@@ -95,7 +209,8 @@ async def _extract_links_async(start_url: str, verbose: bool = False) -> list[st
         exclude_external_links=True,
     )
 
-    seen: set[str] = set()
+    seen = UrlDeduplicator()
+    seen.add(start_url)
     ordered_links: list[str] = []
 
     try:
@@ -103,59 +218,15 @@ async def _extract_links_async(start_url: str, verbose: bool = False) -> list[st
             result = await crawler.arun(start_url, config=config)
 
             if not getattr(result, "success", False):
-                error_msg = getattr(result, "error_message", "Unknown crawl error")
-                if verbose:
-                    console.print_error(
-                        f"Discovery operation returned failure: {error_msg}"
-                    )
-
-                # Use unified error classification
-                # If this error is not retryable, raise immediately (bypass retry decorator)
-                if not should_retry_error(error_msg):
-                    error_type = classify_error_type(error_msg)
-                    if error_type == "url_error":
-                        raise InvalidUrlError(
-                            f"Invalid URL format: {start_url}",
-                            url=start_url,
-                            parse_error=error_msg,
-                        ) from None
-                    else:
-                        raise NetworkError(
-                            f"Discovery operation failed: {error_msg}", url=start_url
-                        ) from None
-
-                error_type = classify_error_type(error_msg)
-                if error_type == "url_error":
-                    raise InvalidUrlError(
-                        f"Invalid URL format: {start_url}",
-                        url=start_url,
-                        parse_error=error_msg,
-                    )
-                else:
-                    raise NetworkError(
-                        f"Discovery operation failed: {error_msg}", url=start_url
-                    )
-
-            # Extract links from result - safely access links attribute
-            links_data = getattr(result, "links", {}) or {}
-            internal_link_list = links_data.get("internal", [])
+                _raise_for_failed_result(result, start_url, verbose, console)
 
             if verbose:
                 console.print_fetch_status(start_url, "fetched")
 
             # Process and filter links
-            for link in internal_link_list:
-                href = link.get("href")
-                if href and isinstance(href, str):
-                    # Strip fragments and normalize
-                    clean_href = href.split("#")[0].strip()
-                    if (
-                        clean_href
-                        and clean_href != start_url
-                        and clean_href not in seen
-                    ):
-                        seen.add(clean_href)
-                        ordered_links.append(clean_href)
+            for href in _iter_internal_links(result):
+                if clean_href := seen.add(href):
+                    ordered_links.append(clean_href)
 
             if verbose:
                 console.print_success(
@@ -196,32 +267,180 @@ async def _extract_links_async(start_url: str, verbose: bool = False) -> list[st
     return ordered_links
 
 
+async def _crawl_links_bfs(
+    start_url: str,
+    verbose: bool,
+    depth: int,
+    max_pages: int | None,
+    concurrency: int,
+    frontier_path: str | None = None,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+    graph: LinkGraph | None = None,
+    on_discovered: Callable[[list[str]], Awaitable[None]] | None = None,
+    browser: SharedCrawler | None = None,
+) -> list[str]:
+    """Breadth-first multi-level link discovery over internal pages.
+
+    Pages in each level are fetched concurrently (bounded by ``concurrency``),
+    but their links are merged in level order, so the result is identical to a
+    sequential BFS regardless of which tab finishes first.
+
+    Args:
+        start_url: The starting URL to crawl
+        verbose: Enable verbose logging output
+        depth: Number of link levels to crawl (start page is level 1)
+        max_pages: Stop once this many unique URLs have been discovered
+        concurrency: Maximum number of pages fetched at once
+        frontier_path: SQLite file used to persist and resume the crawl
+            (in-memory when None)
+        dedup: Canonical seen-set for discovered URLs (exact set when None)
+        scope: Include/exclude rules applied to links before they are queued
+        graph: Records every internal link between accepted pages
+        on_discovered: Async callback receiving URLs as they are discovered
+        browser: Browser shared with other discoveries (a private one is
+            launched and closed when None)
+
+    Returns:
+        Ordered list of unique internal URLs in breadth-first discovery order
+
+    Raises:
+        InvalidUrlError: If the start URL cannot be parsed or processed
+        NetworkError: If the start page cannot be fetched
+    """
+    console = CleanConsole()
+
+    if verbose:
+        console.print_phase(
+            "DISCOVERY",
+            f"Crawling {clean_url_for_display(start_url)} "
+            f"(depth {depth}, {concurrency} concurrent pages)",
+        )
+
+    config = CrawlerRunConfig(
+        css_selector="a[href]",
+        cache_mode=CacheMode.DISABLED,
+        excluded_tags=["script", "style", "img", "video", "nav", "footer", "aside"],
+        word_count_threshold=0,
+        exclude_external_links=True,
+    )
+
+    with open_frontier(
+        frontier_path, start_url, dedup=dedup, scope=scope, graph=graph
+    ) as frontier:
+        if frontier.resumed and verbose:
+            console.print_info(
+                f"Resuming discovery with {len(frontier)} URLs already known"
+            )
+
+        async with AsyncExitStack() as stack:
+            crawler = (
+                await browser.get()
+                if browser is not None
+                else await stack.enter_async_context(AsyncWebCrawler())
+            )
+
+            async def fetch_links(page_url: str) -> list[str] | None:
+                result = await crawler.arun(page_url, config=config)
+                if not getattr(result, "success", False):
+                    if page_url == start_url:
+                        _raise_for_failed_result(result, start_url, verbose, console)
+                    return None
+                return list(_iter_internal_links(result))
+
+            await crawl_breadth_first(
+                frontier,
+                fetch_links,
+                depth,
+                max_pages,
+                concurrency,
+                verbose,
+                on_discovered,
+            )
+
+        ordered_links = frontier.ordered_urls()
+
+    if verbose:
+        console.print_success(
+            f"Discovery completed: {len(ordered_links)} unique internal links"
+        )
+
+    return ordered_links
+
+
+def _iter_internal_links(result):
+    """Yield fragment-stripped internal hrefs from a crawl result, in page order."""
+    links_data = getattr(result, "links", {}) or {}
+    for link in links_data.get("internal", []):
+        href = link.get("href")
+        if href and isinstance(href, str):
+            clean_href = href.split("#")[0].strip()
+            if clean_href:
+                yield clean_href
+
+
+def _raise_for_failed_result(
+    result, url: str, verbose: bool, console: CleanConsole
+) -> None:
+    """Raise the ScrollScribe exception matching a failed crawl result.
+
+    Non-retryable errors are raised with their context suppressed so the
+    retry decorator gives up immediately.
+
+    Raises:
+        InvalidUrlError: If the failure looks like a URL problem
+        NetworkError: For network and unclassified failures
+    """
+    error_msg = getattr(result, "error_message", "Unknown crawl error")
+    if verbose:
+        console.print_error(f"Discovery operation returned failure: {error_msg}")
+
+    error_type = classify_error_type(error_msg)
+    if error_type == "url_error":
+        exc: Exception = InvalidUrlError(
+            f"Invalid URL format: {url}", url=url, parse_error=error_msg
+        )
+    else:
+        exc = NetworkError(f"Discovery operation failed: {error_msg}", url=url)
+
+    # If this error is not retryable, raise immediately (bypass retry decorator)
+    if not should_retry_error(error_msg):
+        raise exc from None
+    raise exc
+
+
 def save_links_to_file(
-    links: list[str], output_file: str, verbose: bool = False, fmt: str = "txt"
+    links: Sequence[str], output_file: str, verbose: bool = False, fmt: str = "txt"
 ) -> None:
-    """Save discovered links to a file in text, JSON, or CSV format.
+    """Save discovered links to a file in text, JSON, NDJSON, or CSV format.
+
+    Rows are written in batches of ``METADATA_BATCH_SIZE``. Each batch gets its
+    metadata computed with one shared timestamp and goes straight to the file,
+    so memory use does not grow with the number of links.
 
     Args:
         links: Ordered list of URLs to save.
-        output_file: Path to output file. If None and fmt="csv", defaults to "urls.csv".
+        output_file: Path to output file.
         verbose: Enable verbose logging.
         fmt: Output format - "txt" (default) writes one URL per line,
-        "json" writes a JSON array of URLs,
-        "csv" writes a headerless single-column CSV file preserving order.
+        "json" writes a JSON array of URL metadata objects, one per line,
+        "ndjson" writes one URL metadata object per line without the array,
+        "csv" writes URL metadata with a header row.
 
     Raises:
-        ValueError: If fmt is not "txt", "json", or "csv".
+        ValueError: If fmt is not "txt", "json", "ndjson", or "csv".
         OSError: If the file cannot be written.
 
     Notes:
-        - When fmt is "csv" and output_file is None, the default filename "urls.csv" will be used.
         - The function preserves the order of URLs as provided.
     """
     console = Console()
 
     # Validate format parameter
-    if fmt not in ("txt", "json", "csv"):
-        raise ValueError(f"Format must be 'txt', 'json', or 'csv', got '{fmt}'")
+    if fmt not in LINK_FILE_FORMATS:
+        raise ValueError(
+            f"Format must be 'txt', 'json', 'ndjson', or 'csv', got '{fmt}'"
+        )
 
     if not links:
         if verbose:
@@ -237,50 +456,37 @@ def save_links_to_file(
     try:
         # Keep directory-creation unchanged
         out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Branch logic based on format
-        if fmt == "txt":
-            # Current behavior - join with newlines
-            out_path.write_text("\n".join(links), encoding="utf-8")
-        elif fmt == "csv":
-            import csv
-
-            with open(out_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                # Write header
-                writer.writerow(
-                    [
-                        "url",
-                        "path",
-                        "depth",
-                        "keywords",
-                        "filename_part",
-                        "md_filename",
-                        "discovered_at",
-                    ]
-                )
-                for i, link in enumerate(links):
-                    metadata = analyze_url_metadata(link, i + 1)
-                    writer.writerow(
+        with open(out_path, "w", newline="", encoding="utf-8") as f:
+            if fmt == "txt":
+                for start in range(0, len(links), METADATA_BATCH_SIZE):
+                    if start:
+                        f.write("\n")
+                    f.write("\n".join(links[start : start + METADATA_BATCH_SIZE]))
+            elif fmt == "csv":
+                writer = csv.writer(f)
+                writer.writerow(CSV_METADATA_FIELDS)
+                for batch in _iter_metadata_batches(links):
+                    writer.writerows(
                         [
-                            metadata["url"],
-                            metadata["path"],
-                            metadata["depth"],
-                            "|".join(metadata["keywords"]),  # Join keywords with |
-                            metadata["filename_part"],
-                            metadata["md_filename"],
-                            metadata["discovered_at"],
+                            m["url"],
+                            m["path"],
+                            m["depth"],
+                            "|".join(m["keywords"]),  # Join keywords with |
+                            m["filename_part"],
+                            m["md_filename"],
+                            m["discovered_at"],
                         ]
+                        for m in batch
                     )
-        elif fmt == "json":
-            import json
-
-            json_data = []
-            for i, link in enumerate(links):
-                metadata = analyze_url_metadata(link, i + 1)  # This line goes here
-                json_data.append(metadata)
-            with open(out_path, "w", encoding="utf-8") as jsonfile:
-                json.dump(json_data, jsonfile, indent=4)
+            elif fmt == "json":
+                f.write("[")
+                for n, batch in enumerate(_iter_metadata_batches(links)):
+                    f.write(",\n" if n else "\n")
+                    f.write(",\n".join(map(json.dumps, batch)))
+                f.write("\n]\n")
+            else:
+                for batch in _iter_metadata_batches(links):
+                    f.writelines(json.dumps(m) + "\n" for m in batch)
 
         if verbose:
             console.print(f"[green][SUCCESS] Saved to {out_path}[/green]")
@@ -289,3 +495,15 @@ def save_links_to_file(
             f"[bold red][ERROR] Could not write file {out_path}: {e}[/bold red]"
         )
         raise
+
+
+def _iter_metadata_batches(links: Sequence[str]) -> Iterator[list[dict[str, Any]]]:
+    """Yield URL metadata in batches that share one discovery timestamp."""
+    for start in range(0, len(links), METADATA_BATCH_SIZE):
+        discovered_at = datetime.now().isoformat()
+        yield [
+            analyze_url_metadata(link, index, discovered_at)
+            for index, link in enumerate(
+                links[start : start + METADATA_BATCH_SIZE], start + 1
+            )
+        ]
@@ -17,17 +17,15 @@ Note:
     sanitization) from `processing.py`.
 """
 
-import asyncio
 import time
+from collections.abc import Sequence
+from contextlib import aclosing
 from pathlib import Path
-from typing import cast
 
 from crawl4ai import (
-    AsyncWebCrawler,
     BrowserConfig,
     CacheMode,
     CrawlerRunConfig,
-    CrawlResult,
 )
 from crawl4ai.content_filter_strategy import PruningContentFilter
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
@@ -44,7 +42,13 @@ from rich.progress import (
 from rich.rule import Rule
 from rich.text import Text
 
+from .adaptive import AdaptiveCrawler, open_crawler
+from .constants import DEFAULT_HOST_RATE, DEFAULT_RENDER_MODE, MAX_CONCURRENT_REQUESTS
+from .pipeline import UrlChannel
+from .politeness import HostScheduler, stream_politely
 from .processing import RateColumn, absolutify_links
+from .redirects import RedirectMap, final_page_url
+from .revalidation import Revalidator, ValidatorStore, settings_variant
 from .utils.exceptions import ProcessingError
 from .utils.logging import CleanConsole, get_logger
 from .utils.url_helpers import clean_url_for_display, url_to_filename
@@ -54,10 +58,11 @@ clean_console = CleanConsole()
 
 
 async def process_urls_fast(
-    urls_to_scrape: list[str],
+    urls_to_scrape: list[str] | UrlChannel,
     args,
     output_dir: Path,
     browser_config: BrowserConfig,
+    positions: Sequence[int] | None = None,
 ):
     """Convert a batch of documentation URLs to Markdown using fast, non-LLM processing.
 
@@ -65,10 +70,14 @@ async def process_urls_fast(
     to efficiently convert HTML to Markdown, saving results to the specified output directory.
 
     Args:
-        urls_to_scrape: List of URLs to process.
+        urls_to_scrape: List of URLs to process, or a UrlChannel that
+            discovery is still filling (``scribe process`` pipeline).
         args: Command line arguments from argparse.
         output_dir: Output directory for markdown files.
         browser_config: Browser configuration for crawl4ai.
+        positions: 1-based input position of each URL, used to number the
+            output files when filtering removed some; defaults to
+            ``--start-at`` plus the URL's index.
 
     Returns:
         dict: Summary with lists of successful and failed URLs.
@@ -102,7 +111,6 @@ async def process_urls_fast(
         page_timeout=args.timeout,
         markdown_generator=markdown_generator,
         verbose=False,
-        stream=False,
         exclude_external_links=True,
         excluded_tags=["script", "style", "nav", "footer", "aside", "header"],
         word_count_threshold=10,
@@ -131,7 +139,13 @@ async def process_urls_fast(
         *progress_columns, console=clean_console.console, transient=False
     )
 
-    base_url = urls_to_scrape[0] if urls_to_scrape else "unknown"
+    streaming = not isinstance(urls_to_scrape, list)
+    total_label = "discovered" if streaming else str(len(urls_to_scrape))
+    base_url = (
+        getattr(args, "start_url", "unknown")
+        if streaming
+        else (urls_to_scrape[0] if urls_to_scrape else "unknown")
+    )
     clean_domain = base_url.replace("https://", "").replace("http://", "").split("/")[0]
 
     header_rule = Rule(
@@ -143,12 +157,17 @@ async def process_urls_fast(
     )
     live_group = Group(header_rule, header_text, progress)
 
-    logger.info(f"Starting fast crawl for {len(urls_to_scrape)} URLs...")
+    logger.info(f"Starting fast crawl for {total_label} URLs...")
     success_count: int = 0
     failed_count: int = 0
     successful_urls = []
     failed_urls = []
+    unchanged_urls = []
+    page_stats: dict[str, dict[str, float]] = {}
+    fetch_times: dict[str, float] = {}
+    redirects = RedirectMap(output_dir)
     shutdown_requested: bool = False
+    validators = ValidatorStore(output_dir, settings_variant(fast=True))
 
     try:
         with Live(
@@ -157,116 +176,210 @@ async def process_urls_fast(
             console=clean_console.console,
             transient=False,
         ) as live:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
+            async with (
+                # A shared session lives in the browser, so it always renders
+                open_crawler(
+                    browser_config,
+                    DEFAULT_RENDER_MODE
+                    if session_id
+                    else getattr(args, "render", DEFAULT_RENDER_MODE),
+                ) as crawler,
+                HostScheduler(
+                    rate=getattr(args, "host_rate", DEFAULT_HOST_RATE)
+                ) as scheduler,
+                Revalidator(
+                    validators,
+                    scheduler,
+                    # With --render auto a changed page's response is converted
+                    on_changed=crawler.offer
+                    if isinstance(crawler, AdaptiveCrawler)
+                    else None,
+                ) as revalidator,
+            ):
                 crawl_task = progress.add_task(
                     description="", total=len(urls_to_scrape)
                 )
 
-                logger.info(
-                    f"Batch fetching {len(urls_to_scrape)} URLs in fast mode..."
-                )
-                all_results: list[CrawlResult] = cast(
-                    "list[CrawlResult]",
-                    await crawler.arun_many(urls_to_scrape, config=fast_config),
+                logger.info(f"Fetching {total_label} URLs in fast mode...")
+                revalidate = getattr(args, "revalidate", True)
+
+                async def skip_page(url: str) -> bool:
+                    # Known redirects and aliases of a claimed page are not fetched
+                    if redirects.skip_duplicate(url):
+                        return True
+                    return revalidate and await revalidator.is_unchanged(url)
+
+                # Pages unchanged since the last run are not rendered again
+                pages = stream_politely(
+                    crawler,
+                    urls_to_scrape,
+                    fast_config,
+                    scheduler,
+                    # A shared browser session is a single tab
+                    concurrency=1 if session_id else MAX_CONCURRENT_REQUESTS,
+                    skip=skip_page,
+                    timings=fetch_times,
                 )
+                async with aclosing(pages):
+                    async for loop_index, url, result in pages:
+                        if shutdown_requested:
+                            clean_console.print_warning(
+                                "Shutdown requested, stopping fast processing..."
+                            )
+                            break
 
-                for loop_index, (url, result) in enumerate(
-                    zip(urls_to_scrape, all_results, strict=True)
-                ):
-                    if shutdown_requested:
-                        clean_console.print_warning(
-                            "Shutdown requested, stopping fast processing..."
+                        original_index: int = (
+                            positions[loop_index]
+                            if positions is not None
+                            else args.start_at + loop_index + 1
                         )
-                        break
+                        total_to_process: int = len(urls_to_scrape)
+                        progress.update(crawl_task, total=total_to_process)
+                        url_start_time = time.time()
+                        chars = 0
 
-                    original_index: int = args.start_at + loop_index + 1
-                    total_to_process: int = len(urls_to_scrape)
-                    url_start_time = time.time()
-
-                    logger.info(
-                        f"Processing URL {loop_index + 1}/{total_to_process} (Overall: {original_index}): {clean_url_for_display(url)}"
-                    )
-
-                    try:
-                        if result.success and result.markdown:
-                            raw_markdown = result.markdown.raw_markdown
+                        logger.info(
+                            f"Processing URL {loop_index + 1}/{total_to_process} (Overall: {original_index}): {clean_url_for_display(url)}"
+                        )
 
-                            if not raw_markdown or len(raw_markdown.strip()) < 50:
-                                failed_count += 1
-                                failed_urls.append((url, "empty content"))
+                        try:
+                            if result is None and url not in redirects.duplicates:
+                                filename = url_to_filename(url, original_index)
+                                validators.keep(url, filename)
+                                success_count += 1
+                                successful_urls.append(url)
+                                unchanged_urls.append(url)
                                 clean_console.print_url_status(
-                                    url, "warning", 0, "empty content"
+                                    url, "success", 0, f"unchanged → {filename}"
                                 )
                                 progress.update(crawl_task, advance=1)
                                 continue
 
-                            logger.info(
-                                f"Markdown generated ({len(raw_markdown)} chars) - applying link fixes..."
-                            )
-
-                            absolute_md = absolutify_links(raw_markdown, url)
-                            filename: str = url_to_filename(url, original_index)
-                            filepath = output_dir / filename
-
-                            try:
-                                with open(filepath, "w", encoding="utf-8") as f:
-                                    f.write(absolute_md)
-
-                                url_time = time.time() - url_start_time
-                                chars = len(absolute_md)
-
+                            if isinstance(result, Exception):
+                                raise result
+                            if url in redirects.duplicates or (
+                                result.success
+                                and redirects.claim(url, final_page_url(url, result))
+                            ):
+                                # Redirect or alias of a page already saved this run
                                 clean_console.print_url_status(
                                     url,
                                     "success",
-                                    url_time,
-                                    f"{chars:,} chars → {filename}",
+                                    0,
+                                    "same page as "
+                                    + clean_url_for_display(redirects.duplicates[url]),
+                                )
+                                progress.update(crawl_task, advance=1)
+                                continue
+
+                            if result.success and result.markdown:
+                                raw_markdown = result.markdown.raw_markdown
+
+                                if not raw_markdown or len(raw_markdown.strip()) < 50:
+                                    failed_count += 1
+                                    failed_urls.append((url, "empty content"))
+                                    redirects.release(url)
+                                    clean_console.print_url_status(
+                                        url, "warning", 0, "empty content"
+                                    )
+                                    progress.update(crawl_task, advance=1)
+                                    continue
+
+                                logger.info(
+                                    f"Markdown generated ({len(raw_markdown)} chars) - applying link fixes..."
                                 )
-                                success_count += 1
-                                successful_urls.append(url)
 
-                            except OSError as e:
+                                absolute_md = absolutify_links(raw_markdown, url)
+                                filename: str = url_to_filename(url, original_index)
+                                filepath = output_dir / filename
+
+                                try:
+                                    with open(filepath, "w", encoding="utf-8") as f:
+                                        f.write(absolute_md)
+                                    validators.record(
+                                        url, result.response_headers, filename
+                                    )
+
+                                    url_time = time.time() - url_start_time
+                                    chars = len(absolute_md)
+
+                                    clean_console.print_url_status(
+                                        url,
+                                        "success",
+                                        url_time,
+                                        f"{chars:,} chars → {filename}",
+                                    )
+                                    success_count += 1
+                                    successful_urls.append(url)
+
+                                except OSError as e:
+                                    failed_count += 1
+                                    failed_urls.append((url, f"save failed: {e}"))
+                                    redirects.release(url)
+                                    logger.error(
+                                        f"Failed to save markdown for {clean_url_for_display(url)} to {filepath}: {e}"
+                                    )
+                                    clean_console.print_url_status(
+                                        url, "error", 0, "save failed"
+                                    )
+                            else:
                                 failed_count += 1
-                                failed_urls.append((url, f"save failed: {e}"))
-                                logger.error(
-                                    f"Failed to save markdown for {clean_url_for_display(url)} to {filepath}: {e}"
+                                error_msg = (
+                                    result.error_message or "No markdown generated"
                                 )
+                                failed_urls.append((url, error_msg))
+                                redirects.release(url)
+                                logger.error(f"Fast processing failed: {error_msg}")
                                 clean_console.print_url_status(
-                                    url, "error", 0, "save failed"
+                                    url, "error", 0, error_msg
                                 )
-                        else:
-                            failed_count += 1
-                            error_msg = result.error_message or "No markdown generated"
-                            failed_urls.append((url, error_msg))
-                            logger.error(f"Fast processing failed: {error_msg}")
-                            clean_console.print_url_status(url, "error", 0, error_msg)
-
-                        await asyncio.sleep(0.1)
-
-                    except KeyboardInterrupt:
-                        live.stop()
-                        clean_console.print_warning(
-                            "KeyboardInterrupt caught during fast processing. Signaling shutdown..."
-                        )
-                        shutdown_requested = True
-
-                    except Exception as exc:
-                        failed_count += 1
-                        failed_urls.append((url, f"unexpected error: {exc}"))
-                        logger.error(
-                            f"Unexpected error in fast processing {clean_url_for_display(url)}: {exc}"
-                        )
 
-                        if isinstance(exc, ProcessingError):
-                            clean_console.print_url_status(url, "error", 0, str(exc))
-                        else:
-                            clean_console.print_url_status(
-                                url, "error", 0, "unexpected error"
+                        except KeyboardInterrupt:
+                            live.stop()
+                            clean_console.print_warning(
+                                "KeyboardInterrupt caught during fast processing. Signaling shutdown..."
                             )
+                            shutdown_requested = True
 
-                        await asyncio.sleep(0.1)
+                        except Exception as exc:
+                            failed_count += 1
+                            failed_urls.append((url, f"unexpected error: {exc}"))
+                            redirects.release(url)
+                            logger.error(
+                                f"Unexpected error in fast processing {clean_url_for_display(url)}: {exc}"
+                            )
 
-                    if not shutdown_requested:
-                        progress.update(crawl_task, advance=1)
+                            if isinstance(exc, ProcessingError):
+                                clean_console.print_url_status(
+                                    url, "error", 0, str(exc)
+                                )
+                            else:
+                                clean_console.print_url_status(
+                                    url, "error", 0, "unexpected error"
+                                )
+                        finally:
+                            if result is not None:
+                                # Fetch plus conversion time, for --sample reports
+                                page_stats[url] = {
+                                    "seconds": fetch_times.pop(url, 0.0)
+                                    + time.time()
+                                    - url_start_time,
+                                    "chars": chars,
+                                }
+
+                        if not shutdown_requested:
+                            progress.update(crawl_task, advance=1)
+
+                if redirects.duplicates:
+                    clean_console.print_info(
+                        f"{len(redirects.duplicates)} redirects/aliases of saved pages "
+                        f"skipped ({redirects.resolved} recognized without fetching)"
+                    )
+                if isinstance(crawler, AdaptiveCrawler) and crawler.static:
+                    clean_console.print_info(
+                        f"{crawler.static} pages converted without a browser, "
+                        f"{crawler.rendered} rendered"
+                    )
 
     except KeyboardInterrupt:
         clean_console.print_warning(
@@ -274,6 +387,8 @@ async def process_urls_fast(
         )
 
     finally:
+        validators.save()
+        redirects.save()
         total_time = time.time() - start_time
 
         clean_console.print_summary(success_count, failed_count, total_time)
@@ -291,5 +406,8 @@ async def process_urls_fast(
     summary = {
         "successful_urls": successful_urls,
         "failed_urls": failed_urls,
+        "unchanged_urls": unchanged_urls,
+        "duplicate_urls": list(redirects.duplicates.items()),
+        "page_stats": page_stats,
     }
     return summary
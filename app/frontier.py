@@ -0,0 +1,527 @@
+"""
+Persistent crawl frontier for resumable, breadth-first URL discovery.
+
+``CrawlFrontier`` stores every discovered URL in a SQLite database (WAL mode)
+together with its crawl depth, status, discovery order and parent page. Writes
+are buffered and committed in batched transactions, so large crawls sustain
+thousands of inserts per second while a crash or Ctrl-C loses at most one
+unflushed batch. Reopening the same database resumes discovery where it stopped
+instead of re-crawling pages.
+
+``crawl_breadth_first`` is the engine-agnostic BFS loop used by both the
+browser (``fast_discovery``) and browserless (``http_discovery``) engines. It
+only needs an async ``fetch_links(url)`` callable; the frontier decides what to
+crawl next and keeps the ordered, de-duplicated output.
+
+Crawls that do not need to survive a restart use ``MemoryFrontier`` instead,
+which keeps the same state in a compact ``UrlTable``; ``open_frontier`` picks
+one of the two. Both share ``Frontier``, which de-duplicates, scopes and
+counts links and leaves storing the records to its subclasses.
+
+Usage examples:
+    with CrawlFrontier("django.frontier.db", start_url) as frontier:
+        await crawl_breadth_first(frontier, fetch_links, depth=3)
+        links = frontier.ordered_urls()   # same list save_links_to_file writes
+    with open_frontier(None, start_url) as frontier: ...  # MemoryFrontier
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from app.constants import DEFAULT_FRONTIER_BATCH_SIZE, MAX_CONCURRENT_REQUESTS
+from app.link_graph import LinkGraph
+from app.utils.dedup import UrlDeduplicator
+from app.utils.exceptions import ConfigError, FileIOError
+from app.utils.logging import CleanConsole, get_logger
+from app.utils.scope import ScopeRules
+from app.utils.url_table import UrlTable
+
+logger = get_logger("frontier")
+
+STATUS_PENDING = "pending"
+STATUS_CRAWLED = "crawled"
+STATUS_FAILED = "failed"
+
+# Status codes of MemoryFrontier records, by position
+_STATUSES = [STATUS_PENDING, STATUS_CRAWLED, STATUS_FAILED]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    depth INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    parent TEXT,
+    discovered_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_urls_pending ON urls (status, depth, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class Frontier:
+    """State and link bookkeeping shared by ``CrawlFrontier`` and ``MemoryFrontier``.
+
+    Subclasses store the URL records: they implement ``_queue_insert``,
+    ``mark``, ``next_level``, ``pending``, ``iter_urls``, ``stats``, ``flush``
+    and ``close``.
+
+    Attributes:
+        path: Database location (":memory:" when nothing is persisted)
+        start_url: Root URL of the crawl
+        batch_size: Number of pages fetched per chunk (and, for
+            ``CrawlFrontier``, buffered writes that trigger a commit)
+        resumed: Whether the frontier continues an earlier crawl
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start_url: str,
+        batch_size: int = DEFAULT_FRONTIER_BATCH_SIZE,
+        dedup: UrlDeduplicator | None = None,
+        scope: ScopeRules | None = None,
+        graph: LinkGraph | None = None,
+    ):
+        self.path = path
+        self.start_url = start_url
+        self.batch_size = batch_size
+        self.dedup = dedup if dedup is not None else UrlDeduplicator()
+        self.scope = scope
+        self.graph = graph
+        self.resumed = False
+        self._rejected = UrlDeduplicator()
+        self._count = 0
+
+    def __enter__(self) -> "Frontier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.dedup
+
+    def __len__(self) -> int:
+        """Number of discovered URLs, excluding the start URL."""
+        return self._count
+
+    def add_many(
+        self,
+        urls: Iterable[str],
+        depth: int,
+        parent: str | None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Record newly discovered URLs in the order given.
+
+        URLs are de-duplicated by canonical form and new ones stored in their
+        canonical spelling (see ``canonicalize_url``). New URLs rejected by
+        ``scope`` are dropped before anything is stored, and a link rejected
+        once is not checked (or counted) again. With a ``graph``, links from
+        ``parent`` to every accepted URL, new or already known, are recorded.
+
+        Args:
+            urls: Candidate URLs, possibly containing already known ones
+            depth: Crawl depth of the new URLs
+            parent: Page the URLs were found on
+            limit: Maximum number of new URLs to accept
+
+        Returns:
+            The canonical URLs that were new, in insertion order
+        """
+        added: list[str] = []
+        linked: list[str] = []
+        for url in urls:
+            if limit is not None and len(added) >= limit:
+                break
+            if self.scope and url not in self.dedup and not self._in_scope(url):
+                continue
+            clean_url = self.dedup.add(url)
+            if clean_url is None:
+                linked.append(url)
+                continue
+            self._queue_insert(clean_url, depth, parent)
+            self._count += 1
+            added.append(clean_url)
+            linked.append(clean_url)
+        if self.graph is not None and parent is not None:
+            self.graph.add_links(parent, linked)
+        return added
+
+    def _in_scope(self, url: str) -> bool:
+        """Check a new URL against ``scope``, counting each rejected URL once."""
+        if url in self._rejected:
+            return False
+        if self.scope is not None and self.scope.allows(url):
+            return True
+        self._rejected.add(url)
+        return False
+
+    def ordered_urls(self) -> list[str]:
+        """Return discovered URLs in discovery order, as discovery returns them."""
+        return list(self.iter_urls())
+
+    def mark(self, url: str, status: str) -> None:
+        """Set the crawl status of a URL."""
+        raise NotImplementedError
+
+    def next_level(self) -> int | None:
+        """Return the shallowest depth that still has pending URLs."""
+        raise NotImplementedError
+
+    def pending(self, depth: int, limit: int | None = None) -> list[str]:
+        """Return pending URLs at a depth in discovery order."""
+        raise NotImplementedError
+
+    def iter_urls(self) -> Iterator[str]:
+        """Yield discovered URLs (excluding the start URL) in discovery order."""
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, int]:
+        """Count URLs by crawl status (the start URL included)."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Write buffered changes, if the frontier buffers any."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the frontier's storage."""
+        raise NotImplementedError
+
+    def _queue_insert(self, url: str, depth: int, parent: str | None) -> None:
+        raise NotImplementedError
+
+
+class CrawlFrontier(Frontier):
+    """SQLite-backed discovery frontier with batched writes.
+
+    The start URL is stored at depth 0 and is never part of the ordered output,
+    matching the existing discovery contract. Pass ``":memory:"`` as the path for
+    a throwaway frontier that behaves identically without touching disk.
+
+    Attributes:
+        path: Database location (or ":memory:")
+        start_url: Root URL of the crawl
+        batch_size: Number of buffered writes that triggers a commit
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        start_url: str,
+        batch_size: int = DEFAULT_FRONTIER_BATCH_SIZE,
+        dedup: UrlDeduplicator | None = None,
+        scope: ScopeRules | None = None,
+        graph: LinkGraph | None = None,
+    ):
+        super().__init__(str(path), start_url, batch_size, dedup, scope, graph)
+        self._pending_inserts: list[tuple[str, int, str | None, str]] = []
+        self._pending_updates: list[tuple[str, str]] = []
+
+        try:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise FileIOError(
+                f"Could not open frontier database: {e}",
+                filepath=self.path,
+                operation="read",
+            ) from e
+
+        stored_start = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'start_url'"
+        ).fetchone()
+        if stored_start and stored_start[0] != start_url:
+            self._conn.close()
+            raise ConfigError(
+                f"Frontier {self.path} belongs to {stored_start[0]}, not {start_url}",
+                config_key="frontier",
+                suggested_fix="Use a different --frontier file for each start URL.",
+            )
+
+        for url, depth in self._conn.execute("SELECT url, depth FROM urls"):
+            self.dedup.add(url)
+            self._count += depth > 0
+        self.resumed = bool(self.dedup)
+        if not stored_start:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('start_url', ?)",
+                    (start_url,),
+                )
+        if not self.resumed:
+            self.dedup.add(start_url)
+            self._queue_insert(start_url, 0, None)
+            self.flush()
+        else:
+            # A failed start page aborted the previous run; try it again
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE urls SET status = ? WHERE url = ? AND status = ?",
+                    (STATUS_PENDING, start_url, STATUS_FAILED),
+                )
+
+    def mark(self, url: str, status: str) -> None:
+        """Set the crawl status of a URL (buffered until the next flush)."""
+        self._pending_updates.append((status, url))
+        if len(self._pending_updates) >= self.batch_size:
+            self.flush()
+
+    def next_level(self) -> int | None:
+        """Return the shallowest depth that still has pending URLs."""
+        self.flush()
+        row = self._conn.execute(
+            "SELECT MIN(depth) FROM urls WHERE status = ?", (STATUS_PENDING,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def pending(self, depth: int, limit: int | None = None) -> list[str]:
+        """Return pending URLs at a depth in discovery order."""
+        self.flush()
+        rows = self._conn.execute(
+            "SELECT url FROM urls WHERE status = ? AND depth = ? ORDER BY id LIMIT ?",
+            (STATUS_PENDING, depth, -1 if limit is None else limit),
+        )
+        return [row[0] for row in rows]
+
+    def iter_urls(self) -> Iterator[str]:
+        """Yield discovered URLs (excluding the start URL) in discovery order."""
+        self.flush()
+        for row in self._conn.execute(
+            "SELECT url FROM urls WHERE depth > 0 ORDER BY id"
+        ):
+            yield row[0]
+
+    def stats(self) -> dict[str, int]:
+        """Count URLs by crawl status (the start URL included)."""
+        self.flush()
+        counts = {STATUS_PENDING: 0, STATUS_CRAWLED: 0, STATUS_FAILED: 0}
+        for status, count in self._conn.execute(
+            "SELECT status, COUNT(*) FROM urls GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def flush(self) -> None:
+        """Commit buffered inserts and status updates in one transaction."""
+        if not self._pending_inserts and not self._pending_updates:
+            return
+        try:
+            with self._conn:
+                if self._pending_inserts:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO urls (url, depth, parent, discovered_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        self._pending_inserts,
+                    )
+                if self._pending_updates:
+                    self._conn.executemany(
+                        "UPDATE urls SET status = ? WHERE url = ?",
+                        self._pending_updates,
+                    )
+        except sqlite3.Error as e:
+            raise FileIOError(
+                f"Could not write frontier database: {e}",
+                filepath=self.path,
+                operation="write",
+            ) from e
+        self._pending_inserts.clear()
+        self._pending_updates.clear()
+
+    def close(self) -> None:
+        """Flush outstanding writes and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def _queue_insert(self, url: str, depth: int, parent: str | None) -> None:
+        self._pending_inserts.append((url, depth, parent, datetime.now().isoformat()))
+        if len(self._pending_inserts) >= self.batch_size:
+            self.flush()
+
+
+class MemoryFrontier(Frontier):
+    """Non-persistent frontier with the same interface as ``CrawlFrontier``.
+
+    URLs, depths and statuses live in a ``UrlTable`` (a few dozen bytes per
+    URL) instead of a database. Each level's links are appended after the level
+    itself, so record order is discovery order and the next pending pages are
+    found by a cursor rather than a query. Parent pages are not stored; use a
+    ``graph`` to keep links.
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        batch_size: int = DEFAULT_FRONTIER_BATCH_SIZE,
+        dedup: UrlDeduplicator | None = None,
+        scope: ScopeRules | None = None,
+        graph: LinkGraph | None = None,
+    ):
+        super().__init__(":memory:", start_url, batch_size, dedup, scope, graph)
+        self._urls = UrlTable()
+        self._cursor = 0
+        self.dedup.add(start_url)
+        self._urls.add(start_url, depth=0)
+
+    def mark(self, url: str, status: str) -> None:
+        """Set the crawl status of a URL."""
+        index = self._urls.index(url)
+        if index is not None:
+            self._urls.statuses[index] = _STATUSES.index(status)
+
+    def next_level(self) -> int | None:
+        """Return the shallowest depth that still has pending URLs."""
+        statuses = self._urls.statuses
+        while self._cursor < len(statuses) and statuses[self._cursor]:
+            self._cursor += 1
+        if self._cursor == len(statuses):
+            return None
+        return self._urls.depths[self._cursor]
+
+    def pending(self, depth: int, limit: int | None = None) -> list[str]:
+        """Return pending URLs at a depth in discovery order."""
+        urls = []
+        for index in range(self._cursor, len(self._urls)):
+            if limit is not None and len(urls) >= limit:
+                break
+            if self._urls.depths[index] > depth:
+                break
+            if self._urls.depths[index] == depth and not self._urls.statuses[index]:
+                urls.append(self._urls[index])
+        return urls
+
+    def iter_urls(self) -> Iterator[str]:
+        """Yield discovered URLs (excluding the start URL) in discovery order."""
+        return islice(self._urls, 1, None)
+
+    def stats(self) -> dict[str, int]:
+        """Count URLs by crawl status (the start URL included)."""
+        counts = dict.fromkeys(_STATUSES, 0)
+        for code in self._urls.statuses:
+            counts[_STATUSES[code]] += 1
+        return counts
+
+    def flush(self) -> None:
+        """Nothing to write; kept for interface compatibility."""
+
+    def close(self) -> None:
+        """Nothing to release; kept for interface compatibility."""
+
+    def _queue_insert(self, url: str, depth: int, parent: str | None) -> None:
+        self._urls.add(url, depth=depth)
+
+
+def open_frontier(path: str | Path | None, start_url: str, **kwargs) -> Frontier:
+    """Open a ``CrawlFrontier`` database at ``path``, or a ``MemoryFrontier``.
+
+    Keyword arguments are passed to the frontier (``dedup``, ``scope``, ...).
+    """
+    if path is None:
+        return MemoryFrontier(start_url, **kwargs)
+    return CrawlFrontier(path, start_url, **kwargs)
+
+
+async def crawl_breadth_first(
+    frontier: Frontier,
+    fetch_links: Callable[[str], Awaitable[list[str] | None]],
+    depth: int,
+    max_pages: int | None = None,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    verbose: bool = False,
+    on_discovered: Callable[[list[str]], Awaitable[None]] | None = None,
+) -> None:
+    """Crawl pending frontier URLs level by level until ``depth`` is reached.
+
+    Pages are fetched concurrently (bounded by ``concurrency``) in chunks of
+    ``frontier.batch_size``, but their links are merged in discovery order, so
+    the result matches a sequential BFS regardless of completion order. Once
+    ``max_pages`` is reached the chunk's remaining fetches are cancelled, and
+    their pages stay pending for a resumed crawl.
+
+    Args:
+        frontier: Frontier holding the crawl state (new or resumed)
+        fetch_links: Async callable returning a page's in-scope links, or None
+            when the page could not be used
+        depth: Number of link levels to crawl (start page is level 1)
+        max_pages: Stop once the frontier holds this many discovered URLs
+        concurrency: Maximum number of pages fetched at once
+        verbose: Enable verbose logging output
+        on_discovered: Async callback receiving newly queued URLs as soon as
+            the frontier accepts them (URLs known from a resumed crawl first),
+            so scraping can start before discovery finishes
+
+    Raises:
+        Exception: Whatever ``fetch_links`` raised for the start page; failures
+            of deeper pages are recorded as ``failed`` and skipped.
+    """
+    console = CleanConsole()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(page_url: str) -> list[str] | None:
+        async with semaphore:
+            return await fetch_links(page_url)
+
+    if on_discovered is not None and len(frontier):
+        await on_discovered(frontier.ordered_urls())
+
+    while (level := frontier.next_level()) is not None and level < depth:
+        batch = frontier.pending(level, limit=frontier.batch_size)
+        tasks = [asyncio.ensure_future(fetch(page_url)) for page_url in batch]
+        try:
+            for page_url, task in zip(batch, tasks, strict=True):
+                try:
+                    links = await task
+                except Exception as e:
+                    links = e
+                if isinstance(links, Exception) or links is None:
+                    frontier.mark(page_url, STATUS_FAILED)
+                    if level == 0 and isinstance(links, Exception):
+                        frontier.flush()
+                        raise links
+                    if verbose:
+                        console.print_fetch_status(page_url, "error")
+                    continue
+
+                frontier.mark(page_url, STATUS_CRAWLED)
+                if verbose:
+                    console.print_fetch_status(page_url, "fetched")
+
+                remaining = max_pages - len(frontier) if max_pages else None
+                added = frontier.add_many(links, level + 1, page_url, limit=remaining)
+                if on_discovered is not None and added:
+                    await on_discovered(added)
+                if max_pages and len(frontier) >= max_pages:
+                    if verbose:
+                        console.print_warning(
+                            f"Reached --max-pages limit ({max_pages})"
+                        )
+                    frontier.flush()
+                    return
+        finally:
+            # Pages not needed any more (limit reached or error) are not fetched
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if verbose:
+            console.print_info(
+                f"Level {level + 1}: {len(batch)} pages crawled, "
+                f"{len(frontier)} unique links so far"
+            )
+
+    frontier.flush()
@@ -0,0 +1,204 @@
+"""
+Browserless link discovery for static documentation sites.
+
+Most documentation sites (Sphinx, MkDocs, Hugo, Jekyll) serve complete HTML, so
+launching Chromium just to read ``<a href>`` tags is wasted startup time and
+per-page latency. This module fetches pages with a pooled async HTTP client and
+streams each response through ``LinkExtractor`` without building a DOM.
+
+The start page is checked for signs of client-side rendering (almost no text,
+or an SPA mount point without usable links). When it looks JavaScript-rendered
+the whole discovery is escalated to the browser-based ``extract_links_fast``, so
+callers always get the same ordered, de-duplicated ``list[str]`` contract.
+
+Usage examples:
+    links = await extract_links_http("https://docs.python.org/3/")
+    links = await extract_links_http(url, depth=3, max_pages=1000, concurrency=16)
+    links = await extract_links_http(url, depth=5, frontier_path="docs.frontier.db")
+"""
+
+from collections.abc import Awaitable, Callable
+from html.parser import HTMLParser
+from typing import TypeVar
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config import get_http_client
+from app.constants import (
+    DEFAULT_DISCOVERY_DEPTH,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONTENT_LENGTH,
+)
+from app.fast_discovery import SharedCrawler, extract_links_fast
+from app.frontier import crawl_breadth_first, open_frontier
+from app.link_graph import LinkGraph
+from app.utils.dedup import UrlDeduplicator
+from app.utils.html_scan import LinkExtractor, looks_js_rendered
+from app.utils.logging import CleanConsole, get_logger
+from app.utils.scope import ScopeRules
+from app.utils.url_helpers import clean_url_for_display
+
+logger = get_logger("http_discovery")
+
+ParserT = TypeVar("ParserT", bound=HTMLParser)
+
+
+async def extract_links_http(
+    start_url: str,
+    verbose: bool = False,
+    depth: int = DEFAULT_DISCOVERY_DEPTH,
+    max_pages: int | None = None,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    frontier_path: str | None = None,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+    graph: LinkGraph | None = None,
+    on_discovered: Callable[[list[str]], Awaitable[None]] | None = None,
+    browser: SharedCrawler | None = None,
+) -> list[str]:
+    """
+    Discover internal links over plain HTTP, escalating to a browser if needed.
+
+    Args:
+        start_url: The starting URL to scan for links
+        verbose: Enable verbose logging output
+        depth: Number of link levels to crawl (1 = start page only)
+        max_pages: Stop once this many unique URLs have been discovered
+        concurrency: Maximum number of pages fetched at once
+        frontier_path: SQLite file that persists crawl state so an interrupted
+            discovery can be resumed (None keeps it in memory)
+        dedup: Canonical seen-set for discovered URLs (exact set when None)
+        scope: Include/exclude rules applied to links before they are queued
+        graph: Records every internal link between accepted pages
+        on_discovered: Async callback receiving URLs as they are discovered
+        browser: Browser to use if discovery escalates (launched on demand)
+
+    Returns:
+        Ordered list of unique internal URLs in breadth-first discovery order
+
+    Raises:
+        InvalidUrlError: If escalated and the browser cannot process the URL
+        NetworkError: If escalated and the browser crawl fails
+    """
+    console = CleanConsole()
+
+    if verbose:
+        console.print_phase(
+            "DISCOVERY",
+            f"Fetching {clean_url_for_display(start_url)} over HTTP (no browser)",
+        )
+
+    async with get_http_client(max_connections=concurrency) as client:
+        start_page = await fetch_parsed(client, start_url)
+
+        if start_page is None or looks_js_rendered(start_page):
+            reason = (
+                "start page could not be fetched over HTTP"
+                if start_page is None
+                else "start page looks JavaScript-rendered"
+            )
+            if verbose:
+                console.print_warning(f"{reason.capitalize()}, using browser crawl")
+            logger.info(f"Escalating discovery of {start_url} to browser: {reason}")
+            return await extract_links_fast(
+                start_url,
+                verbose,
+                depth=depth,
+                max_pages=max_pages,
+                concurrency=concurrency,
+                frontier_path=frontier_path,
+                dedup=dedup,
+                scope=scope,
+                graph=graph,
+                on_discovered=on_discovered,
+                browser=browser,
+            )
+
+        # Accept the host we asked for and the one we were redirected to
+        hosts = {
+            urlparse(start_url).netloc.lower(),
+            urlparse(start_page.base_url).netloc.lower(),
+        }
+        prefetched = {start_url: start_page}
+
+        async def fetch_links(page_url: str) -> list[str] | None:
+            page = prefetched.pop(page_url, None) or await fetch_parsed(
+                client, page_url
+            )
+            if page is None:
+                return None
+            return [
+                link for link in page.links if urlparse(link).netloc.lower() in hosts
+            ]
+
+        with open_frontier(
+            frontier_path,
+            start_url,
+            dedup=dedup,
+            scope=scope,
+            graph=graph,
+        ) as frontier:
+            if frontier.resumed and verbose:
+                console.print_info(
+                    f"Resuming discovery with {len(frontier)} URLs already known"
+                )
+            await crawl_breadth_first(
+                frontier,
+                fetch_links,
+                depth,
+                max_pages,
+                concurrency,
+                verbose,
+                on_discovered,
+            )
+            ordered_links = frontier.ordered_urls()
+
+    if verbose:
+        console.print_success(
+            f"Discovery completed: {len(ordered_links)} unique internal links"
+        )
+
+    return ordered_links
+
+
+async def fetch_parsed(
+    client: httpx.AsyncClient,
+    url: str,
+    parser: Callable[[str], ParserT] = LinkExtractor,
+) -> ParserT | None:
+    """Stream one HTML page through an incremental parser.
+
+    Reading stops after MAX_CONTENT_LENGTH characters so a huge page cannot
+    stall discovery.
+
+    Args:
+        client: Pooled HTTP client
+        url: Page to fetch
+        parser: Called with the final (post-redirect) URL to create the
+            ``HTMLParser`` that is fed the page
+
+    Returns:
+        The fed parser, or None for errors, non-HTML responses and 4xx/5xx
+    """
+    try:
+        async with client.stream("GET", url) as response:
+            if response.status_code >= 400:
+                logger.debug(f"HTTP {response.status_code} for {url}")
+                return None
+            content_type = response.headers.get("content-type", "")
+            if content_type and "html" not in content_type.lower():
+                return None
+
+            extractor = parser(str(response.url))
+            read = 0
+            async for text in response.aiter_text():
+                extractor.feed(text)
+                read += len(text)
+                if read >= MAX_CONTENT_LENGTH:
+                    break
+            extractor.close()
+            return extractor
+    except httpx.HTTPError as e:
+        logger.debug(f"HTTP fetch failed for {url}: {e}")
+        return None
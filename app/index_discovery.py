@@ -0,0 +1,247 @@
+"""
+Page-index discovery from Sphinx ``objects.inv`` inventories and ``llms.txt``.
+
+Sphinx publishes ``objects.inv`` next to every site it builds, mainly for
+intersphinx cross-references. Its zlib-compressed body lists each document
+(``std:doc`` entries) with its URI, so a few kilobytes describe the whole site.
+Many documentation sites also publish ``llms.txt``, a Markdown index of their
+pages for language models. Either one yields the full URL list with a single
+small request and no page fetches at all.
+
+Both files are looked for in the start URL's directory and each parent
+directory up to the site root (``/3/library/`` finds ``/3/objects.inv`` on
+docs.python.org), all at once; the closest one wins. Only pages on the start
+URL's host and under its directory are returned, in index order with duplicates
+removed. An empty list means the site has no usable index, and the caller is
+expected to fall back to sitemaps or link crawling.
+
+Usage examples:
+    links = await extract_links_inventory("https://docs.python.org/3/")
+    links = await extract_links_llms_txt("https://docs.example.com/")
+"""
+
+import asyncio
+import re
+import zlib
+from collections.abc import Callable
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+from app.config import get_http_client
+from app.constants import INVENTORY_FILENAME, LLMS_TXT_FILENAME, MAX_INDEX_BYTES
+from app.utils.dedup import UrlDeduplicator
+from app.utils.logging import CleanConsole, get_logger
+from app.utils.scope import ScopeRules
+from app.utils.url_helpers import (
+    canonical_url_key,
+    clean_url_for_display,
+    is_under_start_url,
+)
+
+logger = get_logger("index_discovery")
+
+_INVENTORY_HEADER = b"# Sphinx inventory version 2"
+# name, domain:role, priority, uri, display name (Sphinx's own entry pattern)
+_INVENTORY_ENTRY = re.compile(r"(.+?)\s+(\S+)\s+(-?\d+)\s+?(\S*)\s+(.*)")
+_MARKDOWN_LINK = re.compile(r"\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+
+
+async def extract_links_inventory(
+    start_url: str,
+    verbose: bool = False,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+) -> list[str]:
+    """
+    Discover every document of a Sphinx site from its ``objects.inv``.
+
+    Args:
+        start_url: The documentation root; limits results to its host and path
+        verbose: Enable verbose logging output
+        dedup: Canonical seen-set for listed URLs (exact set when None)
+        scope: Include/exclude rules applied on top of the directory scope
+
+    Returns:
+        Ordered list of unique in-scope URLs, or an empty list when no
+        inventory was found
+    """
+    return await _extract_from_index(
+        start_url, INVENTORY_FILENAME, parse_inventory, verbose, dedup, scope
+    )
+
+
+async def extract_links_llms_txt(
+    start_url: str,
+    verbose: bool = False,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+) -> list[str]:
+    """
+    Discover the pages listed in a site's ``llms.txt``.
+
+    Args:
+        start_url: The documentation root; limits results to its host and path
+        verbose: Enable verbose logging output
+        dedup: Canonical seen-set for listed URLs (exact set when None)
+        scope: Include/exclude rules applied on top of the directory scope
+
+    Returns:
+        Ordered list of unique in-scope URLs, or an empty list when no
+        llms.txt was found
+    """
+    return await _extract_from_index(
+        start_url, LLMS_TXT_FILENAME, parse_llms_txt, verbose, dedup, scope
+    )
+
+
+def parse_inventory(data: bytes, base_url: str) -> list[str]:
+    """Return the document URLs listed in a Sphinx inventory, in file order.
+
+    Args:
+        data: Raw ``objects.inv`` body (four header lines, then zlib data)
+        base_url: URL of the inventory; document URIs are relative to it
+
+    Returns:
+        Absolute URLs of the ``std:doc`` entries; empty for anything that is
+        not a version 2 inventory
+    """
+    if not data.startswith(_INVENTORY_HEADER):
+        return []
+    parts = data.split(b"\n", 4)
+    if len(parts) < 5:
+        return []
+    try:
+        body = zlib.decompress(parts[4]).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError) as e:
+        logger.warning(f"Unreadable Sphinx inventory {base_url}: {e}")
+        return []
+
+    urls = []
+    for line in body.splitlines():
+        match = _INVENTORY_ENTRY.match(line.rstrip())
+        if not match:
+            continue
+        name, role, _, uri, _ = match.groups()
+        if role != "std:doc":
+            continue
+        if uri.endswith("$"):
+            uri = uri[:-1] + name
+        urls.append(urljoin(base_url, uri).split("#")[0])
+    return urls
+
+
+def parse_llms_txt(data: bytes, base_url: str) -> list[str]:
+    """Return the page URLs linked from an ``llms.txt`` file, in file order.
+
+    Links to Markdown twins of HTML pages (``page.md``, ``page.html.md``) are
+    mapped back to the page itself, since that is what gets scraped.
+
+    Args:
+        data: Raw ``llms.txt`` body
+        base_url: URL of the file, for relative links
+
+    Returns:
+        Absolute http(s) URLs of the linked pages
+    """
+    text = data.decode("utf-8", errors="replace")
+    if text.lstrip().lower().startswith(("<!doctype", "<html")):
+        # A soft-404 page rather than an index
+        return []
+    urls = []
+    for match in _MARKDOWN_LINK.finditer(text):
+        url = urljoin(base_url, match.group(1)).split("#")[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        if parsed.path.endswith(".md"):
+            url = parsed._replace(path=parsed.path[: -len(".md")]).geturl()
+        urls.append(url)
+    return urls
+
+
+async def _extract_from_index(
+    start_url: str,
+    filename: str,
+    parse: Callable[[bytes, str], list[str]],
+    verbose: bool,
+    dedup: UrlDeduplicator | None,
+    scope: ScopeRules | None,
+) -> list[str]:
+    console = CleanConsole()
+    if verbose:
+        console.print_phase(
+            "DISCOVERY",
+            f"Looking for {filename} of {clean_url_for_display(start_url)}",
+        )
+
+    candidates = _index_candidates(start_url, filename)
+    async with get_http_client(max_connections=len(candidates)) as client:
+        bodies = await asyncio.gather(
+            *(_fetch_index(client, url) for url in candidates)
+        )
+
+    for index_url, body in zip(candidates, bodies, strict=True):
+        if body is None:
+            continue
+        listed = parse(body, index_url)
+        if not listed:
+            continue
+        seen = dedup if dedup is not None else UrlDeduplicator()
+        start_key = canonical_url_key(start_url)
+        ordered_links = []
+        for url in listed:
+            if not is_under_start_url(url, start_url):
+                continue
+            if canonical_url_key(url) == start_key:
+                continue
+            if scope and not scope.allows(url):
+                continue
+            if clean_url := seen.add(url):
+                ordered_links.append(clean_url)
+        logger.info(f"{index_url} lists {len(listed)} pages")
+        if verbose:
+            console.print_success(
+                f"{filename} discovery completed: {len(ordered_links)} unique URLs "
+                f"from {clean_url_for_display(index_url)}"
+            )
+        return ordered_links
+
+    if verbose:
+        console.print_warning(f"No {filename} found")
+    return []
+
+
+def _index_candidates(start_url: str, filename: str) -> list[str]:
+    """Index locations in the start URL's directory and each parent, nearest first."""
+    path = urlparse(start_url).path
+    directory = path[: path.rfind("/") + 1] or "/"
+    candidates = []
+    while True:
+        candidates.append(urljoin(start_url, directory + filename))
+        if directory == "/":
+            return candidates
+        directory = directory[: directory.rstrip("/").rfind("/") + 1]
+
+
+async def _fetch_index(client: httpx.AsyncClient, url: str) -> bytes | None:
+    """GET an index file; None when it is missing or served as an HTML page."""
+    try:
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                return None
+            content_type = response.headers.get("content-type", "").lower()
+            if "html" in content_type:
+                return None
+            chunks = []
+            read = 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                read += len(chunk)
+                if read >= MAX_INDEX_BYTES:
+                    logger.warning(f"{url} is larger than {MAX_INDEX_BYTES} bytes")
+                    return None
+            return b"".join(chunks)
+    except httpx.HTTPError as e:
+        logger.debug(f"Page index unavailable at {url}: {e}")
+        return None
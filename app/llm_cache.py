@@ -0,0 +1,207 @@
+"""
+Persistent, content-addressed cache of LLM filter results.
+
+LLM filtering is the slow and paid part of a run, and its output depends only
+on its input: the page's HTML, the model, the filtering instruction and the
+chunk size. ``LlmCache`` stores the filtered Markdown under a SHA-256 of those
+four values in a SQLite database shared by all runs, so re-scraping after a
+crash, into another output directory or with the same settings elsewhere makes
+no API calls for pages whose HTML has not changed.
+
+The cache is trimmed to ``max_bytes`` of Markdown, dropping the least recently
+used entries first. Hits and misses are counted per run and in total.
+
+The database lives in ``$SCROLLSCRIBE_CACHE_DIR``, else
+``$XDG_CACHE_HOME/scrollscribe``, else ``~/.cache/scrollscribe``.
+
+Usage examples:
+    with LlmCache() as cache:
+        key = cache_key(html, "openrouter/mistralai/codestral-2501", prompt, 8192)
+        markdown = cache.get(key)
+        if markdown is None:
+            cache.put(key, markdown := await call_llm(html))
+    LlmCache().prune(100 * 1024 * 1024)   # what `scribe cache prune` does
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from app.constants import DEFAULT_LLM_CACHE_MB, LLM_CACHE_DIR_ENV, LLM_CACHE_FILENAME
+from app.utils.exceptions import FileIOError
+from app.utils.logging import get_logger
+
+logger = get_logger("llm_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    markdown TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def default_cache_path() -> Path:
+    """Return the location of the shared LLM cache database."""
+    directory = os.getenv(LLM_CACHE_DIR_ENV)
+    if not directory:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        directory = Path(base) / "scrollscribe"
+    return Path(directory) / LLM_CACHE_FILENAME
+
+
+def cache_key(html: str, model: str, instruction: str, max_tokens: int) -> str:
+    """Hash everything that determines an LLM filter result into a cache key."""
+    digest = hashlib.sha256()
+    for part in (model, instruction, str(max_tokens), html):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class LlmCache:
+    """SQLite store of filtered Markdown keyed by ``cache_key``.
+
+    Attributes:
+        path: Database location (or ":memory:")
+        max_bytes: Markdown size the cache is trimmed to after each insert
+        hits: Lookups answered from the cache since it was opened
+        misses: Lookups that found nothing since it was opened
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_bytes: int = DEFAULT_LLM_CACHE_MB * 1024 * 1024,
+    ):
+        self.path = str(path or default_cache_path())
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            raise FileIOError(
+                f"Could not open LLM cache: {e}", filepath=self.path, operation="read"
+            ) from e
+
+    def __enter__(self) -> "LlmCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached Markdown for ``key`` and mark it recently used."""
+        row = self._conn.execute(
+            "SELECT markdown FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._conn:
+            self._conn.execute(
+                "UPDATE entries SET used = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+        return row[0]
+
+    def put(self, key: str, markdown: str) -> None:
+        """Store a result, then trim the cache to ``max_bytes``.
+
+        Write errors are logged rather than raised: losing a cache entry only
+        costs a repeated LLM call later.
+        """
+        size = len(markdown.encode("utf-8"))
+        now = time.time()
+        try:
+            with self._conn:
+                previous = self._conn.execute(
+                    "SELECT size FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, markdown, size, created, used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, markdown, size, now, now),
+                )
+            self._bytes += size - (previous[0] if previous else 0)
+            if self._bytes > self.max_bytes:
+                self.prune(self.max_bytes)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write LLM cache {self.path}: {e}")
+
+    def prune(self, max_bytes: int) -> tuple[int, int]:
+        """Drop least recently used entries until at most ``max_bytes`` remain.
+
+        Returns:
+            Number of entries removed and bytes of Markdown freed
+        """
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        doomed = []
+        freed = 0
+        if total > max_bytes:
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY used"
+            ):
+                doomed.append((key,))
+                freed += size
+                if total - freed <= max_bytes:
+                    break
+        with self._conn:
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self._bytes = total - freed
+        if doomed:
+            logger.debug(f"LLM cache evicted {len(doomed)} entries ({freed:,} bytes)")
+        return len(doomed), freed
+
+    def stats(self) -> dict[str, int | float | None]:
+        """Return size and hit statistics, lifetime totals including this run."""
+        entries, size, oldest = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(used) FROM entries"
+        ).fetchone()
+        totals = dict(self._conn.execute("SELECT key, value FROM meta"))
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": totals.get("hits", 0) + self.hits,
+            "misses": totals.get("misses", 0) + self.misses,
+            "oldest_used": oldest,
+        }
+
+    def close(self) -> None:
+        """Add this run's hits and misses to the lifetime totals and close."""
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+                    [("hits", self.hits), ("misses", self.misses)],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save LLM cache statistics: {e}")
+        finally:
+            self._conn.close()
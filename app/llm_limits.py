@@ -0,0 +1,117 @@
+"""
+Requests-per-minute and tokens-per-minute limits for LLM filtering.
+
+LLM providers meter each API key by requests and tokens per minute, and answer
+with 429s (and growing retry delays) once either budget is spent. With several
+pages filtered at once, ScrollScribe paces its own calls instead: every LLM
+request first takes its share of both budgets from a token bucket that refills
+continuously, so a burst of pages is spread evenly over the minute.
+
+Limiters are shared per provider (the part of the model name before the first
+``/``, e.g. ``openrouter``), since that is what the quota belongs to, not the
+individual model.
+
+Usage examples:
+    limiter = rate_limiter_for("openrouter/mistralai/codestral-2501", rpm=60)
+    await limiter.acquire(requests=2, tokens=12_000)  # before the LLM calls
+"""
+
+import asyncio
+
+from .utils.logging import get_logger
+
+logger = get_logger("llm_limits")
+
+_limiters: dict[str, "LlmRateLimiter"] = {}
+
+
+class LlmRateLimiter:
+    """Token buckets for one provider's requests and tokens per minute.
+
+    Attributes:
+        rpm: Requests allowed per minute, or None for no limit
+        tpm: Tokens allowed per minute, or None for no limit
+        waited: Total seconds callers spent waiting for budget
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.waited = 0.0
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """Wait until ``requests`` calls using ``tokens`` tokens fit the limits.
+
+        Callers are served in arrival order. A single call larger than a whole
+        minute's budget waits for a full bucket rather than forever.
+        """
+        if not self.rpm and not self.tpm:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    if self.rpm:
+                        self._requests = min(
+                            self.rpm, self._requests + elapsed * self.rpm / 60
+                        )
+                    if self.tpm:
+                        self._tokens = min(
+                            self.tpm, self._tokens + elapsed * self.tpm / 60
+                        )
+                self._updated = now
+                delay = max(
+                    _shortfall(self._requests, requests, self.rpm),
+                    _shortfall(self._tokens, tokens, self.tpm),
+                )
+                if delay <= 0:
+                    break
+                self.waited += delay
+                await asyncio.sleep(delay)
+            if self.rpm:
+                self._requests -= min(requests, self.rpm)
+            if self.tpm:
+                self._tokens -= min(tokens, self.tpm)
+
+
+def provider_of(model: str) -> str:
+    """Return the provider part of a LiteLLM model name (``openai/gpt-4o`` → ``openai``)."""
+    return model.split("/", 1)[0].lower() if "/" in model else "openai"
+
+
+def rate_limiter_for(
+    model: str, rpm: int | None = None, tpm: int | None = None
+) -> LlmRateLimiter:
+    """Return the limiter shared by every model of ``model``'s provider.
+
+    The first call for a provider sets its limits; later calls with different
+    limits replace them, so the most recent configuration wins.
+    """
+    provider = provider_of(model)
+    limiter = _limiters.get(provider)
+    if limiter is None or (limiter.rpm, limiter.tpm) != (rpm, tpm):
+        if rpm or tpm:
+            logger.info(
+                f"Pacing {provider} LLM calls to "
+                + ", ".join(
+                    f"{value:,} {unit}/min"
+                    for value, unit in ((rpm, "requests"), (tpm, "tokens"))
+                    if value
+                )
+            )
+        limiter = _limiters[provider] = LlmRateLimiter(rpm, tpm)
+    return limiter
+
+
+def _shortfall(available: float, wanted: int, per_minute: int | None) -> float:
+    """Seconds until a bucket holding ``available`` can cover ``wanted``."""
+    if not per_minute:
+        return 0.0
+    missing = min(wanted, per_minute) - available
+    return missing * 60 / per_minute if missing > 0 else 0.0
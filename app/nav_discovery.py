@@ -0,0 +1,230 @@
+"""
+Navigation-first URL discovery that keeps the documentation's reading order.
+
+Sphinx, MkDocs, Docusaurus and most other generators render the complete table
+of contents into every page's sidebar, in the order the authors want it read.
+Link crawling throws that away (navigation chrome is excluded) and rebuilds
+the page list from whatever body links exist, which costs one fetch per page.
+
+``extract_nav_toc`` reads the sidebar of the start page over plain HTTP, then
+spot-checks the navigation of a few pages spread across the tree. If they list
+nothing new, the TOC is complete and discovery is done after a handful of
+requests. Themes that collapse the sidebar to the current section reveal more
+entries on other pages; those are merged in right after the entry that led to
+them, reading each page's navigation until no new pages appear.
+
+An empty result means the start page has no usable navigation tree, and the
+caller is expected to fall back to link crawling.
+
+Usage examples:
+    toc = await extract_nav_toc("https://docs.djangoproject.com/en/5.2/")
+    urls = [entry.url for entry in toc]
+    save_toc(toc, "toc.md")
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from urllib.parse import urlparse
+
+from app.config import get_http_client
+from app.constants import MAX_CONCURRENT_REQUESTS, NAV_CHECK_PAGES, NAV_MIN_PAGES
+from app.http_discovery import fetch_parsed
+from app.utils.dedup import UrlDeduplicator
+from app.utils.exceptions import FileIOError
+from app.utils.html_scan import TocEntry, TocExtractor
+from app.utils.logging import CleanConsole, get_logger
+from app.utils.scope import ScopeRules
+from app.utils.url_helpers import canonical_url_key, clean_url_for_display
+
+logger = get_logger("nav_discovery")
+
+
+class _TocTree:
+    """Ordered, de-duplicated TOC that merges partial navigation trees.
+
+    Entries live in a linked list keyed by canonical URL, so inserting the
+    children revealed by an expanded sidebar after their parent is O(1).
+    """
+
+    def __init__(self, dedup: UrlDeduplicator, scope: ScopeRules, hosts: set[str]):
+        self.dedup = dedup
+        self.scope = scope
+        self.hosts = hosts
+        self._entries: dict[str, TocEntry] = {}
+        self._next: dict[str | None, str | None] = {None: None}
+        self._rejected: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> list[TocEntry]:
+        ordered = []
+        key = self._next[None]
+        while key is not None:
+            ordered.append(self._entries[key])
+            key = self._next[key]
+        return ordered
+
+    def merge(self, entries: list[TocEntry]) -> int:
+        """Add a page's navigation tree, returning how many entries were new.
+
+        New entries are placed after the closest preceding entry that is
+        already known, so a section's children land right after it.
+        """
+        anchor: str | None = None
+        added = 0
+        for entry in entries:
+            key = canonical_url_key(entry.url)
+            if key in self._entries:
+                anchor = key
+                continue
+            if key in self._rejected or not self._accepts(entry.url):
+                self._rejected.add(key)
+                continue
+            canonical = self.dedup.add(entry.url)
+            if canonical is None:
+                self._rejected.add(key)
+                continue
+            self._entries[key] = entry._replace(url=canonical)
+            self._next[key] = self._next[anchor]
+            self._next[anchor] = key
+            anchor = key
+            added += 1
+        return added
+
+    def _accepts(self, url: str) -> bool:
+        return urlparse(url).netloc.lower() in self.hosts and self.scope.allows(url)
+
+
+async def extract_nav_toc(
+    start_url: str,
+    verbose: bool = False,
+    max_pages: int | None = None,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    dedup: UrlDeduplicator | None = None,
+    scope: ScopeRules | None = None,
+    check_pages: int = NAV_CHECK_PAGES,
+) -> list[TocEntry]:
+    """
+    Discover documentation pages from the site's navigation tree.
+
+    Args:
+        start_url: Page whose sidebar holds the table of contents
+        verbose: Enable verbose logging output
+        max_pages: Stop once this many pages are in the TOC
+        concurrency: Maximum number of pages fetched at once
+        dedup: Canonical seen-set for discovered URLs (exact set when None)
+        scope: Include/exclude rules applied to TOC entries
+        check_pages: Pages whose navigation is compared with the start page's
+            to decide whether its TOC is complete
+
+    Returns:
+        TOC entries in reading order, or an empty list when the start page has
+        no navigation tree with at least NAV_MIN_PAGES internal pages
+    """
+    console = CleanConsole()
+    dedup = dedup if dedup is not None else UrlDeduplicator()
+    scope = scope if scope is not None else ScopeRules()
+
+    if verbose:
+        console.print_phase(
+            "DISCOVERY",
+            f"Reading the navigation of {clean_url_for_display(start_url)}",
+        )
+
+    async with get_http_client(max_connections=concurrency) as client:
+        start_page = await fetch_parsed(client, start_url, TocExtractor)
+        if start_page is None:
+            return []
+        hosts = {
+            urlparse(start_url).netloc.lower(),
+            urlparse(start_page.base_url).netloc.lower(),
+        }
+        sidebar = _main_toc(start_page, hosts)
+        if len({canonical_url_key(entry.url) for entry in sidebar}) < NAV_MIN_PAGES:
+            logger.info(f"No navigation tree found on {start_url}")
+            return []
+
+        tree = _TocTree(dedup, scope, hosts)
+        tree.merge(sidebar)
+        visited = {canonical_url_key(start_url), canonical_url_key(start_page.base_url)}
+
+        async def read_navigation(urls: list[str]) -> int:
+            visited.update(canonical_url_key(url) for url in urls)
+            pages = await asyncio.gather(
+                *(fetch_parsed(client, url, TocExtractor) for url in urls)
+            )
+            return sum(
+                tree.merge(_main_toc(page, hosts)) for page in pages if page is not None
+            )
+
+        # Complete TOCs look the same from every page; collapsed ones do not
+        entries = tree.entries()
+        step = max(1, len(entries) // (check_pages + 1))
+        sample = [entry.url for entry in entries[step::step][:check_pages]]
+        fetched = 1 + len(sample)
+        if await read_navigation(sample):
+            if verbose:
+                console.print_info(
+                    "Sidebar is collapsed, reading the navigation of each section"
+                )
+            while max_pages is None or len(tree) < max_pages:
+                pending = [
+                    entry.url
+                    for entry in tree.entries()
+                    if canonical_url_key(entry.url) not in visited
+                ][:concurrency]
+                if not pending:
+                    break
+                fetched += len(pending)
+                await read_navigation(pending)
+
+    toc = tree.entries()[:max_pages] if max_pages else tree.entries()
+    logger.info(f"Navigation TOC of {start_url}: {len(toc)} pages, {fetched} fetches")
+    if verbose:
+        console.print_success(
+            f"Navigation TOC: {len(toc)} pages from {fetched} page fetches"
+        )
+    return toc
+
+
+def _main_toc(page: TocExtractor, hosts: set[str]) -> list[TocEntry]:
+    """Pick the navigation container with the most internal pages.
+
+    Levels are shifted so the container's shallowest entries are level 1.
+    """
+    best: list[TocEntry] = []
+    best_count = 0
+    for container in page.containers:
+        internal = [e for e in container if urlparse(e.url).netloc.lower() in hosts]
+        count = len({canonical_url_key(e.url) for e in internal})
+        if count > best_count:
+            best, best_count = internal, count
+    if not best:
+        return []
+    top = min(entry.level for entry in best)
+    return [entry._replace(level=entry.level - top + 1) for entry in best]
+
+
+def save_toc(entries: list[TocEntry], path: str | Path) -> None:
+    """Export a navigation tree.
+
+    ``.json`` files get a list of ``{"url", "title", "level"}`` objects; any
+    other extension gets a nested Markdown list of links.
+    """
+    path = Path(path)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            if path.suffix.lower() == ".json":
+                json.dump([entry._asdict() for entry in entries], f, indent=2)
+                return
+            for entry in entries:
+                indent = "  " * (entry.level - 1)
+                f.write(f"{indent}- [{entry.title or entry.url}]({entry.url})\n")
+    except OSError as e:
+        raise FileIOError(
+            f"Could not save navigation TOC: {e}",
+            filepath=str(path),
+            operation="write",
+        ) from e
@@ -0,0 +1,133 @@
+"""
+Streaming hand-offs between the phases of ``scribe process``.
+
+Run sequentially, ``process`` discovers every URL, writes them to a temporary
+file, reads it back and only then starts scraping, so its wall time is the sum
+of both phases. ``UrlChannel`` connects the two directly instead: discovery
+puts each newly accepted URL into a bounded queue and the processors start
+fetching it straight away, so a deep crawl takes roughly as long as the slower
+of the two phases.
+
+``Stage`` applies the same idea inside LLM mode: fetching, LLM filtering and
+writing each run in their own workers, connected by bounded queues. A full
+queue blocks the stage feeding it, so a slow LLM pauses fetching instead of
+piling pages up in memory, and the run takes about as long as its slowest stage.
+
+Usage examples:
+    channel = UrlChannel()
+    producer = asyncio.create_task(discover(on_discovered=channel.put_many))
+    summary = await process_urls_fast(channel, args, output_dir, browser_config)
+
+    async with Stage(write_page, concurrency=1, maxsize=32) as writes:
+        await writes.put(page)                 # waits while 32 pages are queued
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Generic, TypeVar
+
+from .constants import PIPELINE_QUEUE_SIZE
+from .utils.logging import get_logger
+
+logger = get_logger("pipeline")
+
+T = TypeVar("T")
+
+
+class UrlChannel:
+    """Bounded, de-duplicating async queue of URLs with an end-of-stream marker.
+
+    Producers await ``put_many`` (which blocks while the queue is full) and call
+    ``close`` when done; the consumer iterates with ``async for`` until then.
+
+    Attributes:
+        start_at: Number of leading URLs dropped, mirroring ``--start-at``
+    """
+
+    def __init__(self, maxsize: int = PIPELINE_QUEUE_SIZE, start_at: int = 0):
+        self.start_at = max(0, start_at)
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize)
+        self._seen: set[str] = set()
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of URLs queued for the consumer so far."""
+        return max(0, len(self._seen) - self.start_at)
+
+    async def put_many(self, urls: Iterable[str]) -> None:
+        """Queue the URLs not seen before, in order."""
+        for url in urls:
+            if url in self._seen or self._closed:
+                continue
+            self._seen.add(url)
+            if len(self._seen) > self.start_at:
+                await self._queue.put(url)
+
+    def close(self) -> None:
+        """Mark the end of the stream; queued URLs are still delivered."""
+        self._closed = True
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass  # the consumer stops once it has drained the full queue
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        while not (self._closed and self._queue.empty()):
+            url = await self._queue.get()
+            if url is None:
+                return
+            yield url
+
+
+class Stage(Generic[T]):
+    """Bounded queue of work items drained by a fixed pool of worker tasks.
+
+    Used as an async context manager: entering starts the workers, and leaving
+    lets them finish every queued item (or cancels them if the block raised).
+    ``handle`` is expected to deal with its own failures; an exception that
+    escapes it is logged and the worker moves on to the next item.
+
+    Attributes:
+        concurrency: Number of items handled at once
+        handled: Items taken off the queue and handled so far
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[T], Awaitable[None]],
+        concurrency: int = 1,
+        maxsize: int = PIPELINE_QUEUE_SIZE,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.handled = 0
+        self._handle = handle
+        self._queue: asyncio.Queue[tuple[T] | None] = asyncio.Queue(max(1, maxsize))
+        self._workers: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> "Stage[T]":
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.concurrency)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            for _ in self._workers:
+                await self._queue.put(None)
+            await asyncio.gather(*self._workers)
+        else:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def put(self, item: T) -> None:
+        """Queue an item, waiting while the queue is full."""
+        await self._queue.put((item,))
+
+    async def _work(self) -> None:
+        while (entry := await self._queue.get()) is not None:
+            try:
+                await self._handle(entry[0])
+            except Exception as e:
+                logger.error(f"Pipeline stage worker failed: {e}")
+            self.handled += 1
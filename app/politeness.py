@@ -0,0 +1,317 @@
+"""
+Per-host politeness scheduling for page fetches.
+
+Each host gets its own token bucket: up to ``burst`` requests may go out back
+to back, after which requests are spaced at ``rate`` per second. A host's
+robots.txt is fetched once (and cached for the scheduler's lifetime); its
+``Crawl-delay`` or ``Request-rate`` for our user agent slows that host down
+further. Hosts never wait on each other, so a multi-host URL list finishes in
+roughly the time the slowest host's policy needs, not the sum of all delays.
+
+Usage examples:
+    async with HostScheduler(rate=2.0) as scheduler:
+        await scheduler.acquire(url)          # wait for this host's next slot
+        await scheduler.wait(url)             # ... without taking it yet
+        async for index, url, result in stream_politely(crawler, channel, ...):
+            ...                                # pages as soon as they are ready
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
+
+from .config import get_http_client
+from .constants import (
+    DEFAULT_HOST_BURST,
+    DEFAULT_HOST_RATE,
+    HTTP_USER_AGENT,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CRAWL_DELAY,
+)
+from .utils.logging import get_logger
+
+logger = get_logger("politeness")
+
+
+@dataclass
+class _HostBucket:
+    """Token bucket state for one host."""
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+    lock: asyncio.Lock
+
+
+class HostScheduler:
+    """Token-bucket rate limiter keyed by host, honouring robots.txt delays.
+
+    Attributes:
+        rate: Default requests per second per host
+        burst: Default bucket size per host
+        respect_robots: Whether robots.txt Crawl-delay/Request-rate are applied
+        waited: Total seconds spent waiting for slots, across all hosts
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_HOST_RATE,
+        burst: int = DEFAULT_HOST_BURST,
+        respect_robots: bool = True,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.respect_robots = respect_robots
+        self.waited = 0.0
+        self._client = client
+        self._owns_client = client is None and respect_robots
+        self._buckets: dict[str, _HostBucket] = {}
+        self._bucket_locks: dict[str, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "HostScheduler":
+        if self._owns_client:
+            self._client = get_http_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def acquire(self, url: str) -> None:
+        """Wait until the URL's host may receive another request, and take it."""
+        bucket = await self._bucket_for(url)
+        async with bucket.lock:
+            await self._wait_for_token(bucket)
+            bucket.tokens -= 1
+
+    async def wait(self, url: str) -> None:
+        """Wait until the URL's host may receive another request, without taking it.
+
+        Lets callers sit out a host's delay before claiming a scarcer resource,
+        then ``acquire`` right before the request is sent.
+        """
+        bucket = await self._bucket_for(url)
+        async with bucket.lock:
+            await self._wait_for_token(bucket)
+
+    async def _wait_for_token(self, bucket: _HostBucket) -> None:
+        """Refill ``bucket`` and sleep until it holds a whole token."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        bucket.tokens = min(
+            bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate
+        )
+        bucket.updated = now
+        if bucket.tokens < 1:
+            delay = (1 - bucket.tokens) / bucket.rate
+            self.waited += delay
+            await asyncio.sleep(delay)
+            bucket.updated = loop.time()
+            bucket.tokens = 1.0
+
+    def host_rate(self, url: str) -> float | None:
+        """Return the effective rate for a URL's host, if it was seen already."""
+        bucket = self._buckets.get(_host_key(url))
+        return bucket.rate if bucket else None
+
+    async def _bucket_for(self, url: str) -> _HostBucket:
+        host = _host_key(url)
+        if host in self._buckets:
+            return self._buckets[host]
+
+        # One robots.txt fetch per host, even when many URLs arrive at once
+        lock = self._bucket_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            if host not in self._buckets:
+                rate, capacity = self.rate, float(self.burst)
+                delay = await self._robots_delay(url) if self.respect_robots else None
+                if delay:
+                    rate, capacity = min(rate, 1 / delay), 1.0
+                    logger.info(f"{host} asks for {delay:g}s between requests")
+                self._buckets[host] = _HostBucket(
+                    rate=rate,
+                    capacity=capacity,
+                    tokens=capacity,
+                    updated=asyncio.get_running_loop().time(),
+                    lock=asyncio.Lock(),
+                )
+        return self._buckets[host]
+
+    async def _robots_delay(self, url: str) -> float | None:
+        """Fetch robots.txt and return the delay it requests, in seconds."""
+        if self._client is None:
+            return None
+        parsed = urlparse(url)
+        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        try:
+            response = await self._client.get(robots_url)
+        except httpx.HTTPError as e:
+            logger.debug(f"Could not read {robots_url}: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+        delay = parser.crawl_delay(HTTP_USER_AGENT)
+        request_rate = parser.request_rate(HTTP_USER_AGENT)
+        if request_rate and request_rate.requests:
+            rate_delay = request_rate.seconds / request_rate.requests
+            delay = max(float(delay or 0), rate_delay)
+        if not delay:
+            return None
+        if float(delay) > MAX_CRAWL_DELAY:
+            logger.warning(
+                f"{robots_url} asks for a {delay}s crawl delay, "
+                f"capping at {MAX_CRAWL_DELAY:g}s"
+            )
+            return MAX_CRAWL_DELAY
+        return float(delay)
+
+
+async def stream_politely(
+    crawler: AsyncWebCrawler,
+    urls: Iterable[str] | AsyncIterable[str],
+    config: CrawlerRunConfig,
+    scheduler: HostScheduler,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+    skip: Callable[[str], Awaitable[bool]] | None = None,
+    timings: dict[str, float] | None = None,
+) -> AsyncIterator[tuple[int, str, CrawlResult | Exception | None]]:
+    """Fetch pages as they arrive and yield each one as soon as it is ready.
+
+    Replaces ``crawler.arun_many`` for scraping: every request first waits
+    for its host's next slot. ``urls`` may be an async iterable that
+    discovery is still filling, and results are yielded in completion order
+    together with their input index. A fetch slot is only given back
+    once the consumer has taken the page, so a slow consumer (such as the LLM
+    filter) holds at most ``concurrency`` fetched pages in memory.
+
+    URLs are taken from ``urls`` by a pool of ``concurrency`` skip checkers,
+    and at most ``concurrency`` checked URLs may wait for their host or be
+    fetching at once (a skipped URL counts until the consumer takes it). Input
+    is therefore only read as fast as pages are fetched and consumed, so a
+    bounded producer such as ``UrlChannel`` blocks instead of being drained.
+
+    Args:
+        crawler: Open crawler shared by all fetches
+        urls: Pages to fetch, possibly still being produced
+        config: Run configuration applied to every page
+        scheduler: Per-host scheduler deciding when each request may start
+        concurrency: Maximum number of pages fetched but not yet consumed
+        skip: Async predicate checked before fetching; URLs it accepts are
+            yielded with a ``None`` result instead of being fetched
+        timings: Filled with the seconds each page's fetch took, by URL
+
+    Yields:
+        ``(index, url, result)`` where ``result`` is the CrawlResult, ``None``
+        for skipped URLs, or the exception the crawler raised for that page
+    """
+    slots = max(1, concurrency)
+    semaphore = asyncio.Semaphore(slots)
+    routed = asyncio.Semaphore(slots)
+    ready: asyncio.Queue = asyncio.Queue()
+    host_queues: dict[str, asyncio.Queue[tuple[int, str] | None]] = {}
+    tasks: set[asyncio.Task] = set()
+    finished = object()
+
+    def spawn(coro: Awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    async def fetch(index: int, url: str) -> None:
+        started = time.perf_counter()
+        try:
+            result = await crawler.arun(url, config=config)
+        except Exception as e:
+            result = e
+        if timings is not None:
+            timings[url] = time.perf_counter() - started
+        routed.release()
+        ready.put_nowait((index, url, result))
+
+    async def host_worker(queue: asyncio.Queue[tuple[int, str] | None]) -> None:
+        # Sit out the host's delay before taking a fetch slot, so a slow host
+        # never holds a slot that other hosts could use. The host's token is
+        # only taken once the slot is ours, right before the request, so a wait
+        # for a slot cannot let two requests reach the host back to back.
+        fetches: set[asyncio.Task] = set()
+        while (item := await queue.get()) is not None:
+            await scheduler.wait(item[1])
+            await semaphore.acquire()
+            try:
+                await scheduler.acquire(item[1])
+            except BaseException:
+                semaphore.release()
+                raise
+            task = spawn(fetch(*item))
+            fetches.add(task)
+            task.add_done_callback(fetches.discard)
+        await asyncio.gather(*fetches)
+
+    def route(index: int, url: str) -> None:
+        host = _host_key(url)
+        if host not in host_queues:
+            host_queues[host] = asyncio.Queue()
+            workers.append(spawn(host_worker(host_queues[host])))
+        host_queues[host].put_nowait((index, url))
+
+    async def checker(pending: asyncio.Queue[tuple[int, str] | None]) -> None:
+        while (item := await pending.get()) is not None:
+            index, url = item
+            await routed.acquire()
+            if skip is not None and await skip(url):
+                ready.put_nowait((index, url, None))
+            else:
+                route(index, url)
+
+    async def feed() -> None:
+        try:
+            pending: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(slots)
+            checkers = [spawn(checker(pending)) for _ in range(slots)]
+            index = 0
+            if isinstance(urls, AsyncIterable):
+                async for url in urls:
+                    await pending.put((index, url))
+                    index += 1
+            else:
+                for url in urls:
+                    await pending.put((index, url))
+                    index += 1
+            for _ in checkers:
+                await pending.put(None)
+            await asyncio.gather(*checkers)
+            for queue in host_queues.values():
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        finally:
+            ready.put_nowait(finished)
+
+    workers: list[asyncio.Task] = []
+    feeder = spawn(feed())
+    try:
+        while (item := await ready.get()) is not finished:
+            yield item
+            if item[2] is None:
+                routed.release()
+            else:
+                semaphore.release()
+        await feeder
+    finally:
+        for task in list(tasks):
+            task.cancel()
+
+
+def _host_key(url: str) -> str:
+    return urlparse(url).netloc.lower()
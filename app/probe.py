@@ -0,0 +1,120 @@
+"""
+HEAD probes that keep non-HTML and dead URLs away from the browser.
+
+Every page handed to crawl4ai costs a browser tab, a full render and, in LLM
+mode, a model call. Discovered URL lists routinely contain downloads served
+from extension-less paths, redirects to binary assets and links that 404.
+A ``HEAD`` request answers all of these for a few hundred bytes: URLs whose
+``Content-Type`` is not HTML, or whose server answers a definitive 4xx, are
+dropped before rendering.
+
+Probes go through the per-host scheduler, so they respect the same rate limits
+and robots.txt delays as page fetches. Anything inconclusive (network errors,
+5xx, servers rejecting ``HEAD``, a missing ``Content-Type``) keeps the URL;
+the browser gets the final word.
+
+Usage examples:
+    async with UrlProber(scheduler) as prober:
+        urls = await prober.filter(urls)
+    prober.dropped  # Counter({"not html": 12, "dead": 3})
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+
+import httpx
+
+from .config import get_http_client
+from .constants import (
+    HTML_CONTENT_TYPES,
+    PROBE_CONCURRENCY,
+    PROBE_INCONCLUSIVE_STATUSES,
+)
+from .politeness import HostScheduler
+from .utils.logging import get_logger
+
+logger = get_logger("probe")
+
+_HTML_TYPES = frozenset(HTML_CONTENT_TYPES)
+_INCONCLUSIVE = frozenset(PROBE_INCONCLUSIVE_STATUSES)
+
+
+class UrlProber:
+    """Filters URL batches with concurrent ``HEAD`` requests.
+
+    Used as an async context manager that owns the HTTP client. Verdicts are
+    cached per URL, so a URL seen again in a later batch is not probed twice.
+
+    Attributes:
+        probed: HEAD requests answered so far
+        dropped: Dropped URLs counted by reason (``"not html"``, ``"dead"``)
+    """
+
+    def __init__(self, scheduler: HostScheduler, concurrency: int = PROBE_CONCURRENCY):
+        self.scheduler = scheduler
+        self.concurrency = max(1, concurrency)
+        self.probed = 0
+        self.dropped: Counter[str] = Counter()
+        self._verdicts: dict[str, bool] = {}
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def total_dropped(self) -> int:
+        return sum(self.dropped.values())
+
+    async def __aenter__(self) -> "UrlProber":
+        self._client = get_http_client(max_connections=self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.probed:
+            logger.debug(
+                f"HEAD probes dropped {self.total_dropped}/{self.probed} URLs "
+                f"({dict(self.dropped)})"
+            )
+
+    async def filter(self, urls: Iterable[str]) -> list[str]:
+        """Return the URLs worth rendering, in their original order."""
+        urls = list(urls)
+        pending = list(dict.fromkeys(u for u in urls if u not in self._verdicts))
+        await asyncio.gather(*(self._probe(url) for url in pending))
+        return [url for url in urls if self._verdicts.get(url, True)]
+
+    async def _probe(self, url: str) -> None:
+        if self._client is None:
+            return
+        async with self._semaphore:
+            # Take the host's token only once a slot is free, so probes queued
+            # on the semaphore cannot fire together with tokens spent earlier
+            await self.scheduler.acquire(url)
+            try:
+                response = await self._client.head(url)
+            except httpx.HTTPError as e:
+                logger.debug(f"HEAD probe failed for {url}: {e}")
+                self._verdicts[url] = True
+                return
+        self.probed += 1
+        reason = _drop_reason(response)
+        if reason:
+            logger.debug(f"Dropping {url}: {reason} ({response.status_code})")
+            self.dropped[reason] += 1
+        self._verdicts[url] = reason is None
+
+
+def _drop_reason(response: httpx.Response) -> str | None:
+    """Why a HEAD response rules its URL out, or None to keep it."""
+    status = response.status_code
+    if 400 <= status < 500 and status not in _INCONCLUSIVE:
+        return "dead"
+    if not response.is_success:
+        return None
+    content_type = response.headers.get("content-type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in _HTML_TYPES:
+        return "not html"
+    return None
@@ -5,6 +5,7 @@ Provides high-quality Markdown conversion using advanced LLM filtering, robust r
 
 Key features:
 - Batch processing of documentation URLs with LLM-based content filtering
+- Fetch, LLM and write stages that overlap, with back-pressure between them
 - Compatible with existing CleanConsole logging system
 - Integrates standardized exception and retry handling
 - Converts relative links to absolute URLs and generates safe filenames
@@ -17,19 +18,20 @@ Note:
 """
 
 import asyncio
+import math
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
 from urllib.parse import urljoin
 
 from crawl4ai import (
-    AsyncWebCrawler,
     BrowserConfig,
     CacheMode,
     CrawlerRunConfig,
-    CrawlResult,
 )
 from crawl4ai.content_filter_strategy import LLMContentFilter
 from rich.progress import (
@@ -45,10 +47,28 @@ from rich.progress import (
 from rich.text import Text
 
 # from .constants import DEFAULT_EXTENSION, MAX_FILENAME_LENGTH, URL_DISPLAY_MAX_LENGTH
+from .adaptive import AdaptiveCrawler, open_crawler
+from .constants import (
+    CHARS_PER_TOKEN,
+    DEFAULT_HOST_RATE,
+    DEFAULT_LLM_CONCURRENCY,
+    DEFAULT_RENDER_MODE,
+    LLM_QUEUE_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    WRITE_QUEUE_SIZE,
+)
+from .llm_cache import LlmCache, cache_key
+from .llm_limits import LlmRateLimiter, rate_limiter_for
+from .pipeline import Stage, UrlChannel
+from .politeness import HostScheduler, stream_politely
+from .redirects import RedirectMap, final_page_url
+from .revalidation import Revalidator, ValidatorStore, settings_variant
+from .utils.dedup import UrlDeduplicator
 from .utils.exceptions import FileIOError, LLMError, ProcessingError
 from .utils.logging import CleanConsole, get_logger
 from .utils.retry import retry_llm
 from .utils.url_helpers import clean_url_for_display, url_to_filename
+from .utils.url_table import UrlTable
 
 logger = get_logger("processing")
 clean_console = CleanConsole()  # This handles noisy library silencing
@@ -93,14 +113,15 @@ class RateColumn(ProgressColumn):
         return Text(f"{seconds_per_item:.2f} s/item", style="#6e6a86")
 
 
-def read_urls_from_file(filepath: str) -> list[str]:
+def read_urls_from_file(filepath: str) -> UrlTable:
     """Read a list of URLs from a text file.
 
     Args:
         filepath (str): Path to the text file containing URLs, one per line.
 
     Returns:
-        list[str]: A list of valid URLs extracted from the file.
+        UrlTable: The valid URLs extracted from the file, in file order. The
+        table is a compact sequence; indexing or slicing it builds strings.
 
     Raises:
         FileIOError: If the file cannot be read.
@@ -108,8 +129,18 @@ def read_urls_from_file(filepath: str) -> list[str]:
     Notes:
         - Lines that do not contain a valid URL are skipped with a warning.
         - Only URLs starting with http:// or https:// are considered valid.
+        - URLs are canonicalized and duplicates (by canonical form) are dropped,
+          keeping the first occurrence.
     """
-    urls: list[str] = []
+    # No list of strings is built: the de-duplication keys and the URLs are
+    # each kept in a compact UrlTable, and the URL table is the result
+    dedup = UrlDeduplicator()
+    urls = UrlTable()
+
+    def add(url: str) -> None:
+        if clean_url := dedup.add(url):
+            urls.add(clean_url)
+
     logger.info(f"Reading URLs from: {filepath}")
 
     # Detect file type by extension
@@ -139,7 +170,7 @@ def read_urls_from_file(filepath: str) -> list[str]:
                         continue
                     url = row[url_column_index].strip()
                     if url:
-                        urls.append(url)
+                        add(url)
             elif file_suffix == ".json":
                 # Handle JSON files
                 import json
@@ -149,9 +180,21 @@ def read_urls_from_file(filepath: str) -> list[str]:
                 if isinstance(data, list):
                     for item in data:
                         if isinstance(item, dict) and "url" in item:
-                            urls.append(item["url"])
+                            add(item["url"])
                         elif isinstance(item, str):
-                            urls.append(item)
+                            add(item)
+            elif file_suffix in (".ndjson", ".jsonl"):
+                # One JSON object (or string) per line, read incrementally
+                import json
+
+                for line in file_object:
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    if isinstance(item, dict) and "url" in item:
+                        add(item["url"])
+                    elif isinstance(item, str):
+                        add(item)
             else:
                 # Handle text files - existing logic
                 for line in file_object:
@@ -161,7 +204,7 @@ def read_urls_from_file(filepath: str) -> list[str]:
                     match = re.search(r"https?://\S+", cleaned_line)
                     if match:
                         url: str = match.group(0).rstrip(".,;:!?")
-                        urls.append(url)
+                        add(url)
                     else:
                         logger.warning(f"Skipping invalid line: '{cleaned_line}'")
 
@@ -176,6 +219,12 @@ def read_urls_from_file(filepath: str) -> list[str]:
             f"Failed to read file: {filepath}", filepath=filepath, operation="read"
         ) from err
 
+    if dedup.duplicates:
+        logger.warning(
+            f"Skipped {dedup.duplicates} duplicate URLs; "
+            "--start-at and file numbers count the remaining unique URLs"
+        )
+
     logger.info(f"Found {len(urls)} valid URLs in file")
     return urls
 
@@ -223,19 +272,31 @@ def read_urls_from_file(filepath: str) -> list[str]:
 #         return f"page_{index:03d}{extension}"
 
 
-@retry_llm
 async def run_llm_filter(
-    filter_instance: LLMContentFilter, html_content: str, url: str
+    filter_instance: LLMContentFilter,
+    html_content: str,
+    url: str,
+    executor: Executor | None = None,
+    limiter: LlmRateLimiter | None = None,
+    cache: LlmCache | None = None,
 ) -> str | None:
-    """Apply an LLM-based content filter to HTML content, with automatic retry and exception handling.
+    """Apply an LLM-based content filter to HTML content, with caching, automatic retry and exception handling.
 
     This function uses the provided LLMContentFilter instance to process the given HTML content,
-    returning filtered Markdown output. Retries are handled automatically via the @retry_llm decorator.
+    returning filtered Markdown output. A cached result for the same HTML, model, instruction
+    and chunk size is returned without any API call. Retries are handled automatically via the
+    @retry_llm decorator.
 
     Args:
         filter_instance (LLMContentFilter): The LLM content filter to use for processing.
         html_content (str): The HTML content to be filtered.
         url (str): The source URL of the content (used for logging and context).
+        executor (Executor | None): Long-lived pool running the synchronous
+            filter; the event loop's default executor when None.
+        limiter (LlmRateLimiter | None): Provider rate limits; every attempt,
+            retries included, waits for its estimated requests and tokens.
+        cache (LlmCache | None): Result cache checked before, and filled after,
+            the LLM call.
 
     Returns:
         str | None: The filtered Markdown content, or None if filtering fails after retries.
@@ -246,13 +307,48 @@ async def run_llm_filter(
     if not html_content:
         return None
 
-    loop = asyncio.get_event_loop()
+    key = None
+    if cache is not None:
+        key = cache_key(
+            html_content,
+            getattr(getattr(filter_instance, "llm_config", None), "provider", ""),
+            getattr(filter_instance, "instruction", None) or "",
+            getattr(filter_instance, "chunk_token_threshold", 0),
+        )
+        if (cached := cache.get(key)) is not None:
+            return cached
+
+    filtered_md = await _filter_with_retry(
+        filter_instance, html_content, url, executor, limiter
+    )
+    if cache is not None and key is not None and filtered_md:
+        cache.put(key, filtered_md)
+    return filtered_md
+
+
+@retry_llm
+async def _filter_with_retry(
+    filter_instance: LLMContentFilter,
+    html_content: str,
+    url: str,
+    executor: Executor | None,
+    limiter: LlmRateLimiter | None,
+) -> str:
+    """One attempt at filtering a page; @retry_llm repeats it on failure."""
+    if limiter is not None:
+        # The filter sends one request per chunk of chunk_token_threshold tokens
+        tokens = len(html_content) // CHARS_PER_TOKEN
+        chunk_tokens = max(1, getattr(filter_instance, "chunk_token_threshold", tokens))
+        await limiter.acquire(
+            requests=max(1, math.ceil(tokens / chunk_tokens)), tokens=tokens
+        )
+
+    loop = asyncio.get_running_loop()
 
     try:
-        with ThreadPoolExecutor() as pool:
-            filtered_chunks = await loop.run_in_executor(
-                pool, filter_instance.filter_content, html_content
-            )
+        filtered_chunks = await loop.run_in_executor(
+            executor, filter_instance.filter_content, html_content
+        )
 
         # Process successful result
         if isinstance(filtered_chunks, list):
@@ -342,26 +438,49 @@ def absolutify_links(markdown_text: str, base_url: str) -> str:
     return processed_text
 
 
+@dataclass
+class _FetchedPage:
+    """A fetched page on its way through the LLM and write stages."""
+
+    index: int
+    url: str
+    html: str
+    headers: dict | None
+    started: float
+    fetch_seconds: float
+
+
 async def process_urls_batch(
-    urls_to_scrape: list[str],
+    urls_to_scrape: list[str] | UrlChannel,
     args,
     output_dir: Path,
     llm_content_filter: LLMContentFilter,
     browser_config: BrowserConfig,
+    positions: Sequence[int] | None = None,
 ) -> dict:  # <--- CHANGE THIS LINE
     """Processes a batch of documentation URLs, converting each to filtered Markdown using an LLM content filter.
 
     This function:
+    - Runs fetching, LLM filtering and writing as separate stages connected by
+      bounded queues, so up to ``--llm-concurrency`` pages are filtered, on
+      one shared thread pool and within ``--llm-rpm``/``--llm-tpm``, while
+      the next ones are fetched.
+    - Reuses cached LLM results for HTML it has filtered before with the same
+      model and prompt (``--no-llm-cache`` turns this off).
     - Logs progress and status for each URL using CleanConsole.
     - Maintains a persistent progress display with model and URL information.
     - Handles exceptions and retries using the project's standardized utilities.
 
     Args:
-        urls_to_scrape (list[str]): List of documentation URLs to process.
+        urls_to_scrape (list[str] | UrlChannel): Documentation URLs to process,
+            or a UrlChannel that discovery is still filling.
         args: Parsed CLI arguments or configuration options.
         output_dir (Path): Directory where Markdown files will be saved.
         llm_content_filter (LLMContentFilter): Content filter for LLM-based processing.
         browser_config (BrowserConfig): Configuration for the web browser/crawler.
+        positions (Sequence[int] | None): 1-based input position of each URL,
+            used to number the output files when filtering removed some;
+            defaults to ``--start-at`` plus the URL's index.
 
     Returns:
         dict: Summary with lists of successful and failed URLs.
@@ -381,7 +500,6 @@ async def process_urls_batch(
         wait_until=args.wait,
         page_timeout=args.timeout,
         verbose=args.verbose,
-        stream=False,
     )
 
     # Create the persistent Live display like original scrollscribe.py
@@ -406,183 +524,307 @@ async def process_urls_batch(
     )
 
     # Extract base URL for header and print phase indicator
-    base_url = urls_to_scrape[0] if urls_to_scrape else "unknown"
+    streaming = not isinstance(urls_to_scrape, list)
+    total_label = "discovered" if streaming else str(len(urls_to_scrape))
+    base_url = (
+        getattr(args, "start_url", "unknown")
+        if streaming
+        else (urls_to_scrape[0] if urls_to_scrape else "unknown")
+    )
     clean_console.print_phase(
-        "PROCESSING", f"Converting {len(urls_to_scrape)} URLs to Markdown"
+        "PROCESSING", f"Converting {total_label} URLs to Markdown"
     )
-    clean_console.print_header(base_url, args.model, len(urls_to_scrape))
+    clean_console.print_header(base_url, args.model, total_label)
 
-    logger.info(f"Starting crawl for {len(urls_to_scrape)} URLs...")
+    logger.info(f"Starting crawl for {total_label} URLs...")
     success_count: int = 0
     failed_count: int = 0
     successful_urls = []
     failed_urls = []
+    unchanged_urls = []
+    page_stats: dict[str, dict[str, float]] = {}
+    fetch_times: dict[str, float] = {}
+    redirects = RedirectMap(output_dir)
     shutdown_requested: bool = False
+    validators = ValidatorStore(
+        output_dir,
+        settings_variant(fast=False, model=args.model, prompt=args.prompt),
+    )
+    llm_concurrency: int = getattr(args, "llm_concurrency", DEFAULT_LLM_CONCURRENCY)
+    # One pool for every filter call of the run, retries included
+    llm_executor = ThreadPoolExecutor(
+        max_workers=llm_concurrency, thread_name_prefix="llm-filter"
+    )
+    llm_limiter = rate_limiter_for(
+        args.model, getattr(args, "llm_rpm", None), getattr(args, "llm_tpm", None)
+    )
+    llm_cache: LlmCache | None = None
+    if getattr(args, "llm_cache", True):
+        try:
+            llm_cache = LlmCache()
+        except FileIOError as e:
+            clean_console.print_warning(f"LLM cache disabled: {e}")
 
     try:
         with clean_console.progress_bar(len(urls_to_scrape), "Processing URLs") as (
             progress,
             task,
         ):
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                # Batch fetch with session reuse (performance fix)
+            async with (
+                # A shared session lives in the browser, so it always renders
+                open_crawler(
+                    browser_config,
+                    DEFAULT_RENDER_MODE
+                    if session_id
+                    else getattr(args, "render", DEFAULT_RENDER_MODE),
+                ) as crawler,
+                HostScheduler(
+                    rate=getattr(args, "host_rate", DEFAULT_HOST_RATE)
+                ) as scheduler,
+                Revalidator(
+                    validators,
+                    scheduler,
+                    # With --render auto a changed page's response is converted
+                    on_changed=crawler.offer
+                    if isinstance(crawler, AdaptiveCrawler)
+                    else None,
+                ) as revalidator,
+            ):
                 if args.verbose:
                     progress.console.log(
-                        f"📥 [bold #9ccfd8]FETCHING[/] Downloading {len(urls_to_scrape)} pages"
+                        f"📥 [bold #9ccfd8]FETCHING[/] Downloading {total_label} pages"
                     )
 
-                all_results: list[CrawlResult] = cast(
-                    "list[CrawlResult]",
-                    await crawler.arun_many(urls_to_scrape, config=html_fetch_config),
+                revalidate = getattr(args, "revalidate", True)
+
+                async def skip_page(url: str) -> bool:
+                    # Known redirects and aliases of a claimed page are not fetched
+                    if redirects.skip_duplicate(url):
+                        return True
+                    return revalidate and await revalidator.is_unchanged(url)
+
+                # Pages unchanged since the last run skip rendering and the LLM
+                pages = stream_politely(
+                    crawler,
+                    urls_to_scrape,
+                    html_fetch_config,
+                    scheduler,
+                    # A shared browser session is a single tab
+                    concurrency=1 if session_id else MAX_CONCURRENT_REQUESTS,
+                    skip=skip_page,
+                    timings=fetch_times,
                 )
 
-                # Process each result - using CleanConsole for individual URL status
-                for loop_index, (url, result) in enumerate(
-                    zip(urls_to_scrape, all_results, strict=True)
-                ):
-                    if shutdown_requested:
-                        clean_console.print_warning(
-                            "Shutdown requested, stopping processing..."
-                        )
-                        break
-
-                    original_index: int = args.start_at + loop_index + 1
-                    len(urls_to_scrape)
-                    url_start_time = time.time()
-
-                    # Update progress bar with current URL
-                    clean_url = clean_url_for_display(url)
-                    progress.update(task, current_url=clean_url)
+                def finish(page: _FetchedPage, chars: int = 0) -> None:
+                    # Fetch plus conversion time, for --sample reports
+                    page_stats[page.url] = {
+                        "seconds": page.fetch_seconds + time.time() - page.started,
+                        "chars": chars,
+                    }
+                    progress.update(task, advance=1)
+
+                def fail(url: str, reason: str, status: str, message: str) -> None:
+                    nonlocal failed_count
+                    failed_count += 1
+                    failed_urls.append((url, reason))
+                    # Let a later alias of this page save it instead
+                    redirects.release(url)
+                    clean_console.print_url_status(
+                        url, status, 0, message, progress_console=progress.console
+                    )
 
+                async def filter_page(page: _FetchedPage) -> None:
+                    try:
+                        # Use the properly decorated run_llm_filter
+                        filtered_md: str | None = await run_llm_filter(
+                            filter_instance=llm_content_filter,
+                            html_content=page.html,
+                            url=page.url,
+                            executor=llm_executor,
+                            limiter=llm_limiter,
+                            cache=llm_cache,
+                        )
+                    except Exception as exc:
+                        logger.error(f"LLM filter failed for {page.url}: {exc}")
+                        fail(page.url, str(exc), "error", str(exc))
+                        finish(page)
+                        return
+                    if not filtered_md:
+                        fail(page.url, "no LLM content", "warning", "no LLM content")
+                        finish(page)
+                        return
+                    await writes.put((page, absolutify_links(filtered_md, page.url)))
+
+                async def write_page(item: tuple[_FetchedPage, str]) -> None:
+                    nonlocal success_count
+                    page, absolute_md = item
+                    filename: str = url_to_filename(page.url, page.index)
+                    filepath = output_dir / filename
+                    try:
+                        await asyncio.to_thread(
+                            filepath.write_text, absolute_md, encoding="utf-8"
+                        )
+                    except OSError as e:
+                        logger.error(
+                            f"Failed to save markdown for {page.url} to {filepath}"
+                        )
+                        fail(page.url, str(e), "error", "save failed")
+                        finish(page)
+                        return
+                    validators.record(page.url, page.headers, filename)
                     if args.verbose:
-                        clean_console.print_fetch_status(
-                            url, "processing", progress_console=progress.console
+                        clean_console.print_url_status(
+                            page.url,
+                            "success",
+                            time.time() - page.started,
+                            f"{len(absolute_md):,} chars → {filename}",
+                            progress_console=progress.console,
                         )
+                    successful_urls.append(page.url)
+                    success_count += 1
+                    finish(page, len(absolute_md))
+
+                # Fetching, LLM filtering and writing overlap; a full LLM queue
+                # stops taking pages, which pauses fetching until a worker frees up
+                async with (
+                    Stage(write_page, maxsize=WRITE_QUEUE_SIZE) as writes,
+                    Stage(
+                        filter_page, concurrency=llm_concurrency, maxsize=LLM_QUEUE_SIZE
+                    ) as llm,
+                    aclosing(pages),
+                ):
+                    async for loop_index, url, result in pages:
+                        if shutdown_requested:
+                            clean_console.print_warning(
+                                "Shutdown requested, stopping processing..."
+                            )
+                            break
 
-                    try:
-                        if result.success:
-                            html_to_filter = result.cleaned_html or result.html
-
-                            if not html_to_filter:
-                                failed_count += 1
-                                failed_urls.append((url, "empty content"))
-                                clean_console.print_url_status(
-                                    url,
-                                    "warning",
-                                    0,
-                                    "empty content",
-                                    progress_console=progress.console,
-                                )
-                                progress.update(task, advance=1)
-                                continue
+                        original_index: int = (
+                            positions[loop_index]
+                            if positions is not None
+                            else args.start_at + loop_index + 1
+                        )
+                        progress.update(task, total=len(urls_to_scrape))
+                        url_start_time = time.time()
+                        queued = False
 
-                            logger.info(
-                                f"HTML fetched ({len(html_to_filter)} chars). Sending to LLM filter ({args.model})..."
-                            )
+                        # Update progress bar with current URL
+                        clean_url = clean_url_for_display(url)
+                        progress.update(task, current_url=clean_url)
 
-                            # Use the properly decorated run_llm_filter
-                            filtered_md: str | None = await run_llm_filter(
-                                filter_instance=llm_content_filter,
-                                html_content=html_to_filter,
-                                url=url,
+                        if args.verbose:
+                            clean_console.print_fetch_status(
+                                url, "processing", progress_console=progress.console
                             )
 
-                            if filtered_md:
-                                absolute_md = absolutify_links(filtered_md, url)
-                                filename: str = url_to_filename(url, original_index)
-                                filepath = output_dir / filename
-
-                                try:
-                                    with open(filepath, "w", encoding="utf-8") as f:
-                                        f.write(absolute_md)
-
-                                    url_time = time.time() - url_start_time
-                                    chars = len(absolute_md)
-
-                                    if args.verbose:
-                                        clean_console.print_url_status(
-                                            url,
-                                            "success",
-                                            url_time,
-                                            f"{chars:,} chars → {filename}",
-                                            progress_console=progress.console,
-                                        )
-                                    successful_urls.append(url)
-                                    success_count += 1
-
-                                except OSError as e:
-                                    failed_count += 1
-                                    failed_urls.append((url, str(e)))
-                                    logger.error(
-                                        f"Failed to save markdown for {url} to {filepath}"
+                        try:
+                            if result is None and url not in redirects.duplicates:
+                                filename = url_to_filename(url, original_index)
+                                validators.keep(url, filename)
+                                successful_urls.append(url)
+                                unchanged_urls.append(url)
+                                success_count += 1
+                                if args.verbose:
+                                    clean_console.print_url_status(
+                                        url,
+                                        "success",
+                                        0,
+                                        f"unchanged → {filename}",
+                                        progress_console=progress.console,
                                     )
+                                progress.update(task, advance=1)
+                                continue
+
+                            if isinstance(result, Exception):
+                                raise result
+                            if url in redirects.duplicates or (
+                                result.success
+                                and redirects.claim(url, final_page_url(url, result))
+                            ):
+                                # Redirect or alias of a page already saved this run
+                                if args.verbose:
                                     clean_console.print_url_status(
                                         url,
-                                        "error",
+                                        "success",
                                         0,
-                                        "save failed",
+                                        "same page as "
+                                        + clean_url_for_display(
+                                            redirects.duplicates[url]
+                                        ),
                                         progress_console=progress.console,
                                     )
-                            else:
-                                failed_count += 1
-                                failed_urls.append((url, "no LLM content"))
-                                clean_console.print_url_status(
-                                    url,
-                                    "warning",
-                                    0,
-                                    "no LLM content",
-                                    progress_console=progress.console,
-                                )
-                        else:
-                            failed_count += 1
-                            failed_urls.append((url, "empty content"))
-                            error_msg = result.error_message or "Unknown error"
-                            logger.error(f"HTML fetch failed: {error_msg}")
-                            clean_console.print_url_status(
-                                url,
-                                "error",
-                                0,
-                                error_msg,
-                                progress_console=progress.console,
-                            )
+                                progress.update(task, advance=1)
+                                continue
 
-                        # Delay between requests
-                        delay_seconds: float = 1.0
-                        await asyncio.sleep(delay_seconds)
+                            if result.success:
+                                html_to_filter = result.cleaned_html or result.html
 
-                    except KeyboardInterrupt:
-                        clean_console.print_warning(
-                            "KeyboardInterrupt caught during URL processing. Signaling shutdown..."
-                        )
-                        shutdown_requested = True
+                                if not html_to_filter:
+                                    fail(
+                                        url, "empty content", "warning", "empty content"
+                                    )
+                                    progress.update(task, advance=1)
+                                    continue
 
-                    except Exception as exc:
-                        failed_count += 1
-                        failed_urls.append((url, str(exc)))
-                        logger.error(f"Unexpected error processing {url}: {exc}")
-
-                        # Use proper exception handling
-                        if isinstance(exc, LLMError | ProcessingError):
-                            clean_console.print_url_status(
-                                url,
-                                "error",
-                                0,
-                                str(exc),
-                                progress_console=progress.console,
-                            )
-                        else:
-                            clean_console.print_url_status(
-                                url,
-                                "error",
-                                0,
-                                "unexpected error",
-                                progress_console=progress.console,
+                                logger.info(
+                                    f"HTML fetched ({len(html_to_filter)} chars). Queued for LLM filter ({args.model})..."
+                                )
+                                # Keep only what the later stages need, not the CrawlResult
+                                queued = True
+                                await llm.put(
+                                    _FetchedPage(
+                                        index=original_index,
+                                        url=url,
+                                        html=html_to_filter,
+                                        headers=result.response_headers,
+                                        started=url_start_time,
+                                        fetch_seconds=fetch_times.pop(url, 0.0),
+                                    )
+                                )
+                                continue
+                            else:
+                                error_msg = result.error_message or "Unknown error"
+                                logger.error(f"HTML fetch failed: {error_msg}")
+                                fail(url, "empty content", "error", error_msg)
+
+                        except KeyboardInterrupt:
+                            clean_console.print_warning(
+                                "KeyboardInterrupt caught during URL processing. Signaling shutdown..."
                             )
+                            shutdown_requested = True
 
-                        await asyncio.sleep(1.0)
+                        except Exception as exc:
+                            logger.error(f"Unexpected error processing {url}: {exc}")
 
-                    if not shutdown_requested:
-                        progress.update(task, advance=1)
+                            # Use proper exception handling
+                            if isinstance(exc, LLMError | ProcessingError):
+                                fail(url, str(exc), "error", str(exc))
+                            else:
+                                fail(url, str(exc), "error", "unexpected error")
+                        finally:
+                            if result is not None and not queued:
+                                # Fetch time, for --sample reports
+                                page_stats[url] = {
+                                    "seconds": fetch_times.pop(url, 0.0)
+                                    + time.time()
+                                    - url_start_time,
+                                    "chars": 0,
+                                }
+
+                        if not shutdown_requested:
+                            progress.update(task, advance=1)
+
+                if redirects.duplicates:
+                    clean_console.print_info(
+                        f"{len(redirects.duplicates)} redirects/aliases of saved pages "
+                        f"skipped ({redirects.resolved} recognized without fetching)"
+                    )
+                if isinstance(crawler, AdaptiveCrawler) and crawler.static:
+                    clean_console.print_info(
+                        f"{crawler.static} pages converted without a browser, "
+                        f"{crawler.rendered} rendered"
+                    )
 
     except KeyboardInterrupt:
         clean_console.print_warning(
@@ -590,6 +832,15 @@ async def process_urls_batch(
         )
 
     finally:
+        llm_executor.shutdown(wait=False, cancel_futures=True)
+        validators.save()
+        redirects.save()
+        if llm_cache is not None:
+            if llm_cache.hits:
+                clean_console.print_info(
+                    f"{llm_cache.hits} pages reused from the LLM cache without API calls"
+                )
+            llm_cache.close()
         total_time = time.time() - start_time
 
         # Final summary
@@ -602,5 +853,8 @@ async def process_urls_batch(
     summary = {
         "successful_urls": successful_urls,
         "failed_urls": failed_urls,
+        "unchanged_urls": unchanged_urls,
+        "duplicate_urls": list(redirects.duplicates.items()),
+        "page_stats": page_stats,
     }
     return summary
@@ -0,0 +1,161 @@
+"""
+Redirect- and alias-aware de-duplication of rendered pages.
+
+Discovered links often redirect to a page that is already on the list:
+``http://`` to ``https://``, a missing trailing slash, a page moved to a new
+path. Documentation generators also serve one page under several URLs and
+declare the preferred one with ``<link rel="canonical">``. Canonical URL keys
+see through neither, so such pages used to be converted (and in LLM mode,
+filtered) once per URL and saved as identical Markdown files.
+
+``final_page_url`` names the page a crawl result holds: its canonical link,
+else where its redirects ended. ``RedirectMap`` claims every such page for the
+first URL that produced it; later URLs landing on a claimed page are recorded
+as duplicates instead of being processed. A URL that then fails to save its
+page gives the claim back, so a later alias can still save it. Redirects and
+aliases are persisted
+in ``REDIRECTS_FILENAME`` in the output directory, so the next run recognizes
+such URLs before fetching them at all.
+
+Usage examples:
+    redirects = RedirectMap(output_dir)
+    if redirects.skip_duplicate(url): ...  # before fetching
+    if redirects.claim(url, final_page_url(url, result)): ...  # already saved
+    redirects.release(url)  # url's page could not be saved after all
+    redirects.duplicates  # {url: url whose output has the same page}
+    redirects.save()
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from crawl4ai import CrawlResult
+
+from .constants import REDIRECTS_FILENAME
+from .utils.exceptions import FileIOError
+from .utils.html_scan import find_canonical_link
+from .utils.logging import get_logger
+from .utils.url_helpers import canonical_url_key
+
+logger = get_logger("redirects")
+
+
+def final_page_url(url: str, result: CrawlResult) -> str:
+    """Return the URL of the page a successful crawl result holds.
+
+    That is the page's ``rel=canonical`` target when it declares one, else
+    where its redirects ended. A canonical link from a deeper page to the site
+    root is ignored, since some sites put that on every page by mistake.
+    """
+    landed = result.redirected_url or url
+    canonical = find_canonical_link(result.html or "", landed)
+    if canonical is None:
+        return landed
+    if not urlsplit(canonical).path.strip("/") and urlsplit(landed).path.strip("/"):
+        return landed
+    return canonical
+
+
+class RedirectMap:
+    """Known redirects and aliases of an output directory, and this run's claims.
+
+    Attributes:
+        path: Location of the JSON redirect file
+        duplicates: URLs not saved because their final page already was,
+            mapped to the URL whose output holds that page
+        resolved: Duplicates recognized from known redirects and aliases,
+            without a fetch
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / REDIRECTS_FILENAME
+        self.duplicates: dict[str, str] = {}
+        self.resolved = 0
+        self._redirects: dict[str, str] = {}
+        self._claims: dict[str, str] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._redirects = data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable redirect file {self.path}: {e}")
+
+    def resolve(self, url: str) -> str:
+        """Return the page a previous run found at ``url``, or ``url`` itself."""
+        return self._redirects.get(canonical_url_key(url), url)
+
+    def owner(self, url: str) -> str | None:
+        """Return the other URL that already produced ``url``'s final page."""
+        owner = self._claims.get(canonical_url_key(self.resolve(url)))
+        return owner if owner is not None and owner != url else None
+
+    def skip_duplicate(self, url: str) -> bool:
+        """Claim ``url``'s known final page before fetching it.
+
+        Returns True when another URL already claimed that page, so ``url``
+        does not need to be fetched at all.
+        """
+        final_key = canonical_url_key(self.resolve(url))
+        owner = self._claims.setdefault(final_key, url)
+        if owner == url:
+            return False
+        self.duplicates[url] = owner
+        self.resolved += 1
+        return True
+
+    def claim(self, url: str, final_url: str | None = None) -> str | None:
+        """Claim the page ``url`` ended up on after fetching.
+
+        Records the redirect or alias when ``final_url`` differs from ``url``.
+
+        Returns:
+            None if the page is ``url``'s to save, otherwise the URL that
+            already claimed it (``url`` is then counted as a duplicate)
+        """
+        final_url = final_url or url
+        key, final_key = canonical_url_key(url), canonical_url_key(final_url)
+        if final_key == key:
+            # A redirect or alias seen by an earlier run may be gone since
+            self._dirty |= self._redirects.pop(key, None) is not None
+        elif self._redirects.get(key) != final_url:
+            self._redirects[key] = final_url
+            self._dirty = True
+        owner = self._claims.setdefault(final_key, url)
+        if owner == url:
+            return None
+        self.duplicates[url] = owner
+        return owner
+
+    def release(self, url: str) -> None:
+        """Give up the pages ``url`` claimed, because it failed to save them.
+
+        Later URLs reaching those pages can claim and save them instead; URLs
+        already counted as duplicates of ``url`` stay skipped.
+        """
+        for final_key in [k for k, owner in self._claims.items() if owner == url]:
+            del self._claims[final_key]
+
+    def save(self) -> None:
+        """Atomically write the redirect file if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.output_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as tmp:
+                json.dump(self._redirects, tmp, indent=1, sort_keys=True)
+            os.replace(tmp.name, self.path)
+        except OSError as e:
+            raise FileIOError(
+                f"Could not save redirects: {e}",
+                filepath=str(self.path),
+                operation="write",
+            ) from e
+        self._dirty = False
@@ -0,0 +1,218 @@
+"""
+Conditional revalidation of previously scraped pages.
+
+After a page is converted, its ``ETag`` and ``Last-Modified`` response headers
+are stored next to the Markdown output in ``VALIDATORS_FILENAME``. On the next
+run into the same output directory, each such page is first requested with
+``If-None-Match`` / ``If-Modified-Since``. A ``304 Not Modified`` means the
+previous Markdown is still current: the page is neither rendered nor sent to
+the LLM, which makes refreshing an unchanged documentation set nearly free.
+A changed page answers with its full content; ``on_changed`` lets a fetcher
+that can use plain HTTP responses (``AdaptiveCrawler.offer``) keep it instead
+of requesting the page again.
+
+Validators are only reused when the output was produced with the same settings
+(processing mode, model and prompt), so switching models re-renders everything.
+
+Usage examples:
+    store = ValidatorStore(output_dir, variant="fast")
+    async with Revalidator(store, scheduler) as revalidator:
+        if await revalidator.is_unchanged(url): ...   # as pages stream in
+    store.record(url, result.response_headers, filename)
+    store.save()
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+
+import httpx
+
+from .config import get_http_client
+from .constants import MAX_CONCURRENT_REQUESTS, VALIDATORS_FILENAME
+from .politeness import HostScheduler
+from .utils.exceptions import FileIOError
+from .utils.logging import get_logger
+
+logger = get_logger("revalidation")
+
+
+def settings_variant(fast: bool, model: str = "", prompt: str = "") -> str:
+    """Fingerprint the settings that shape a page's Markdown output."""
+    if fast:
+        return "fast"
+    digest = hashlib.sha256(prompt.strip().encode("utf-8")).hexdigest()[:12]
+    return f"llm:{model}:{digest}"
+
+
+class ValidatorStore:
+    """Per-output-directory record of cache validators and output filenames.
+
+    Attributes:
+        path: Location of the JSON validator file
+        variant: Settings fingerprint that stored entries must match
+    """
+
+    def __init__(self, output_dir: Path, variant: str):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / VALIDATORS_FILENAME
+        self.variant = variant
+        self._entries: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable validator file {self.path}: {e}")
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a reusable URL.
+
+        Empty when the URL has no validators, was produced with other settings,
+        or its previous Markdown file is gone.
+        """
+        entry = self._entries.get(url)
+        if not entry or entry.get("variant") != self.variant:
+            return {}
+        if not (self.output_dir / entry.get("filename", "")).is_file():
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(
+        self, url: str, response_headers: Mapping[str, str] | None, filename: str
+    ) -> None:
+        """Remember the validators of a freshly converted page."""
+        headers = {k.lower(): v for k, v in (response_headers or {}).items()}
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if not etag and not last_modified:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+            return
+        self._entries[url] = {
+            "etag": etag or "",
+            "last_modified": last_modified or "",
+            "filename": filename,
+            "variant": self.variant,
+        }
+        self._dirty = True
+
+    def keep(self, url: str, filename: str) -> None:
+        """Reuse the previous output of an unchanged page under ``filename``.
+
+        The file is renamed when the page's position in the URL list changed
+        since the run that produced it.
+        """
+        entry = self._entries[url]
+        if entry["filename"] != filename:
+            try:
+                os.replace(
+                    self.output_dir / entry["filename"], self.output_dir / filename
+                )
+            except OSError as e:
+                raise FileIOError(
+                    f"Could not reuse previous output for {url}: {e}",
+                    filepath=str(self.output_dir / filename),
+                    operation="write",
+                ) from e
+            entry["filename"] = filename
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the validator file if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.output_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as tmp:
+                json.dump(self._entries, tmp, indent=1, sort_keys=True)
+            os.replace(tmp.name, self.path)
+        except OSError as e:
+            raise FileIOError(
+                f"Could not save validators: {e}",
+                filepath=str(self.path),
+                operation="write",
+            ) from e
+        self._dirty = False
+
+
+class Revalidator:
+    """Asks a page's server, one URL at a time, whether it changed since last run.
+
+    Used as an async context manager that owns the HTTP client, so pages can be
+    revalidated as they stream in from discovery.
+
+    Attributes:
+        checked: Conditional requests sent so far
+        unchanged: URLs whose server answered ``304 Not Modified``
+        on_changed: Awaited with the URL and still unread response of every
+            page that did not answer 304 (the body is otherwise discarded)
+    """
+
+    def __init__(
+        self,
+        store: ValidatorStore,
+        scheduler: HostScheduler,
+        concurrency: int = MAX_CONCURRENT_REQUESTS,
+        on_changed: Callable[[str, httpx.Response], Awaitable[None]] | None = None,
+    ):
+        self.store = store
+        self.scheduler = scheduler
+        self.on_changed = on_changed
+        self.concurrency = max(1, concurrency)
+        self.checked = 0
+        self.unchanged: set[str] = set()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "Revalidator":
+        self._client = get_http_client(max_connections=self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.checked:
+            logger.info(
+                f"{len(self.unchanged)}/{self.checked} revalidated pages are unchanged"
+            )
+
+    async def is_unchanged(self, url: str) -> bool:
+        """Return True if the previous Markdown for ``url`` is still current.
+
+        URLs without stored validators are answered without a request. Any
+        error or non-304 answer counts as changed, so the page is scraped again.
+        """
+        headers = self.store.conditional_headers(url)
+        if not headers or self._client is None:
+            return False
+        self.checked += 1
+        async with self._semaphore:
+            # Take the host's token only once a slot is free, right before
+            # the request, so queued checks cannot reach a host back to back
+            await self.scheduler.acquire(url)
+            try:
+                # Stream so a changed page's body is only read if it is reused
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    if response.status_code != 304:
+                        if self.on_changed is not None:
+                            await self.on_changed(url, response)
+                        return False
+            except httpx.HTTPError as e:
+                logger.debug(f"Revalidation failed for {url}: {e}")
+                return False
+        self.unchanged.add(url)
+        return True
@@ -0,0 +1,159 @@
+"""
+URL template clustering and stratified sample runs.
+
+Documentation sites are made of page families: API reference pages, tutorials,
+release notes. Pages in one family share a URL shape, and usually also share
+how long they take to render, how large their Markdown is and how often they
+fail. ``url_template`` reduces a URL to that shape: version and language
+prefixes are dropped (see ``split_version``), the first remaining segment is
+kept as the section name, and deeper segments become placeholders (``{n}`` for
+numbers, ``{version}`` for versions, ``{id}`` for hashes and long ids, ``*`` for
+words). The depth is part of the template, so ``/ref/models/`` and
+``/ref/models/fields/`` are different families.
+
+``sample_clusters`` takes the same number of evenly spaced URLs from every
+family, and ``cluster_report`` turns the scrape summary of that sample into
+per-family statistics that extrapolate to the full URL list.
+
+Usage examples:
+    url_template("https://docs.djangoproject.com/en/5.2/releases/5.1.3/")
+    # "docs.djangoproject.com/releases/{version}"
+    clusters = cluster_urls(urls)
+    sample = sample_clusters(clusters, per_cluster=3)
+    stats = cluster_report(clusters, sample, summary)
+"""
+
+import re
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from .utils.url_helpers import canonical_url_key, get_url_depth
+from .utils.versions import split_version
+
+_NUMBER = re.compile(r"\d+")
+_VERSION = re.compile(r"v?\d+(?:\.(?:\d+|x))+")
+_ID = re.compile(r"(?=[^/]*\d)[0-9a-f-]{12,}|[A-Za-z0-9_-]*\d[A-Za-z0-9_-]{15,}")
+
+
+def url_template(url: str) -> str:
+    """Reduce a URL to the shape shared by pages of the same family."""
+    parts = urlsplit(canonical_url_key(url))
+    path, _ = split_version(parts.path)
+    segments = [segment for segment in path.split("/") if segment]
+    depth = get_url_depth(path)
+    if not segments:
+        return f"{parts.netloc}/"
+    shape = [segments[0].lower()] + [_segment_shape(s) for s in segments[1:depth]]
+    return f"{parts.netloc}/{'/'.join(shape)}"
+
+
+def _segment_shape(segment: str) -> str:
+    if _VERSION.fullmatch(segment.lower()):
+        return "{version}"
+    stem, dot, extension = segment.rpartition(".")
+    if not dot or not extension.isalpha():
+        stem, extension = segment, ""
+    if _NUMBER.fullmatch(stem):
+        shape = "{n}"
+    elif _ID.fullmatch(stem):
+        shape = "{id}"
+    else:
+        shape = "*"
+    return f"{shape}.{extension.lower()}" if extension else shape
+
+
+def cluster_urls(urls: list[str]) -> dict[str, list[str]]:
+    """Group URLs by template, in order of each template's first appearance."""
+    clusters: dict[str, list[str]] = {}
+    for url in urls:
+        clusters.setdefault(url_template(url), []).append(url)
+    return clusters
+
+
+def sample_clusters(clusters: dict[str, list[str]], per_cluster: int) -> list[str]:
+    """Pick up to ``per_cluster`` evenly spaced URLs from every cluster.
+
+    Spacing the picks over the cluster (instead of taking its first pages)
+    keeps the sample from being dominated by one corner of a large section.
+    """
+    sample = []
+    for urls in clusters.values():
+        if len(urls) <= per_cluster:
+            sample.extend(urls)
+            continue
+        step = len(urls) / per_cluster
+        sample.extend(urls[int(i * step)] for i in range(per_cluster))
+    return sample
+
+
+@dataclass
+class ClusterStats:
+    """Sample results of one URL template, with full-run estimates.
+
+    Attributes:
+        template: Shape shared by the cluster's URLs
+        total: URLs in the full list with this template
+        sampled: URLs of the cluster that were processed
+        failed: Sampled URLs that failed
+        seconds: Fetch and conversion time summed over the sampled pages
+        chars: Markdown characters written for the sampled pages
+    """
+
+    template: str
+    total: int
+    sampled: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    chars: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.sampled if self.sampled else 0.0
+
+    @property
+    def seconds_per_page(self) -> float:
+        return self.seconds / self.sampled if self.sampled else 0.0
+
+    @property
+    def chars_per_page(self) -> float:
+        succeeded = self.sampled - self.failed
+        return self.chars / succeeded if succeeded else 0.0
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Page time the full cluster would take, before any concurrency."""
+        return self.seconds_per_page * self.total
+
+    @property
+    def estimated_chars(self) -> float:
+        return self.chars_per_page * self.total * (1 - self.failure_rate)
+
+
+def cluster_report(
+    clusters: dict[str, list[str]], sample: list[str], summary: dict
+) -> list[ClusterStats]:
+    """Summarize a sample run per cluster.
+
+    Args:
+        clusters: Full URL list grouped by ``cluster_urls``
+        sample: URLs that were processed
+        summary: Scrape summary with ``failed_urls`` and ``page_stats``
+
+    Returns:
+        One entry per cluster, in cluster order
+    """
+    template_of = {url: template for template, urls in clusters.items() for url in urls}
+    stats = {
+        template: ClusterStats(template, len(urls))
+        for template, urls in clusters.items()
+    }
+    failed = {url for url, _ in summary.get("failed_urls", [])}
+    page_stats = summary.get("page_stats", {})
+    for url in sample:
+        entry = stats[template_of[url]]
+        entry.sampled += 1
+        entry.failed += url in failed
+        page = page_stats.get(url, {})
+        entry.seconds += page.get("seconds", 0.0)
+        entry.chars += int(page.get("chars", 0))
+    return list(stats.values())
@@ -0,0 +1,103 @@
+"""Canonical URL de-duplication for discovery and URL lists.
+
+``UrlDeduplicator`` remembers which pages have been seen by their canonical key
+(see ``canonical_url_key``), so ``/foo``, ``/foo/``, ``/foo/index.html`` and
+``/foo?utm_source=x`` are fetched once. It keeps the keys in an exact, compact
+``UrlTable`` by default; with a ``capacity`` it switches to a fixed-size
+``BloomFilter`` so memory stays bounded for crawls of millions of URLs, at the
+cost of rarely treating a new URL as seen.
+"""
+
+import hashlib
+import math
+from collections.abc import Callable
+
+from ..constants import DEFAULT_BLOOM_ERROR_RATE
+from .url_helpers import canonical_url_key, canonicalize_url
+from .url_table import UrlTable
+
+
+class BloomFilter:
+    """Fixed-memory set membership with a bounded false-positive rate.
+
+    Sized for ``capacity`` items at ``error_rate``; adding more items still
+    works but raises the false-positive rate. Never reports a false negative.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_BLOOM_ERROR_RATE):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be >= 1 and 0 < error_rate < 1")
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class UrlDeduplicator:
+    """Seen-set keyed on canonical URLs, with duplicate statistics.
+
+    Attributes:
+        unique: Number of distinct URLs accepted
+        duplicates: Number of URLs rejected as already seen
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = None,
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        key: Callable[[str], str] = canonical_url_key,
+    ):
+        """
+        Args:
+            capacity: Expected number of URLs. When given, a BloomFilter of that
+                size replaces the exact table.
+            error_rate: Bloom filter false-positive rate
+            key: Function mapping a URL to its de-duplication key
+        """
+        self._seen: UrlTable | BloomFilter = (
+            BloomFilter(capacity, error_rate) if capacity else UrlTable()
+        )
+        self._key = key
+        self.unique = 0
+        self.duplicates = 0
+
+    def __contains__(self, url: str) -> bool:
+        return self._key(url) in self._seen
+
+    def __len__(self) -> int:
+        return self.unique
+
+    def add(self, url: str) -> str | None:
+        """Record a URL if it has not been seen.
+
+        Args:
+            url: Absolute URL, in any spelling
+
+        Returns:
+            The URL's canonical spelling if it is new, None for a duplicate
+        """
+        key = self._key(url)
+        if key in self._seen:
+            self.duplicates += 1
+            return None
+        self._seen.add(key)
+        self.unique += 1
+        return canonicalize_url(url)
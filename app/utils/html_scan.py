@@ -0,0 +1,288 @@
+"""Streaming HTML scanning utilities for browserless fetches.
+
+Provides a lightweight ``<a href>`` extractor built on the standard library's
+incremental ``HTMLParser``. It can be fed response chunks as they arrive, never
+builds a DOM, and records a few cheap signals used to decide whether a page was
+server-rendered or needs a real browser to execute JavaScript.
+
+``TocExtractor`` does the opposite job: it reads only the navigation chrome that
+``LinkExtractor`` skips, where documentation generators keep the sidebar table
+of contents, and records each link's title and nesting level.
+``find_canonical_link`` reads a page's ``<link rel="canonical">``.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import NamedTuple
+from urllib.parse import urljoin, urlparse
+
+from ..constants import MIN_STATIC_TEXT_CHARS, MIN_STATIC_TEXT_DENSITY
+
+SKIPPED_LINK_TAGS = frozenset(
+    {"script", "style", "nav", "footer", "aside", "noscript", "template"}
+)
+"""Tags whose links and text are ignored (mirrors discovery's excluded_tags)"""
+
+SPA_ROOT_IDS = frozenset(
+    {"root", "app", "__next", "__nuxt", "___gatsby", "svelte", "q-app"}
+)
+"""Element ids used by common single-page-app frameworks as their mount point"""
+
+MAIN_CONTENT_TAGS = frozenset({"main", "article"})
+"""Elements that hold a page's main content when it is server-rendered"""
+
+TOC_CONTAINER_TAGS = frozenset({"nav", "aside"})
+"""Elements that always hold navigation"""
+
+TOC_BLOCK_TAGS = frozenset({"div", "section", "ul", "ol", "nav", "aside"})
+"""Elements that count as navigation when their class or id has a TOC marker"""
+
+TOC_MARKERS = ("toc", "sidebar", "menu", "md-nav", "navigation")
+"""class/id fragments used for sidebars by Sphinx, MkDocs, Docusaurus and others"""
+
+LIST_TAGS = frozenset({"ul", "ol"})
+"""List elements whose nesting gives a TOC entry its level"""
+
+_BODY_START = re.compile(r"<body[\s>]", re.IGNORECASE)
+
+
+class LinkExtractor(HTMLParser):
+    """Incremental extractor for internal links and server-rendering signals.
+
+    Feed it HTML text in any number of chunks, then read ``links`` (absolute,
+    fragment-free http(s) URLs in document order, duplicates included),
+    ``text_chars`` (visible text outside skipped tags), ``has_spa_root`` and
+    ``has_main_content`` (a ``<main>``/``<article>`` or ``role="main"``).
+
+    Example:
+        extractor = LinkExtractor("https://docs.example.com/")
+        for chunk in chunks:
+            extractor.feed(chunk)
+        extractor.close()
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: list[str] = []
+        self.text_chars = 0
+        self.has_spa_root = False
+        self.has_main_content = False
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        if tag in SKIPPED_LINK_TAGS:
+            self._skip_depth += 1
+            return
+
+        if tag == "base":
+            href = dict(attrs).get("href")
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+        elif tag == "a" and not self._skip_depth:
+            href = dict(attrs).get("href")
+            if href:
+                self._add_link(href)
+        elif tag == "div" and not self.has_spa_root:
+            if dict(attrs).get("id") in SPA_ROOT_IDS:
+                self.has_spa_root = True
+        if not self.has_main_content and (
+            tag in MAIN_CONTENT_TAGS or dict(attrs).get("role") == "main"
+        ):
+            self.has_main_content = True
+
+    def handle_endtag(self, tag: str):
+        if tag in SKIPPED_LINK_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str):
+        if not self._skip_depth:
+            self.text_chars += len(data.strip())
+
+    def _add_link(self, href: str) -> None:
+        absolute = urljoin(self.base_url, href.strip()).split("#")[0]
+        if urlparse(absolute).scheme in ("http", "https"):
+            self.links.append(absolute)
+
+
+def looks_js_rendered(extractor: LinkExtractor) -> bool:
+    """Guess whether a page needs a browser to produce its real content.
+
+    A page is considered JavaScript-rendered when it has almost no visible
+    text, or when it exposes a single-page-app mount point without enough
+    server-rendered text or links to be useful on its own.
+
+    Args:
+        extractor: A fully fed LinkExtractor for the page
+
+    Returns:
+        True if the page should be re-fetched with a browser
+    """
+    if extractor.text_chars < MIN_STATIC_TEXT_CHARS:
+        return True
+    return extractor.has_spa_root and not extractor.links
+
+
+def looks_server_rendered(extractor: LinkExtractor, html_chars: int) -> bool:
+    """Decide whether a plain HTTP response already holds the page's content.
+
+    Stricter than ``not looks_js_rendered``, because here the HTML is converted
+    as is rather than only mined for links: a page must have enough text, and
+    either mark its main content or, failing that, not be an SPA shell and
+    have a reasonable share of visible text in its markup.
+
+    Args:
+        extractor: A fully fed LinkExtractor for the page
+        html_chars: Length of the HTML that was fed
+
+    Returns:
+        True if the page can be converted without a browser
+    """
+    if looks_js_rendered(extractor):
+        return False
+    if extractor.has_main_content:
+        return True
+    if extractor.has_spa_root:
+        return False
+    return extractor.text_chars >= html_chars * MIN_STATIC_TEXT_DENSITY
+
+
+class TocEntry(NamedTuple):
+    """One page in a navigation tree."""
+
+    url: str
+    title: str
+    level: int
+    """Nesting depth in the tree, 1 for top-level entries"""
+
+
+class TocExtractor(HTMLParser):
+    """Incremental extractor for navigation trees such as sidebar TOCs.
+
+    Every navigation container (``<nav>``, ``<aside>``, ``role="navigation"``
+    or a block whose class/id contains a TOC marker) becomes one list of
+    ``TocEntry`` in ``containers``, in document order. An entry's level is the
+    number of ``<ul>``/``<ol>`` lists around its link inside the container.
+    Containers nested inside another container are merged into it.
+
+    Example:
+        extractor = TocExtractor("https://docs.example.com/")
+        extractor.feed(html)
+        extractor.close()
+        sidebar = max(extractor.containers, key=len)
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.containers: list[list[TocEntry]] = []
+        self._container_tag: str | None = None
+        self._container_depth = 0
+        self._list_depth = 0
+        self._link: tuple[str, list[str]] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        attributes = dict(attrs)
+        if tag == "base":
+            href = attributes.get("href")
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+            return
+
+        if self._container_tag is None:
+            if _is_toc_container(tag, attributes):
+                self._container_tag = tag
+                self._container_depth = 1
+                self._list_depth = 1 if tag in LIST_TAGS else 0
+                self.containers.append([])
+            return
+
+        if tag == self._container_tag:
+            self._container_depth += 1
+        if tag in LIST_TAGS:
+            self._list_depth += 1
+        elif tag == "a":
+            self._finish_link()
+            href = attributes.get("href")
+            if href:
+                url = urljoin(self.base_url, href.strip()).split("#")[0]
+                if urlparse(url).scheme in ("http", "https"):
+                    self._link = (url, [])
+
+    def handle_endtag(self, tag: str):
+        if self._container_tag is None:
+            return
+        if tag == "a":
+            self._finish_link()
+        if tag in LIST_TAGS and self._list_depth:
+            self._list_depth -= 1
+        if tag == self._container_tag:
+            self._container_depth -= 1
+            if not self._container_depth:
+                self._finish_link()
+                self._container_tag = None
+
+    def handle_data(self, data: str):
+        if self._link is not None:
+            self._link[1].append(data)
+
+    def close(self):
+        super().close()
+        self._finish_link()
+
+    def _finish_link(self) -> None:
+        if self._link is None:
+            return
+        url, text = self._link
+        self._link = None
+        title = " ".join("".join(text).split())
+        self.containers[-1].append(TocEntry(url, title, max(self._list_depth, 1)))
+
+
+def _is_toc_container(tag: str, attributes: dict[str, str | None]) -> bool:
+    if tag in TOC_CONTAINER_TAGS or attributes.get("role") == "navigation":
+        return True
+    if tag not in TOC_BLOCK_TAGS:
+        return False
+    names = f"{attributes.get('class') or ''} {attributes.get('id') or ''}".lower()
+    return any(marker in names for marker in TOC_MARKERS)
+
+
+class _CanonicalLinkParser(HTMLParser):
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.canonical: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        attributes = dict(attrs)
+        href = attributes.get("href")
+        if not href:
+            return
+        if tag == "base":
+            self.base_url = urljoin(self.base_url, href)
+        elif tag == "link" and self.canonical is None:
+            if "canonical" in (attributes.get("rel") or "").lower().split():
+                self.canonical = urljoin(self.base_url, href.strip()).split("#")[0]
+
+
+def find_canonical_link(html: str, base_url: str) -> str | None:
+    """Return the absolute ``<link rel="canonical">`` target of a page.
+
+    Only the document head is parsed, so this stays cheap on large pages.
+
+    Args:
+        html: The page's HTML
+        base_url: URL the HTML was served from, for relative targets
+
+    Returns:
+        The canonical http(s) URL, or None if the page declares none
+    """
+    body = _BODY_START.search(html)
+    parser = _CanonicalLinkParser(base_url)
+    parser.feed(html[: body.start()] if body else html)
+    parser.close()
+    canonical = parser.canonical
+    if canonical and urlparse(canonical).scheme in ("http", "https"):
+        return canonical
+    return None
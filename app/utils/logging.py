@@ -81,7 +81,7 @@ class CleanConsole:
         else:
             self.console.print(message, style=style)
 
-    def print_header(self, base_url: str, model: str, total_urls: int):
+    def print_header(self, base_url: str, model: str, total_urls: int | str):
         """Print clean header for processing session with Rose Pine dark theme."""
         # Extract clean domain from base_url
         clean_domain = (
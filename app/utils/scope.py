@@ -0,0 +1,188 @@
+"""Include/exclude scope rules for discovery and scraping.
+
+Rules are matched against the URL path and come in three forms:
+
+- ``/en/5.2/releases/`` (no wildcards): path prefix
+- ``*/internals/*`` (``*``, ``?`` or ``[...]``): shell glob over the whole path
+- ``re:/(fr|de|ja)/``: regular expression searched anywhere in the path
+
+All rules of one kind are compiled once: prefixes (and globs that are a prefix
+followed by a single trailing ``*``) go into a character trie, everything else
+into one combined regular expression. Checking a URL is a single walk down the
+trie plus one regex search, so the cost depends on the path length rather than
+on the number of rules or the size of the frontier.
+
+With ``skip_files=True`` links to downloads and media (``.pdf``, ``.zip``,
+images, ...; see ``EXCLUDED_URL_EXTENSIONS``) are rejected too, so they never
+reach a browser tab. The check is one set lookup on the path's extension.
+
+``collapse_versions`` and ``pin_version`` deal with documentation published
+under several version and language prefixes (see ``VersionFilter``): only the
+pinned version is kept, and each logical page is kept once.
+
+Usage examples:
+    rules = ScopeRules(exclude=["/en/5.2/releases/", "*/internals/*"])
+    rules = ScopeRules(include=["re:^/en/5\\.2/"], start_url=start_url)
+    urls = rules.filter(urls)
+    rules = ScopeRules(skip_files=True)
+    rules = ScopeRules(collapse_versions=True, pin_version="5.2")
+    rules.skipped  # Counter({"exclude": 12, "other version": 40, "file type": 2})
+"""
+
+import posixpath
+import re
+from collections import Counter
+from collections.abc import Iterable
+from fnmatch import translate
+from urllib.parse import urlparse
+
+from ..constants import EXCLUDED_URL_EXTENSIONS, SCOPE_REGEX_PREFIX
+from .versions import VersionFilter
+
+_GLOB_CHARS = frozenset("*?[")
+_FILE_EXTENSIONS = frozenset(EXCLUDED_URL_EXTENSIONS)
+_TERMINAL = ""
+
+
+class _PrefixTrie:
+    """Character trie answering "does any stored prefix start this path?"."""
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self._root: dict = {}
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = True
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def matches(self, path: str) -> bool:
+        node = self._root
+        if _TERMINAL in node:
+            return True
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+
+class _RuleSet:
+    """One compiled group of rules (all includes or all excludes)."""
+
+    def __init__(self, rules: Iterable[str]):
+        prefixes: list[str] = []
+        patterns: list[str] = []
+        for rule in rules:
+            rule = rule.strip()
+            if not rule:
+                continue
+            if rule.startswith(SCOPE_REGEX_PREFIX):
+                patterns.append(rule[len(SCOPE_REGEX_PREFIX) :])
+            elif not _GLOB_CHARS & set(rule):
+                prefixes.append(rule)
+            elif rule.endswith("*") and not _GLOB_CHARS & set(rule[:-1]):
+                prefixes.append(rule[:-1])
+            else:
+                patterns.append(f"^{translate(rule)}")
+
+        self._trie = _PrefixTrie(prefixes)
+        # One pattern per rule: joined into one regex, inline flags such as
+        # "(?i)" or repeated group names would break or leak across rules
+        self._regexes = [re.compile(pattern) for pattern in patterns]
+
+    def __bool__(self) -> bool:
+        return bool(self._trie) or bool(self._regexes)
+
+    def matches(self, path: str) -> bool:
+        if self._trie.matches(path):
+            return True
+        return any(regex.search(path) is not None for regex in self._regexes)
+
+
+class ScopeRules:
+    """Compiled include/exclude rules plus an optional start-URL scope.
+
+    A URL is allowed when it is inside the auto-scope (if a start URL was
+    given), matches no exclude rule, and matches at least one include rule
+    (if any were given). With ``skip_files`` it must also not end in a
+    non-HTML file extension, and version rules are checked last so only
+    in-scope URLs become a page's representative. Rejections are counted in
+    ``skipped`` by reason: ``"scope"``, ``"file type"``, ``"exclude"``,
+    ``"include"``, ``"version"`` or ``"other version"``.
+
+    Raises:
+        re.error: If a ``re:`` rule is not a valid regular expression
+    """
+
+    def __init__(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        start_url: str | None = None,
+        skip_files: bool = False,
+        collapse_versions: bool = False,
+        pin_version: str | None = None,
+    ):
+        self._include = _RuleSet(include or ())
+        self._exclude = _RuleSet(exclude or ())
+        self._host: str | None = None
+        self._prefix = ""
+        if start_url:
+            parsed = urlparse(start_url)
+            self._host = parsed.netloc.lower()
+            self._prefix = parsed.path[: parsed.path.rfind("/") + 1] or "/"
+        self.skip_files = skip_files
+        self._versions = (
+            VersionFilter(pin_version, collapse_versions)
+            if collapse_versions or pin_version
+            else None
+        )
+        self.skipped: Counter[str] = Counter()
+
+    def __bool__(self) -> bool:
+        """True if the rules can reject anything at all."""
+        return bool(
+            self._include
+            or self._exclude
+            or self._host
+            or self.skip_files
+            or self._versions is not None
+        )
+
+    @property
+    def total_skipped(self) -> int:
+        """Number of URLs rejected so far, for any reason."""
+        return self.skipped.total()
+
+    def allows(self, url: str) -> bool:
+        """Check a URL against the rules, counting it if it is rejected."""
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if self._host is not None and (
+            parsed.netloc.lower() != self._host
+            or not (path.startswith(self._prefix) or path == self._prefix[:-1])
+        ):
+            self.skipped["scope"] += 1
+            return False
+        if self.skip_files and posixpath.splitext(path)[1].lower() in _FILE_EXTENSIONS:
+            self.skipped["file type"] += 1
+            return False
+        if self._exclude.matches(path):
+            self.skipped["exclude"] += 1
+            return False
+        if self._include and not self._include.matches(path):
+            self.skipped["include"] += 1
+            return False
+        if self._versions is not None and (reason := self._versions.check(url)):
+            self.skipped[reason] += 1
+            return False
+        return True
+
+    def filter(self, urls: Iterable[str]) -> list[str]:
+        """Return the allowed URLs in their original order."""
+        return [url for url in urls if self.allows(url)]
@@ -7,15 +7,47 @@ the application, reducing code duplication and ensuring consistency.
 import re
 from datetime import datetime
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse, urlsplit, urlunsplit
 
 from ..constants import (
     DEFAULT_EXTENSION,
+    INDEX_FILENAMES,
     MAX_FILENAME_LENGTH,
+    TRACKING_QUERY_PARAMS,
+    TRACKING_QUERY_PREFIXES,
     URL_DISPLAY_MAX_LENGTH,
     URL_DISPLAY_MAX_LENGTH_DETAILED,
 )
 
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]+')
+_WHITESPACE = re.compile(r"\s+")
+_KEYWORD_SEPARATORS = re.compile(r"[/\-_.]")
+_KEYWORD_STOPWORDS = frozenset(
+    {"com", "org", "www", "html", "htm", "php", "md", "pdf", "txt", "css", "js"}
+)
+
+
+def _filename_from_parsed(
+    parsed: ParseResult,
+    index: int,
+    extension: str = DEFAULT_EXTENSION,
+    max_len: int = MAX_FILENAME_LENGTH,
+) -> str:
+    """``url_to_filename`` for a URL that has already been parsed."""
+    path_part: str = parsed.path.strip("/") or parsed.netloc
+    safe_path: str = _UNSAFE_FILENAME_CHARS.sub("_", path_part)
+    safe_path = _WHITESPACE.sub("_", safe_path)
+    safe_path = safe_path[:max_len].rstrip("._")
+    if not safe_path:
+        safe_path = f"url_{index}"
+    return f"{index:03d}_{safe_path}{extension}"
+
+
+def _keywords_from_path(path: str) -> list[str]:
+    """``extract_keywords_from_url`` for an already extracted URL path."""
+    words = _KEYWORD_SEPARATORS.split(path.lower())
+    return [w for w in words if len(w) > 2 and w not in _KEYWORD_STOPWORDS][:5]
+
 
 def url_to_filename(
     url: str,
@@ -43,49 +75,14 @@ def url_to_filename(
         - All unsafe filesystem characters are replaced with underscores.
     """
     try:
-        parsed = urlparse(url)
-        path_part: str = (
-            parsed.path.strip("/") if parsed.path.strip("/") else parsed.netloc
-        )
-        safe_path: str = re.sub(r'[\\/:*?"<>|]+', "_", path_part)
-        safe_path = re.sub(r"\s+", "_", safe_path)
-        safe_path = safe_path[:max_len].rstrip("._")
-        if not safe_path:
-            safe_path = f"url_{index}"
-        return f"{index:03d}_{safe_path}{extension}"
+        return _filename_from_parsed(urlparse(url), index, extension, max_len)
     except Exception:
         return f"{index:03d}{extension}"
 
 
 def extract_keywords_from_url(url: str) -> list[str]:
     """Extract meaningful keywords from URL path."""
-    from urllib.parse import urlparse
-
-    parsed = urlparse(url)
-    path = parsed.path
-    # Split by common separators and filter meaningful words
-    words = re.split(r"[/\-_.]", path.lower())
-    keywords = [
-        w
-        for w in words
-        if w
-        and len(w) > 2
-        and w
-        not in [
-            "com",
-            "org",
-            "www",
-            "html",
-            "htm",
-            "php",
-            "md",
-            "pdf",
-            "txt",
-            "css",
-            "js",
-        ]
-    ]
-    return keywords[:5]
+    return _keywords_from_path(urlparse(url).path)
 
 
 def get_url_depth(url: str) -> int:
@@ -97,18 +94,25 @@ def get_url_depth(url: str) -> int:
     return len([p for p in path.split("/") if p])
 
 
-def analyze_url_metadata(url: str, index: int) -> dict[str, Any]:
-    """Extract all metadata from a URL."""
-    from urllib.parse import urlparse
+def analyze_url_metadata(
+    url: str, index: int, discovered_at: str | None = None
+) -> dict[str, Any]:
+    """Extract all metadata from a URL.
 
+    The URL is parsed once and every field is derived from that parse. Pass
+    ``discovered_at`` to share one timestamp across a batch of URLs instead of
+    reading the clock per URL.
+    """
+    parsed = urlparse(url)
+    path = parsed.path
     return {
         "url": url,
-        "path": urlparse(url).path,
-        "depth": get_url_depth(url),
-        "keywords": extract_keywords_from_url(url),
-        "filename_part": get_url_filename_part(url),
-        "md_filename": url_to_filename(url, index),
-        "discovered_at": datetime.now().isoformat(),
+        "path": path,
+        "depth": len([p for p in path.split("/") if p]),
+        "keywords": _keywords_from_path(path),
+        "filename_part": path.strip("/") or parsed.netloc or "unknown",
+        "md_filename": _filename_from_parsed(parsed, index),
+        "discovered_at": discovered_at or datetime.now().isoformat(),
     }
 
 
@@ -191,6 +195,25 @@ def is_same_domain(url1: str, url2: str) -> bool:
         return False
 
 
+def is_under_start_url(url: str, start_url: str) -> bool:
+    """
+    Check that a URL shares the start URL's host and directory.
+
+    Args:
+        url: Candidate URL, e.g. from a sitemap or page index
+        start_url: Documentation root the crawl started from
+
+    Returns:
+        True if the URL is on the same host, in or below the start directory
+    """
+    parsed = urlparse(url)
+    start = urlparse(start_url)
+    if parsed.netloc.lower() != start.netloc.lower():
+        return False
+    prefix = start.path[: start.path.rfind("/") + 1] or "/"
+    return parsed.path.startswith(prefix) or parsed.path == prefix.rstrip("/")
+
+
 def normalize_url(url: str) -> str:
     """
     Normalize URL for consistent processing.
@@ -240,6 +263,101 @@ def normalize_url(url: str) -> str:
         return url
 
 
+_PERCENT_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _normalize_escapes(component: str) -> str:
+    """Decode escaped unreserved characters and upper-case remaining escapes."""
+
+    def replace(match: re.Match) -> str:
+        char = chr(int(match.group(1), 16))
+        return char if char in _UNRESERVED else f"%{match.group(1).upper()}"
+
+    return _PERCENT_ESCAPE.sub(replace, component)
+
+
+def canonicalize_url(
+    url: str,
+    strip_tracking: bool = True,
+    strip_index: bool = False,
+    strip_trailing_slash: bool = False,
+    sort_query: bool = False,
+) -> str:
+    """
+    Rewrite a URL into a canonical spelling for de-duplication.
+
+    Always lower-cases the scheme and host, drops default ports and the
+    fragment, normalizes percent-encoding and turns an empty path into "/".
+    These rewrites never change which page a server returns. The optional
+    rewrites below usually don't either, but may on unusual servers.
+
+    Args:
+        url: Absolute URL to canonicalize
+        strip_tracking: Remove utm_* and other TRACKING_QUERY_PARAMS
+        strip_index: Treat ``/dir/index.html`` (see INDEX_FILENAMES) as ``/dir/``
+        strip_trailing_slash: Treat ``/dir/`` as ``/dir`` (the root stays "/")
+        sort_query: Sort the remaining query parameters
+
+    Returns:
+        Canonical URL, or the stripped input if it cannot be parsed
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").rstrip(".")
+        if ":" in host:
+            host = f"[{host}]"
+        if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        if parts.username:
+            userinfo = parts.username
+            if parts.password:
+                userinfo += f":{parts.password}"
+            host = f"{userinfo}@{host}"
+
+        path = _normalize_escapes(parts.path) or "/"
+        if strip_index:
+            directory, _, filename = path.rpartition("/")
+            if filename.lower() in INDEX_FILENAMES:
+                path = f"{directory}/"
+        if strip_trailing_slash and len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        # Filter raw "key=value" pairs so the remaining ones keep their encoding
+        params = [param for param in parts.query.split("&") if param]
+        if strip_tracking:
+            params = [
+                param
+                for param in params
+                if (key := param.partition("=")[0].lower()) not in TRACKING_QUERY_PARAMS
+                and not key.startswith(TRACKING_QUERY_PREFIXES)
+            ]
+        if sort_query:
+            params.sort()
+        query = _normalize_escapes("&".join(params))
+
+        return urlunsplit((scheme, host, path, query, ""))
+    except ValueError:
+        return url
+
+
+def canonical_url_key(url: str) -> str:
+    """
+    Return the de-duplication key of a URL.
+
+    Applies every ``canonicalize_url`` rewrite, so ``/foo``, ``/foo/``,
+    ``/foo/index.html`` and ``/foo?utm_source=x`` share one key.
+    """
+    return canonicalize_url(
+        url, strip_index=True, strip_trailing_slash=True, sort_query=True
+    )
+
+
 def get_url_filename_part(url: str) -> str:
     """
     Extract the filename-relevant part from a URL.
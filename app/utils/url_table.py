@@ -0,0 +1,173 @@
+"""Compact, ordered URL storage for crawls of millions of pages.
+
+A Python ``str`` costs about 50 bytes of header on top of its characters, and
+every ``set``/``list``/``dict`` entry pointing at it adds more, so a frontier
+that keeps each URL in a set and a list spends several hundred bytes per URL.
+``UrlTable`` keeps the same information in a handful of flat buffers:
+
+- URLs are split after their last directory slash. The prefix
+  (``https://docs.example.com/en/5.2/ref/``) is interned once in a small table;
+  the suffix (``models.html``) is appended to one contiguous ``bytearray``.
+- Per-URL records (prefix id, suffix end offset, hash, depth, status) live in
+  typed ``array`` columns, indexed by insertion order.
+- Lookups use an open-addressing hash index of record numbers, so membership
+  needs no per-URL objects either. Hash matches are confirmed against the
+  stored URL, so lookups are exact.
+
+Strings are only rebuilt when a URL is read back. The table is an ordered
+sequence: it can be indexed, sliced (which returns a list) and compared with a
+list of the same URLs.
+
+Usage examples:
+    table = UrlTable()
+    table.add("https://docs.example.com/ref/models.html", depth=1)  # 0
+    "https://docs.example.com/ref/models.html" in table  # True
+    table[0], table.depths[0], table.nbytes
+"""
+
+from array import array
+from collections.abc import Iterator
+from typing import overload
+
+_EMPTY = -1
+_INITIAL_SLOTS = 1024
+
+
+class UrlTable:
+    """Append-only set of URLs that remembers insertion order.
+
+    Attributes:
+        depths: Crawl depth of each record (``array`` of unsigned shorts)
+        statuses: Free-form status code of each record (unsigned bytes)
+    """
+
+    __slots__ = (
+        "depths",
+        "statuses",
+        "_prefixes",
+        "_prefix_ids",
+        "_prefix_of",
+        "_suffixes",
+        "_ends",
+        "_hashes",
+        "_slots",
+    )
+
+    def __init__(self):
+        self.depths = array("H")
+        self.statuses = array("B")
+        self._prefixes: list[str] = []
+        self._prefix_ids: dict[str, int] = {}
+        self._prefix_of = array("I")
+        self._suffixes = bytearray()
+        self._ends = array("Q")
+        self._hashes = array("q")
+        self._slots = array("i", [_EMPTY]) * _INITIAL_SLOTS
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._ends)))]
+        if index < 0:
+            index += len(self._ends)
+        start = self._ends[index - 1] if index else 0
+        suffix = self._suffixes[start : self._ends[index]].decode("utf-8")
+        return self._prefixes[self._prefix_of[index]] + suffix
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._ends)):
+            yield self[index]
+
+    def __contains__(self, url: str) -> bool:
+        return self.index(url) is not None
+
+    def __eq__(self, other: object) -> bool:
+        """Equal to a table or list holding the same URLs in the same order."""
+        if not isinstance(other, (UrlTable, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the table's buffers and prefix strings."""
+        columns = (
+            self.depths,
+            self.statuses,
+            self._prefix_of,
+            self._ends,
+            self._hashes,
+            self._slots,
+        )
+        prefixes = sum(len(prefix) + 49 for prefix in self._prefixes)
+        return (
+            sum(column.itemsize * len(column) for column in columns)
+            + len(self._suffixes)
+            + prefixes
+        )
+
+    def index(self, url: str) -> int | None:
+        """Return the record number of ``url``, or None if it is not stored."""
+        url_hash = hash(url)
+        mask = len(self._slots) - 1
+        slot = url_hash & mask
+        while (record := self._slots[slot]) != _EMPTY:
+            if self._hashes[record] == url_hash and self[record] == url:
+                return record
+            slot = (slot + 1) & mask
+        return None
+
+    def add(self, url: str, depth: int = 0, status: int = 0) -> int | None:
+        """Store a URL unless it is already present.
+
+        Returns:
+            The new record number, or None if the URL was already stored
+        """
+        url_hash = hash(url)
+        mask = len(self._slots) - 1
+        slot = url_hash & mask
+        while (record := self._slots[slot]) != _EMPTY:
+            if self._hashes[record] == url_hash and self[record] == url:
+                return None
+            slot = (slot + 1) & mask
+
+        record = len(self._ends)
+        self._slots[slot] = record
+        query = url.find("?")
+        cut = url.rfind("/", 0, query if query >= 0 else len(url)) + 1
+        prefix = url[:cut]
+        prefix_id = self._prefix_ids.get(prefix)
+        if prefix_id is None:
+            prefix_id = self._prefix_ids[prefix] = len(self._prefixes)
+            self._prefixes.append(prefix)
+        self._prefix_of.append(prefix_id)
+        self._suffixes += url[cut:].encode("utf-8")
+        self._ends.append(len(self._suffixes))
+        self._hashes.append(url_hash)
+        self.depths.append(depth)
+        self.statuses.append(status)
+        # Keep the index at most half full so probe chains stay short
+        if 2 * len(self._ends) > len(self._slots):
+            self._grow()
+        return record
+
+    def _grow(self) -> None:
+        slots = array("i", [_EMPTY]) * (2 * len(self._slots))
+        mask = len(slots) - 1
+        for record, url_hash in enumerate(self._hashes):
+            slot = url_hash & mask
+            while slots[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            slots[slot] = record
+        self._slots = slots
@@ -6,15 +6,22 @@ ensuring data integrity and providing clear error messages.
 
 import os
 import re
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
 from ..constants import (
     DEFAULT_TIMEOUT_MS,
+    DISCOVERY_STRATEGIES,
     EXCLUDED_URL_EXTENSIONS,
+    MAX_DISCOVERY_DEPTH,
     MAX_FILENAME_LENGTH,
+    RENDER_MODES,
+    SCOPE_REGEX_PREFIX,
+    URL_ORDERS,
     VALID_URL_SCHEMES,
 )
+from .versions import split_version
 
 
 def validate_url(url: str) -> tuple[bool, str]:
@@ -244,6 +251,309 @@ def validate_batch_size(batch_size: int) -> tuple[bool, str]:
         return True, ""  # pyright: ignore[reportUnreachable]
 
 
+def validate_concurrency(concurrency: int) -> tuple[bool, str]:
+    """
+    Validate how many pages, seeds or LLM calls may run at once.
+
+    Args:
+        concurrency: Maximum number of concurrent operations
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if concurrency < 1:
+        return False, "Concurrency must be 1 or greater"
+    if concurrency > 100:
+        return False, "Concurrency cannot exceed 100 (to prevent resource exhaustion)"
+    return True, ""
+
+
+def validate_crawl_depth(depth: int) -> tuple[bool, str]:
+    """
+    Validate the number of link levels to crawl during discovery.
+
+    Args:
+        depth: Number of link levels (1 = start page only)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not isinstance(depth, int):
+        return False, "Depth must be an integer"  # pyright: ignore[reportUnreachable]
+    elif depth < 1:
+        return False, "Depth must be 1 or greater"
+    elif depth > MAX_DISCOVERY_DEPTH:
+        return False, f"Depth cannot exceed {MAX_DISCOVERY_DEPTH}"
+    else:
+        return True, ""  # pyright: ignore[reportUnreachable]
+
+
+def validate_max_pages(max_pages: int | None) -> tuple[bool, str]:
+    """
+    Validate the optional page cap for discovery.
+
+    Args:
+        max_pages: Maximum number of URLs to discover, or None for no limit
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if max_pages is None:
+        return True, ""
+    elif not isinstance(max_pages, int):
+        return False, "Max pages must be an integer"  # pyright: ignore[reportUnreachable]
+    elif max_pages < 1:
+        return False, "Max pages must be 1 or greater"
+    else:
+        return True, ""
+
+
+def validate_sample_size(per_cluster: int | None) -> tuple[bool, str]:
+    """
+    Validate the optional --sample size.
+
+    Args:
+        per_cluster: URLs to process from each URL template, or None
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if per_cluster is None:
+        return True, ""
+    if per_cluster < 1:
+        return False, "Sample size must be 1 or greater"
+    return True, ""
+
+
+def validate_bloom_capacity(capacity: int | None) -> tuple[bool, str]:
+    """
+    Validate the optional Bloom filter capacity used for URL de-duplication.
+
+    Args:
+        capacity: Expected number of URLs, or None for an exact seen-set
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if capacity is None:
+        return True, ""
+    elif capacity < 1:
+        return False, "Bloom capacity must be 1 or greater"
+    else:
+        return True, ""
+
+
+def validate_scope_rules(rules: list[str] | None) -> tuple[bool, str]:
+    """
+    Validate --include/--exclude rules.
+
+    Args:
+        rules: Path prefixes, globs, or "re:"-prefixed regular expressions
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    for rule in rules or []:
+        if not rule.strip():
+            return False, "Scope rules cannot be empty"
+        if rule.startswith(SCOPE_REGEX_PREFIX):
+            pattern = rule[len(SCOPE_REGEX_PREFIX) :]
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                return False, f"Invalid regular expression '{pattern}': {e}"
+    return True, ""
+
+
+def validate_pin_version(version: str | None) -> tuple[bool, str]:
+    """
+    Validate a --pin-version value.
+
+    Args:
+        version: Version path segments such as "5.2", "dev" or "en/5.2"
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if version is None:
+        return True, ""
+    segments = [segment for segment in version.split("/") if segment]
+    if not segments:
+        return False, "Pinned version cannot be empty"
+    if len(split_version("/" + "/".join(segments) + "/")[1]) != len(segments):
+        return (
+            False,
+            f"'{version}' does not look like a version prefix "
+            "(e.g. '5.2', 'v3', 'dev', 'latest' or 'en/5.2')",
+        )
+    return True, ""
+
+
+def validate_host_rate(rate: float) -> tuple[bool, str]:
+    """
+    Validate the per-host request rate used while scraping.
+
+    Args:
+        rate: Requests per second allowed to a single host
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if rate <= 0:
+        return False, "Host rate must be greater than 0"
+    return True, ""
+
+
+def validate_llm_rate_limit(per_minute: int | None) -> tuple[bool, str]:
+    """
+    Validate an optional --llm-rpm or --llm-tpm limit.
+
+    Args:
+        per_minute: Requests or tokens allowed per minute, or None for no limit
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if per_minute is None:
+        return True, ""
+    if per_minute < 1:
+        return False, "LLM rate limits must be 1 or greater"
+    return True, ""
+
+
+def validate_cache_size(megabytes: int) -> tuple[bool, str]:
+    """
+    Validate the size limit for `scribe cache prune`.
+
+    Args:
+        megabytes: Size the LLM cache should be trimmed to
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if megabytes < 0:
+        return False, "Cache size cannot be negative"
+    return True, ""
+
+
+def validate_discovery_strategy(strategy: str) -> tuple[bool, str]:
+    """
+    Validate the discovery strategy name.
+
+    Args:
+        strategy: One of DISCOVERY_STRATEGIES
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if strategy not in DISCOVERY_STRATEGIES:
+        return (
+            False,
+            f"Strategy must be one of: {', '.join(DISCOVERY_STRATEGIES)}",
+        )
+    return True, ""
+
+
+def validate_render_mode(render: str) -> tuple[bool, str]:
+    """
+    Validate the page fetching mode.
+
+    Args:
+        render: One of RENDER_MODES
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if render not in RENDER_MODES:
+        return False, f"Render mode must be one of: {', '.join(RENDER_MODES)}"
+    return True, ""
+
+
+def validate_url_order(order: str) -> tuple[bool, str]:
+    """
+    Validate the order requested for discovered URLs.
+
+    Args:
+        order: One of URL_ORDERS
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if order not in URL_ORDERS:
+        return False, f"Order must be one of: {', '.join(URL_ORDERS)}"
+    return True, ""
+
+
+def validate_iso_date(value: str | None) -> tuple[bool, str]:
+    """
+    Validate an optional ISO 8601 date or datetime string.
+
+    Args:
+        value: Date such as "2025-01-31" or "2025-01-31T12:00:00Z", or None
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if value is None:
+        return True, ""
+    try:
+        datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return False, f"Invalid date '{value}' (expected YYYY-MM-DD)"
+    return True, ""
+
+
+def validate_frontier_path(path: str | None) -> tuple[bool, str]:
+    """
+    Validate an optional crawl frontier database path.
+
+    Args:
+        path: SQLite file to create or resume, or None for an in-memory frontier
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if path is None:
+        return True, ""
+    if Path(path).is_dir():
+        return False, f"Frontier path is a directory: {path}"
+    return validate_file_path(path, must_exist=False)
+
+
+def validate_graph_path(path: str | None) -> tuple[bool, str]:
+    """
+    Validate an optional link graph export path.
+
+    Args:
+        path: .csv/.npz file to write, or None to skip the export
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if path is None:
+        return True, ""
+    if Path(path).is_dir():
+        return False, f"Graph path is a directory: {path}"
+    return validate_file_path(path, must_exist=False)
+
+
+def validate_toc_path(path: str | None) -> tuple[bool, str]:
+    """
+    Validate an optional navigation TOC export path.
+
+    Args:
+        path: .md/.json file to write, or None to skip the export
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if path is None:
+        return True, ""
+    if Path(path).is_dir():
+        return False, f"TOC path is a directory: {path}"
+    return validate_file_path(path, must_exist=False)
+
+
 def validate_filename(filename: str) -> tuple[bool, str]:
     """
     Validate filename is safe for filesystem use.
@@ -0,0 +1,117 @@
+"""Version and language prefixes in documentation URLs.
+
+Sites like Django publish every page under several prefixes:
+``/en/5.2/topics/http/``, ``/en/dev/topics/http/`` and ``/fr/5.2/topics/http/``
+are one logical page. ``split_version`` separates such a path into the logical
+page path and its variant (``("en", "5.2")``), and ``VersionFilter`` uses that
+to pin one version and keep a single representative per logical page.
+
+Detection looks at each URL on its own and errs on the side of keeping pages.
+Only a leading prefix counts: the first path segment, or the second one right
+after a language code (``en``, ``pt-br``, ``zh_CN``). That segment must be a
+dotted number (``5.2``, ``v3.12``, ``4.x``), ``v`` plus a number (``v2``), a
+keyword from ``VERSION_KEYWORDS`` (``dev``, ``latest``, ``stable``, ...) or a
+one- or two-digit number without a leading zero (``/3/``, ``/fr/3/`` on
+docs.python.org). Deeper segments such as ``/api/v2/`` and chapter numbers such
+as ``/ch/01/`` are part of the page. A prefix must also have been seen on
+``VERSION_PREFIX_MIN_PAGES`` pages before ``VersionFilter`` collapses pages
+under it, so numbered sections holding a single page each are kept.
+
+Usage examples:
+    split_version("/en/5.2/topics/http/")  # ("/topics/http/", ("en", "5.2"))
+    versions = VersionFilter(pin="5.2")
+    versions.check("https://docs.djangoproject.com/en/dev/intro/")  # "version"
+"""
+
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+from ..constants import VERSION_KEYWORDS, VERSION_PREFIX_MIN_PAGES
+from .url_helpers import canonical_url_key
+
+_VERSION = re.compile(
+    r"v?\d+(?:\.(?:\d+|x))+|v\d+|" + "|".join(map(re.escape, VERSION_KEYWORDS))
+)
+_SHORT_NUMBER = re.compile(r"[1-9]\d?")
+_LANGUAGE = re.compile(r"[a-z]{2}(?:[-_][a-z]{2,4})?")
+
+
+def split_version(path: str) -> tuple[str, tuple[str, ...]]:
+    """Split a URL path into its logical page path and its variant segments.
+
+    Args:
+        path: URL path such as ``/en/5.2/topics/http/``
+
+    Returns:
+        The path without version/language segments, and those segments in
+        order (lowercased); the variant is empty for unversioned paths
+    """
+    segments = path.split("/")
+    lowered = [segment.lower() for segment in segments[1:3]]
+    if lowered and _is_version(lowered[0]):
+        width = 1
+    elif (
+        len(lowered) == 2
+        and _LANGUAGE.fullmatch(lowered[0])
+        and _is_version(lowered[1])
+    ):
+        width = 2
+    else:
+        return path, ()
+    logical = "/".join([segments[0], *segments[1 + width :]])
+    return logical or "/", tuple(lowered[:width])
+
+
+def _is_version(segment: str) -> bool:
+    return bool(_VERSION.fullmatch(segment) or _SHORT_NUMBER.fullmatch(segment))
+
+
+class VersionFilter:
+    """Pins a documentation version and collapses the others.
+
+    Unversioned URLs always pass. With a ``pin`` (``"5.2"`` or ``"en/5.2"``),
+    versioned URLs must carry every pinned segment. With ``collapse``, the first
+    URL seen for a logical page becomes its representative and other versions
+    or translations of that page are rejected, once both prefixes have been
+    seen on ``VERSION_PREFIX_MIN_PAGES`` pages of the host.
+    """
+
+    def __init__(self, pin: str | None = None, collapse: bool = True):
+        self.pin = frozenset(
+            segment.lower() for segment in (pin or "").split("/") if segment
+        )
+        self.collapse = collapse
+        self._representatives: dict[str, tuple[str, tuple[str, ...]]] = {}
+        self._prefix_pages: dict[tuple[str, ...], set[str]] = {}
+
+    def check(self, url: str) -> str | None:
+        """Return why a URL is rejected (``"version"`` or ``"other version"``).
+
+        Returns None when the URL is allowed; asking again about a
+        representative URL keeps allowing it.
+        """
+        key = canonical_url_key(url)
+        parts = urlsplit(key)
+        logical, variant = split_version(parts.path)
+        if not variant:
+            return None
+        if not self.pin <= set(variant):
+            return "version"
+        if not self.collapse:
+            return None
+        prefix = (parts.netloc, *variant)
+        pages = self._prefix_pages.setdefault(prefix, set())
+        if len(pages) < VERSION_PREFIX_MIN_PAGES:
+            pages.add(logical)
+        page = urlunsplit(parts._replace(path=logical))
+        representative, representative_prefix = self._representatives.setdefault(
+            page, (key, prefix)
+        )
+        if representative == key:
+            return None
+        if self._established(prefix) and self._established(representative_prefix):
+            return "other version"
+        return None
+
+    def _established(self, prefix: tuple[str, ...]) -> bool:
+        return len(self._prefix_pages[prefix]) >= VERSION_PREFIX_MIN_PAGES
@@ -0,0 +1,100 @@
+"""Benchmark browserless HTTP discovery against the Crawl4AI browser path.
+
+Serves a generated static documentation site from a local HTTP server (or uses
+``--url`` for a real site) and times both discovery engines on the same crawl.
+
+Usage:
+    uv run python -m benchmarks.discovery_benchmark
+    uv run python -m benchmarks.discovery_benchmark --pages 500 --depth 3
+    uv run python -m benchmarks.discovery_benchmark --url https://docs.python.org/3/
+"""
+
+import argparse
+import asyncio
+import functools
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from app.fast_discovery import extract_links_fast
+from app.http_discovery import extract_links_http
+
+PARAGRAPH = "<p>" + "This page documents part of the example API. " * 10 + "</p>"
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def build_site(root: Path, pages: int, fanout: int) -> None:
+    """Write a tree-shaped static site where page i links to its children."""
+    for i in range(pages):
+        children = range(i * fanout + 1, min(i * fanout + fanout + 1, pages))
+        links = "".join(
+            f'<li><a href="/page{c}.html">Page {c}</a></li>' for c in children
+        )
+        nav = '<nav><a href="/index.html">Home</a></nav>'
+        html = (
+            f"<html><head><title>Page {i}</title></head><body>{nav}"
+            f"<main><h1>Page {i}</h1>{PARAGRAPH}<ul>{links}</ul></main></body></html>"
+        )
+        name = "index.html" if i == 0 else f"page{i}.html"
+        (root / name).write_text(html, encoding="utf-8")
+
+
+async def time_engine(name: str, func, url: str, depth: int, concurrency: int):
+    """Run one discovery engine and return (name, seconds, url count or error)."""
+    start = time.perf_counter()
+    try:
+        links = await func(url, False, depth=depth, concurrency=concurrency)
+        return name, time.perf_counter() - start, len(links)
+    except Exception as e:
+        return name, time.perf_counter() - start, f"failed: {e.__class__.__name__}"
+
+
+async def run(url: str, depth: int, concurrency: int) -> None:
+    results = [
+        await time_engine("http", extract_links_http, url, depth, concurrency),
+        await time_engine("crawl4ai", extract_links_fast, url, depth, concurrency),
+    ]
+    print(f"\nDiscovery of {url} (depth={depth}, concurrency={concurrency})")
+    print(f"{'engine':<10} {'seconds':>9} {'urls':>8}")
+    for name, seconds, count in results:
+        print(f"{name:<10} {seconds:>9.2f} {count!s:>8}")
+    http_time, browser_time = results[0][1], results[1][1]
+    if isinstance(results[1][2], int) and http_time > 0:
+        print(f"\nspeedup: {browser_time / http_time:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark a live site instead of a local one")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run(args.url, args.depth, args.concurrency))
+        return
+
+    with tempfile.TemporaryDirectory() as site_dir:
+        build_site(Path(site_dir), args.pages, args.fanout)
+        handler = functools.partial(QuietHandler, directory=site_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/index.html"
+            asyncio.run(run(url, args.depth, args.concurrency))
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
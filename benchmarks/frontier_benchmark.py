@@ -0,0 +1,166 @@
+"""Benchmark the compact UrlTable against a set plus a list of URL strings.
+
+Builds the structures discovery keeps for a synthetic documentation crawl: the
+de-duplication keys and the ordered output URLs. The baseline is what discovery
+held before: a ``set`` of key strings and a ``list`` of URL strings. The compact
+version keeps the keys in a ``UrlTable`` (as ``UrlDeduplicator`` does) and the
+output in a second one (as ``MemoryFrontier`` does). URL strings are created
+while building, as parsing pages creates them, so the baseline pays for the
+strings it keeps. Reports traced bytes per URL, build time and membership
+lookups per second (half hits, half misses).
+
+It then reads a URL file of the same shape with ``read_urls_from_file``, which
+returns a ``UrlTable``, and compares it with reading into a set of keys and a
+list of URLs. Reported bytes are those held once the reader has returned.
+
+Usage:
+    uv run python -m benchmarks.frontier_benchmark
+    uv run python -m benchmarks.frontier_benchmark --urls 2000000 --file-urls 1000000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from app.processing import read_urls_from_file
+from app.utils.url_helpers import canonical_url_key, canonicalize_url
+from app.utils.url_table import UrlTable
+
+SECTIONS = ["topics", "ref", "howto", "intro", "internals", "releases"]
+
+
+def make_url(i: int) -> str:
+    """A unique URL shaped like a page of a large documentation site."""
+    return (
+        f"https://docs.example.com/en/5.{i % 3}/{SECTIONS[i % len(SECTIONS)]}/"
+        f"section-{i // 100}/page_{i}.html"
+    )
+
+
+def discovered(count: int) -> Iterator[tuple[str, str]]:
+    """Fresh (key, url) string pairs, as canonicalization produces them."""
+    for i in range(count):
+        url = make_url(i)
+        yield url.removesuffix(".html"), url
+
+
+def build_baseline(count: int):
+    seen: set[str] = set()
+    ordered: list[str] = []
+    for key, url in discovered(count):
+        if key not in seen:
+            seen.add(key)
+            ordered.append(url)
+    return seen, ordered
+
+
+def build_compact(count: int):
+    seen = UrlTable()
+    ordered = UrlTable()
+    for key, url in discovered(count):
+        if seen.add(key) is not None:
+            ordered.add(url, depth=1)
+    return seen, ordered
+
+
+def measure(build, count: int) -> tuple[object, float, int]:
+    """Return (seen-set, seconds, traced bytes); memory is traced in a second run."""
+    start = time.perf_counter()
+    seen, _ = build(count)
+    seconds = time.perf_counter() - start
+    del seen
+    tracemalloc.start()
+    structures = build(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structures[0], seconds, size
+
+
+def lookups_per_second(seen, probes: list[str]) -> float:
+    start = time.perf_counter()
+    for probe in probes:
+        _ = probe in seen
+    return len(probes) / (time.perf_counter() - start)
+
+
+def read_baseline(path: str) -> tuple[set[str], list[str]]:
+    """Read a URL file into a set of keys and a list of canonical URLs."""
+    seen: set[str] = set()
+    urls: list[str] = []
+    with open(path, encoding="utf-8") as file_object:
+        for line in file_object:
+            url = line.strip()
+            key = canonical_url_key(url)
+            if key not in seen:
+                seen.add(key)
+                urls.append(canonicalize_url(url))
+    return seen, urls
+
+
+def measure_reader(read: Callable[[str], object], path: str) -> tuple[float, int]:
+    """Return (seconds, traced bytes still held by the result)."""
+    start = time.perf_counter()
+    read(path)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    result = read(path)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return seconds, size
+
+
+def bench_reader(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "urls.txt"
+        with open(path, "w", encoding="utf-8") as file_object:
+            for i in range(count):
+                file_object.write(make_url(i) + "\n")
+        # Measured before printing, as the reader logs its progress
+        results = {
+            name: measure_reader(read, str(path))
+            for name, read in (
+                ("set+list", read_baseline),
+                ("UrlTable", read_urls_from_file),
+            )
+        }
+
+    print(f"\nread_urls_from_file, {count} URLs")
+    print(f"{'reader':<12} {'bytes/URL':>10} {'read s':>9}")
+    for name, (seconds, size) in results.items():
+        print(f"{name:<12} {size / count:>10.1f} {seconds:>9.2f}")
+    saved = 1 - results["UrlTable"][1] / results["set+list"][1]
+    print(f"memory saved: {saved:.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=500_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--file-urls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    half = args.lookups // 2
+    step = max(1, args.urls // half)
+    hits = range(0, args.urls, step)[:half]
+    misses = range(args.urls, args.urls + half)
+    probes = [make_url(i).removesuffix(".html") for i in (*hits, *misses)]
+
+    print(f"\n{args.urls} URLs, {len(probes)} lookups (half of them misses)")
+    print(f"{'structure':<12} {'bytes/URL':>10} {'build s':>9} {'lookups/s':>12}")
+    sizes = {}
+    for name, build in (("set+list", build_baseline), ("UrlTable", build_compact)):
+        seen, seconds, size = measure(build, args.urls)
+        rate = lookups_per_second(seen, probes)
+        sizes[name] = size
+        print(f"{name:<12} {size / args.urls:>10.1f} {seconds:>9.2f} {rate:>12,.0f}")
+    print(f"memory saved: {1 - sizes['UrlTable'] / sizes['set+list']:.0%}")
+
+    bench_reader(args.file_urls)
+
+
+if __name__ == "__main__":
+    main()
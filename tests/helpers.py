@@ -0,0 +1,136 @@
+"""Shared fakes for the unit tests.
+
+- ``serve_routes`` / ``mock_client`` / ``patch_http_client`` answer HTTP
+  requests from an in-memory handler instead of the network
+- ``FakeCrawler`` stands in for crawl4ai's AsyncWebCrawler over a static site
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from unittest.mock import patch
+
+import httpx
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def serve_routes(
+    routes: Mapping[str, str | bytes],
+    requested: list[str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> Handler:
+    """Handler answering 200 with the body routed to each URL (404 otherwise).
+
+    Args:
+        routes: Response body by full request URL
+        requested: Filled with every requested URL, in order
+        headers: Headers sent with each 200 response
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requested is not None:
+            requested.append(str(request.url))
+        body = routes.get(str(request.url))
+        if body is None:
+            return httpx.Response(404)
+        if isinstance(body, str):
+            return httpx.Response(200, text=body, headers=headers)
+        return httpx.Response(200, content=body, headers=headers)
+
+    return handler
+
+
+def mock_client(handler: Handler) -> httpx.AsyncClient:
+    """Async client whose requests are all answered by ``handler``."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def patch_http_client(module: str, handler: Handler):
+    """Patch ``get_http_client`` in ``module`` to return mocked clients.
+
+    Args:
+        module: Dotted module that imported ``get_http_client``, e.g. ``app.probe``
+        handler: Answers every request made by the patched clients
+    """
+
+    def client_factory(**_kwargs) -> httpx.AsyncClient:
+        return mock_client(handler)
+
+    return patch(f"{module}.get_http_client", client_factory)
+
+
+class FakeCrawlResult:
+    """Minimal stand-in for a crawl4ai CrawlResult."""
+
+    def __init__(self, url, internal_hrefs=(), success=True, error_message=""):
+        self.url = url
+        self.success = success
+        self.error_message = error_message
+        self.links = {"internal": [{"href": href} for href in internal_hrefs]}
+
+
+class FakeCrawler:
+    """Stands in for AsyncWebCrawler over a static link graph.
+
+    State is kept on the class so the fake can be patched in where the code
+    under test creates its own crawler; call ``reset`` from ``setUp``.
+
+    Attributes:
+        site: Links found on each page; other pages fail with a 404 (None
+            serves every page, without links)
+        delay: Seconds each fetch takes
+        fetched: URLs in the order they were fetched
+        started: ``time.perf_counter()`` at which each URL's fetch started
+        launches: Number of times the browser was started
+        closes: Number of times the browser was closed
+    """
+
+    site: dict[str, list[str]] | None = None
+    delay = 0.0
+    fetched: list[str] = []
+    started: dict[str, float] = {}
+    launches = 0
+    closes = 0
+
+    def __init__(self, config=None):
+        pass
+
+    @classmethod
+    def reset(cls, site: dict[str, list[str]] | None = None, delay: float = 0.0):
+        """Forget recorded fetches and serve ``site`` from now on."""
+        cls.site = site
+        cls.delay = delay
+        cls.fetched = []
+        cls.started = {}
+        cls.launches = cls.closes = 0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+        return False
+
+    async def start(self):
+        type(self).launches += 1
+        await asyncio.sleep(0)
+
+    async def close(self):
+        type(self).closes += 1
+
+    async def arun(self, url, config=None):
+        self.fetched.append(url)
+        self.started[url] = time.perf_counter()
+        await asyncio.sleep(self.delay)
+        links = self.links(url)
+        if links is None:
+            return FakeCrawlResult(url, success=False, error_message="404 status")
+        return FakeCrawlResult(url, links)
+
+    def links(self, url: str) -> list[str] | None:
+        """Internal links on ``url``, or None if the page does not exist."""
+        if self.site is None:
+            return []
+        return self.site.get(url)
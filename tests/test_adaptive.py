@@ -0,0 +1,166 @@
+"""Unit tests for adaptive page fetching (`--render auto`).
+
+Tests AdaptiveCrawler with a mocked HTTP transport and a fake browser:
+- Server-rendered pages are converted without launching a browser
+- SPA shells are rendered, and their URL template goes straight to the browser
+- HTTP errors fall back to the browser without marking the template
+- Pages over the size limit are rendered rather than converted truncated
+- A changed page's answer to revalidation is converted without a second GET
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+from crawl4ai import CrawlerRunConfig
+from helpers import FakeCrawler, patch_http_client
+
+from app.adaptive import AdaptiveCrawler
+from app.politeness import HostScheduler
+from app.revalidation import Revalidator, ValidatorStore
+from app.utils.html_scan import LinkExtractor, looks_server_rendered
+
+BASE = "https://docs.example.com"
+ARTICLE = "<p>" + "Server-rendered documentation text. " * 20 + "</p>"
+STATIC_PAGE = f"<html><body><main><h1>Guide</h1>{ARTICLE}</main></body></html>"
+SPA_SHELL = (
+    '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+)
+
+
+def scan(html: str) -> LinkExtractor:
+    extractor = LinkExtractor(BASE)
+    extractor.feed(html)
+    extractor.close()
+    return extractor
+
+
+class TestServerRenderedSignals(unittest.TestCase):
+    """Tests for looks_server_rendered."""
+
+    def test_main_content_and_spa_shells(self):
+        self.assertTrue(looks_server_rendered(scan(STATIC_PAGE), len(STATIC_PAGE)))
+        self.assertFalse(looks_server_rendered(scan(SPA_SHELL), len(SPA_SHELL)))
+
+    def test_low_text_density_without_main_element(self):
+        """Text drowned in markup is not trusted without a main element."""
+        html = f"<div>{ARTICLE}</div>" + "<script>var x = 1;</script>" * 2000
+
+        self.assertFalse(looks_server_rendered(scan(html), len(html)))
+        self.assertTrue(looks_server_rendered(scan(html), len(ARTICLE) * 2))
+
+
+class TestAdaptiveCrawler(unittest.TestCase):
+    """Tests for AdaptiveCrawler."""
+
+    def setUp(self):
+        FakeCrawler.reset()
+        self.http_requests: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.http_requests.append(str(request.url))
+        if request.url.path.startswith("/app/"):
+            body = SPA_SHELL
+        elif request.url.path == "/guide/huge":
+            body = STATIC_PAGE.replace(ARTICLE, ARTICLE * 10)
+        elif request.url.path == "/ref/missing":
+            return httpx.Response(404)
+        else:
+            body = STATIC_PAGE
+        return httpx.Response(
+            200, text=body, headers={"content-type": "text/html", "etag": '"v1"'}
+        )
+
+    def fetch(self, urls: list[str]) -> tuple[list, AdaptiveCrawler]:
+        async def run() -> tuple[list, AdaptiveCrawler]:
+            async with AdaptiveCrawler() as crawler:
+                results = [
+                    await crawler.arun(url, config=CrawlerRunConfig()) for url in urls
+                ]
+            return results, crawler
+
+        with (
+            patch_http_client("app.adaptive", self.handler),
+            patch("app.fast_discovery.AsyncWebCrawler", FakeCrawler),
+        ):
+            return asyncio.run(run())
+
+    def test_static_pages_never_launch_a_browser(self):
+        """Server-rendered HTML goes through crawl4ai's processing directly."""
+        (result,), crawler = self.fetch([f"{BASE}/guide/intro"])
+
+        self.assertTrue(result.success)
+        self.assertIn(
+            "Server-rendered documentation text", result.markdown.raw_markdown
+        )
+        self.assertEqual(result.url, f"{BASE}/guide/intro")
+        self.assertEqual(result.response_headers["etag"], '"v1"')
+        self.assertEqual((crawler.static, crawler.rendered), (1, 0))
+        self.assertEqual(FakeCrawler.launches, 0)
+
+    def test_js_template_is_remembered(self):
+        """After one SPA shell, pages of that template skip the HTTP attempt."""
+        urls = [f"{BASE}/app/one", f"{BASE}/app/two", f"{BASE}/guide/intro"]
+
+        _, crawler = self.fetch(urls)
+
+        self.assertEqual(FakeCrawler.fetched, urls[:2])
+        self.assertEqual(self.http_requests, [urls[0], urls[2]])
+        self.assertEqual((crawler.static, crawler.rendered), (1, 2))
+        self.assertEqual(FakeCrawler.launches, 1)
+
+    def test_http_errors_fall_back_without_marking_template(self):
+        """A 404 is left to the browser but says nothing about the template."""
+        _, crawler = self.fetch([f"{BASE}/ref/missing", f"{BASE}/ref/other"])
+
+        self.assertEqual(FakeCrawler.fetched, [f"{BASE}/ref/missing"])
+        self.assertEqual(crawler.static, 1)
+        self.assertEqual(crawler.browser_templates, set())
+
+    def test_oversized_page_is_rendered_not_truncated(self):
+        """HTML past MAX_CONTENT_LENGTH goes to the browser in full."""
+        urls = [f"{BASE}/guide/huge", f"{BASE}/guide/intro"]
+
+        with patch("app.adaptive.MAX_CONTENT_LENGTH", len(STATIC_PAGE)):
+            _, crawler = self.fetch(urls)
+
+        self.assertEqual(FakeCrawler.fetched, urls[:1])
+        self.assertEqual(crawler.static, 1)
+        self.assertEqual(crawler.browser_templates, set())
+
+    def test_changed_page_reuses_revalidation_response(self):
+        """The full response to a conditional GET is converted, not re-fetched."""
+        url = f"{BASE}/guide/intro"
+
+        async def run(output_dir: Path):
+            store = ValidatorStore(output_dir, "fast")
+            store.record(url, {"etag": '"v0"'}, "001_intro.md")
+            scheduler = HostScheduler(rate=1000, respect_robots=False)
+            async with (
+                AdaptiveCrawler() as crawler,
+                Revalidator(store, scheduler, on_changed=crawler.offer) as revalidator,
+            ):
+                unchanged = await revalidator.is_unchanged(url)
+                result = await crawler.arun(url, config=CrawlerRunConfig())
+            return unchanged, result, crawler
+
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            patch_http_client("app.adaptive", self.handler),
+            patch_http_client("app.revalidation", self.handler),
+            patch("app.fast_discovery.AsyncWebCrawler", FakeCrawler),
+        ):
+            (Path(tmp) / "001_intro.md").write_text("# old", encoding="utf-8")
+            unchanged, result, crawler = asyncio.run(run(Path(tmp)))
+
+        self.assertFalse(unchanged)
+        self.assertEqual(self.http_requests, [url])
+        self.assertEqual(crawler.static, 1)
+        self.assertEqual(result.response_headers["etag"], '"v1"')
+
+
+if __name__ == "__main__":
+    unittest.main()
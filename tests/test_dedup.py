@@ -0,0 +1,130 @@
+"""Unit tests for URL canonicalization and de-duplication.
+
+Tests canonicalize_url, canonical_url_key and the seen-sets built on them:
+- Safe rewrites (case, default ports, fragments, percent-encoding, tracking)
+- Equivalent spellings of one page sharing a de-duplication key
+- Exact and Bloom-filter UrlDeduplicator statistics
+- Duplicate removal in read_urls_from_file
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.processing import read_urls_from_file
+from app.utils.dedup import BloomFilter, UrlDeduplicator
+from app.utils.url_helpers import canonical_url_key, canonicalize_url
+
+
+class TestCanonicalizeUrl(unittest.TestCase):
+    """Tests for canonicalize_url and canonical_url_key."""
+
+    def test_safe_rewrites(self):
+        """Host case, default port, fragment and tracking params are dropped."""
+        self.assertEqual(
+            canonicalize_url(
+                "HTTPS://Docs.Example.COM:443/Guide/?utm_source=x&page=2#intro"
+            ),
+            "https://docs.example.com/Guide/?page=2",
+        )
+        self.assertEqual(
+            canonicalize_url("http://example.com:8080"), "http://example.com:8080/"
+        )
+
+    def test_percent_encoding_is_normalized(self):
+        """Unreserved escapes are decoded and reserved ones upper-cased."""
+        self.assertEqual(
+            canonicalize_url("https://example.com/a%7eb%2fc?q=%3a"),
+            "https://example.com/a~b%2Fc?q=%3A",
+        )
+
+    def test_equivalent_spellings_share_a_key(self):
+        """Trailing slash, index files, tracking and query order are ignored."""
+        spellings = [
+            "https://docs.example.com/foo",
+            "https://docs.example.com/foo/",
+            "https://docs.example.com/foo/index.html",
+            "https://DOCS.example.com/foo?utm_source=newsletter",
+        ]
+        keys = {canonical_url_key(url) for url in spellings}
+        self.assertEqual(keys, {"https://docs.example.com/foo"})
+        self.assertEqual(
+            canonical_url_key("https://example.com/s?b=2&a=1"),
+            canonical_url_key("https://example.com/s?a=1&b=2"),
+        )
+
+    def test_distinct_pages_keep_distinct_keys(self):
+        """Different paths and meaningful queries are not merged."""
+        self.assertNotEqual(
+            canonical_url_key("https://example.com/foo"),
+            canonical_url_key("https://example.com/foobar"),
+        )
+        self.assertNotEqual(
+            canonical_url_key("https://example.com/s?page=1"),
+            canonical_url_key("https://example.com/s?page=2"),
+        )
+
+
+class TestUrlDeduplicator(unittest.TestCase):
+    """Tests for UrlDeduplicator and BloomFilter."""
+
+    def test_exact_set_counts_duplicates(self):
+        """The first spelling is kept (canonicalized) and repeats are counted."""
+        dedup = UrlDeduplicator()
+
+        self.assertEqual(
+            dedup.add("https://example.com/foo/#top"), "https://example.com/foo/"
+        )
+        self.assertIsNone(dedup.add("https://example.com/foo"))
+        self.assertIsNone(dedup.add("https://example.com/foo/index.html"))
+        self.assertEqual(len(dedup), 1)
+        self.assertEqual(dedup.duplicates, 2)
+        self.assertIn("https://EXAMPLE.com/foo", dedup)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Every added item is reported present; few others are."""
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"https://example.com/page{i}")
+
+        self.assertTrue(
+            all(f"https://example.com/page{i}" in bloom for i in range(2000))
+        )
+        false_positives = sum(
+            f"https://example.com/other{i}" in bloom for i in range(2000)
+        )
+        self.assertLess(false_positives, 100)
+
+    def test_bloom_backed_deduplicator(self):
+        """A capacity switches the deduplicator to a Bloom filter."""
+        dedup = UrlDeduplicator(capacity=100)
+
+        self.assertIsInstance(dedup._seen, BloomFilter)
+        self.assertIsNotNone(dedup.add("https://example.com/a"))
+        self.assertIsNone(dedup.add("https://example.com/a/"))
+        self.assertEqual(dedup.duplicates, 1)
+
+
+class TestReadUrlsDeduplication(unittest.TestCase):
+    """Tests for canonical de-duplication in read_urls_from_file."""
+
+    def test_duplicate_spellings_are_dropped(self):
+        """Only the first spelling of each page survives, in file order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "urls.txt"
+            path.write_text(
+                "https://docs.example.com/a\n"
+                "https://docs.example.com/b?utm_campaign=x\n"
+                "https://docs.example.com/a/\n"
+                "https://Docs.Example.com/b\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(
+                read_urls_from_file(str(path)),
+                ["https://docs.example.com/a", "https://docs.example.com/b"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
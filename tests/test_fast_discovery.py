@@ -21,7 +21,11 @@ from unittest.mock import patch
 # Add the app directory to the Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
 
+from helpers import FakeCrawler
+
 from app.fast_discovery import extract_links_fast, save_links_to_file
+from app.utils.dedup import UrlDeduplicator
+from app.utils.scope import ScopeRules
 
 
 class TestFastDiscovery(unittest.TestCase):
@@ -111,6 +115,22 @@ class TestFastDiscovery(unittest.TestCase):
         self.assertEqual(result, self.test_urls)
         mock_extract.assert_called_once_with(self.start_url, True)
 
+    @patch("app.fast_discovery._extract_links_async")
+    def test_single_page_uses_callers_dedup_and_scope(self, mock_extract):
+        """Depth 1 with the CLI's dedup and scope still scans only one page."""
+        mock_extract.return_value = self.test_urls
+        dedup = UrlDeduplicator()
+        dedup.add(self.test_urls[0])
+        scope = ScopeRules(exclude=["/page3"])
+
+        result = asyncio.run(
+            extract_links_fast(self.start_url, dedup=dedup, scope=scope)
+        )
+
+        self.assertEqual(result, self.test_urls[1:2])
+        self.assertEqual(dedup.duplicates, 1)
+        self.assertEqual(scope.total_skipped, 1)
+
     def test_save_links_to_file_basic_functionality(self):
         """Test save_links_to_file with basic functionality using temporary files."""
         with tempfile.NamedTemporaryFile(
@@ -363,6 +383,73 @@ class TestFastDiscovery(unittest.TestCase):
             save_links_to_file(self.test_urls, "test.txt", fmt="xml")
 
 
+class TestBreadthFirstDiscovery(unittest.TestCase):
+    """Tests for the multi-level breadth-first discovery crawl."""
+
+    def setUp(self):
+        self.start_url = "https://docs.example.com/"
+        FakeCrawler.reset(
+            site={
+                self.start_url: [
+                    "https://docs.example.com/a",
+                    "https://docs.example.com/b#section",
+                ],
+                "https://docs.example.com/a": [
+                    "https://docs.example.com/a1",
+                    "https://docs.example.com/b",
+                ],
+                "https://docs.example.com/b": [
+                    "https://docs.example.com/b1",
+                    "https://docs.example.com/missing",
+                ],
+                "https://docs.example.com/a1": ["https://docs.example.com/deep"],
+                "https://docs.example.com/b1": [],
+            }
+        )
+
+    def run_crawl(self, **kwargs):
+        with patch("app.fast_discovery.AsyncWebCrawler", FakeCrawler):
+            return asyncio.run(extract_links_fast(self.start_url, **kwargs))
+
+    def test_depth_two_preserves_breadth_first_order(self):
+        """Links are merged level by level in page order, without duplicates."""
+        result = self.run_crawl(depth=2)
+
+        self.assertEqual(
+            result,
+            [
+                "https://docs.example.com/a",
+                "https://docs.example.com/b",
+                "https://docs.example.com/a1",
+                "https://docs.example.com/b1",
+                "https://docs.example.com/missing",
+            ],
+        )
+        self.assertEqual(len(FakeCrawler.fetched), 3)
+
+    def test_failed_child_pages_are_skipped(self):
+        """A failing page below the start URL does not abort the crawl."""
+        result = self.run_crawl(depth=3, concurrency=2)
+
+        self.assertIn("https://docs.example.com/deep", result)
+        self.assertIn("https://docs.example.com/missing", FakeCrawler.fetched)
+
+    def test_max_pages_bounds_result(self):
+        """Discovery stops as soon as max_pages unique URLs are known."""
+        result = self.run_crawl(depth=5, max_pages=3)
+
+        self.assertEqual(
+            result,
+            [
+                "https://docs.example.com/a",
+                "https://docs.example.com/b",
+                "https://docs.example.com/a1",
+            ],
+        )
+        # b was already in flight; nothing below level 1 is fetched
+        self.assertEqual(len(FakeCrawler.fetched), 3)
+
+
 class TestFastDiscoveryIntegration(unittest.TestCase):
     """Integration tests for the complete fast discovery workflow."""
 
@@ -148,6 +148,35 @@ class TestFileFormatSupport(unittest.TestCase):
         finally:
             Path(temp_filename).unlink()
 
+    def test_save_and_read_ndjson_format(self):
+        """NDJSON holds one metadata object per line and reads back in order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "urls.ndjson"
+            save_links_to_file(self.urls, str(path), fmt="ndjson")
+
+            lines = path.read_text(encoding="utf-8").splitlines()
+            read_back_urls = read_urls_from_file(str(path))
+
+        self.assertEqual(read_back_urls, self.urls)
+        self.assertEqual(len(lines), len(self.urls))
+        self.assertEqual(json.loads(lines[2])["md_filename"], "003_page3.md")
+
+    @patch("app.fast_discovery.METADATA_BATCH_SIZE", 2)
+    def test_batches_share_timestamp_and_stay_valid(self):
+        """Output written across several batches is one valid document."""
+        urls = [f"https://docs.python.org/library/mod{i}.html" for i in range(5)]
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt in ("txt", "json", "csv"):
+                path = Path(tmp) / f"urls.{fmt}"
+                save_links_to_file(urls, str(path), fmt=fmt)
+                self.assertEqual(read_urls_from_file(str(path)), urls)
+            with open(Path(tmp) / "urls.json", encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(data[4]["keywords"], ["library", "mod4"])
+        self.assertEqual(data[4]["md_filename"], "005_library_mod4.html.md")
+        self.assertEqual(data[0]["discovered_at"], data[1]["discovered_at"])
+
     def test_read_urls_from_file_empty(self):
         """Test read_urls_from_file with an empty file returns an empty list."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
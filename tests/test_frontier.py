@@ -0,0 +1,208 @@
+"""Unit tests for the persistent crawl frontier.
+
+Tests CrawlFrontier, MemoryFrontier and the shared breadth-first loop:
+- Ordered, de-duplicated output that excludes the start URL
+- Batched writes and resuming from an existing database
+- Rejecting a frontier that belongs to another start URL
+- Level-by-level crawling, failure handling and max_pages, with either frontier
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.frontier import (
+    STATUS_CRAWLED,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    CrawlFrontier,
+    Frontier,
+    MemoryFrontier,
+    crawl_breadth_first,
+)
+from app.utils.exceptions import ConfigError, NetworkError
+
+START = "https://docs.example.com/"
+
+
+class TestCrawlFrontier(unittest.TestCase):
+    """Tests for CrawlFrontier storage and resume behaviour."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "crawl.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_add_many_deduplicates_in_order(self):
+        """New URLs keep insertion order; known URLs and the root are skipped."""
+        with CrawlFrontier(":memory:", START) as frontier:
+            added = frontier.add_many([f"{START}a", START, f"{START}b"], 1, START)
+            again = frontier.add_many([f"{START}b", f"{START}c"], 2, f"{START}a")
+
+            self.assertEqual(added, [f"{START}a", f"{START}b"])
+            self.assertEqual(again, [f"{START}c"])
+            self.assertEqual(
+                frontier.ordered_urls(), [f"{START}a", f"{START}b", f"{START}c"]
+            )
+            self.assertEqual(len(frontier), 3)
+
+    def test_writes_are_batched_until_flush(self):
+        """Inserts stay buffered until the batch size is reached."""
+        with CrawlFrontier(self.path, START, batch_size=3) as frontier:
+            frontier.add_many([f"{START}a", f"{START}b"], 1, START)
+            self.assertEqual(len(frontier._pending_inserts), 2)
+            frontier.add_many([f"{START}c"], 1, START)
+            self.assertEqual(frontier._pending_inserts, [])
+
+    def test_reopening_resumes_state(self):
+        """A reopened frontier keeps URLs, statuses and discovery order."""
+        with CrawlFrontier(self.path, START) as frontier:
+            frontier.mark(START, STATUS_CRAWLED)
+            frontier.add_many([f"{START}a", f"{START}b"], 1, START)
+            frontier.mark(f"{START}a", STATUS_CRAWLED)
+
+        with CrawlFrontier(self.path, START) as frontier:
+            self.assertTrue(frontier.resumed)
+            self.assertEqual(frontier.ordered_urls(), [f"{START}a", f"{START}b"])
+            self.assertEqual(frontier.next_level(), 1)
+            self.assertEqual(frontier.pending(1), [f"{START}b"])
+            self.assertEqual(
+                frontier.stats(),
+                {STATUS_PENDING: 1, STATUS_CRAWLED: 2, STATUS_FAILED: 0},
+            )
+
+    def test_other_start_url_is_rejected(self):
+        """A frontier file cannot be reused for a different site."""
+        CrawlFrontier(self.path, START).close()
+
+        with self.assertRaises(ConfigError):
+            CrawlFrontier(self.path, "https://other.example.com/")
+
+
+class TestCrawlBreadthFirst(unittest.TestCase):
+    """Tests for crawl_breadth_first with a fake fetcher."""
+
+    def setUp(self):
+        self.graph = {
+            START: [f"{START}a", f"{START}b"],
+            f"{START}a": [f"{START}a1", f"{START}b"],
+            f"{START}b": [f"{START}b1"],
+            f"{START}a1": [f"{START}deep"],
+        }
+        self.fetched: list[str] = []
+
+    async def fetch_links(self, url: str) -> list[str] | None:
+        self.fetched.append(url)
+        await asyncio.sleep(0)
+        return self.graph.get(url)
+
+    def open_frontier(self) -> Frontier:
+        return CrawlFrontier(":memory:", START)
+
+    def crawl(self, frontier: Frontier, depth: int, **kwargs) -> list[str]:
+        asyncio.run(crawl_breadth_first(frontier, self.fetch_links, depth, **kwargs))
+        return frontier.ordered_urls()
+
+    def test_levels_are_crawled_in_order(self):
+        """Depth 2 fetches the root and its children, never grandchildren."""
+        with self.open_frontier() as frontier:
+            links = self.crawl(frontier, depth=2)
+
+        self.assertEqual(
+            links,
+            [f"{START}a", f"{START}b", f"{START}a1", f"{START}b1"],
+        )
+        self.assertEqual(self.fetched, [START, f"{START}a", f"{START}b"])
+
+    def test_max_pages_stops_discovery(self):
+        """Discovery stops as soon as max_pages URLs are known."""
+        with self.open_frontier() as frontier:
+            links = self.crawl(frontier, depth=3, max_pages=3)
+
+        self.assertEqual(links, [f"{START}a", f"{START}b", f"{START}a1"])
+
+    def test_max_pages_cancels_unneeded_fetches(self):
+        """Pages queued after the limit is reached are never fetched."""
+        children = [f"{START}p{i}" for i in range(50)]
+        self.graph = {START: children}
+        for child in children:
+            self.graph[child] = [f"{child}/{j}" for j in range(20)]
+
+        with self.open_frontier() as frontier:
+            links = self.crawl(frontier, depth=3, max_pages=60, concurrency=5)
+            pending = len(frontier.pending(1))
+
+        self.assertEqual(links[50:], [f"{children[0]}/{j}" for j in range(10)])
+        # The start page and the few pages already in flight, not all 51
+        self.assertLess(len(self.fetched), 10)
+        self.assertEqual(pending, 49)
+
+    def test_failed_pages_are_recorded_and_skipped(self):
+        """Unusable pages are marked failed without aborting the crawl."""
+        del self.graph[f"{START}a"]
+        with self.open_frontier() as frontier:
+            links = self.crawl(frontier, depth=2)
+            stats = frontier.stats()
+
+        self.assertEqual(links, [f"{START}a", f"{START}b", f"{START}b1"])
+        self.assertEqual(stats[STATUS_FAILED], 1)
+
+    def test_start_page_error_is_raised(self):
+        """An exception for the start page propagates to the caller."""
+
+        async def failing(url: str) -> list[str]:
+            raise NetworkError("boom", url=url)
+
+        with self.open_frontier() as frontier:
+            with self.assertRaises(NetworkError):
+                asyncio.run(crawl_breadth_first(frontier, failing, depth=2))
+
+    def test_resumed_crawl_skips_finished_pages(self):
+        """Resuming with a deeper depth only fetches pages not yet crawled."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "crawl.db"
+            with CrawlFrontier(path, START) as frontier:
+                self.crawl(frontier, depth=2)
+            self.fetched.clear()
+
+            with CrawlFrontier(path, START) as frontier:
+                links = self.crawl(frontier, depth=3)
+
+        self.assertEqual(self.fetched, [f"{START}a1", f"{START}b1"])
+        self.assertEqual(links[-1], f"{START}deep")
+
+
+class TestMemoryFrontier(TestCrawlBreadthFirst):
+    """Runs the breadth-first tests against the in-memory frontier."""
+
+    def open_frontier(self) -> Frontier:
+        return MemoryFrontier(START)
+
+    def test_resumed_crawl_skips_finished_pages(self):
+        """In-memory frontiers cannot be resumed."""
+
+    def test_statuses_and_pending_pages(self):
+        """Statuses and per-level pending pages match the SQLite frontier."""
+        with self.open_frontier() as frontier:
+            frontier.add_many([f"{START}a", START, f"{START}b"], 1, START)
+            frontier.add_many([f"{START}a1"], 2, f"{START}a")
+            self.assertEqual(frontier.next_level(), 0)
+            frontier.mark(START, STATUS_CRAWLED)
+            frontier.mark(f"{START}a", STATUS_FAILED)
+
+            self.assertEqual(frontier.next_level(), 1)
+            self.assertEqual(frontier.pending(1), [f"{START}b"])
+            self.assertEqual(frontier.pending(2), [f"{START}a1"])
+            self.assertIn(f"{START}a1", frontier)
+            self.assertEqual(
+                frontier.stats(),
+                {STATUS_PENDING: 2, STATUS_CRAWLED: 1, STATUS_FAILED: 1},
+            )
+            self.assertEqual(len(frontier), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Unit tests for http_discovery and the streaming HTML link extractor.
+
+Tests browserless discovery with a mocked HTTP transport:
+- Link extraction order, resolution and skipped navigation chrome
+- Breadth-first crawling restricted to the start host
+- Escalation to the browser crawler for JavaScript-rendered pages
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from helpers import patch_http_client, serve_routes
+
+from app.http_discovery import extract_links_http
+from app.utils.html_scan import LinkExtractor, looks_js_rendered
+
+FILLER = "<p>" + "Documentation text. " * 20 + "</p>"
+
+
+def page(*hrefs: str, extra: str = "") -> str:
+    links = "".join(f'<a href="{href}">link</a>' for href in hrefs)
+    return f"<html><body>{extra}<main>{FILLER}{links}</main></body></html>"
+
+
+class TestLinkExtractor(unittest.TestCase):
+    """Tests for the incremental LinkExtractor."""
+
+    def test_links_resolved_in_order_across_chunks(self):
+        """Chunks split mid-tag still yield absolute, fragment-free links."""
+        html = page("intro/", "/api/#section", "mailto:x@example.com", "../up")
+        extractor = LinkExtractor("https://docs.example.com/en/")
+        for start in range(0, len(html), 7):
+            extractor.feed(html[start : start + 7])
+        extractor.close()
+
+        self.assertEqual(
+            extractor.links,
+            [
+                "https://docs.example.com/en/intro/",
+                "https://docs.example.com/api/",
+                "https://docs.example.com/up",
+            ],
+        )
+
+    def test_navigation_links_and_text_are_skipped(self):
+        """Links inside nav/footer/script are ignored, like browser discovery."""
+        extractor = LinkExtractor("https://docs.example.com/")
+        extractor.feed(
+            '<nav><a href="/nav">n</a></nav><footer><a href="/foot">f</a></footer>'
+            '<a href="/body">body text</a>'
+        )
+        extractor.close()
+
+        self.assertEqual(extractor.links, ["https://docs.example.com/body"])
+        self.assertEqual(extractor.text_chars, len("body text"))
+
+    def test_looks_js_rendered(self):
+        """SPA shells with no text are flagged; server-rendered pages are not."""
+        shell = LinkExtractor("https://app.example.com/")
+        shell.feed('<body><div id="root"></div><script>boot()</script></body>')
+        shell.close()
+        static = LinkExtractor("https://docs.example.com/")
+        static.feed(page("/a"))
+        static.close()
+
+        self.assertTrue(looks_js_rendered(shell))
+        self.assertTrue(shell.has_spa_root)
+        self.assertFalse(looks_js_rendered(static))
+
+
+class TestHttpDiscovery(unittest.TestCase):
+    """Tests for extract_links_http."""
+
+    def setUp(self):
+        self.start_url = "https://docs.example.com/"
+        self.routes: dict[str, str] = {
+            self.start_url: page("/a", "/b", "https://elsewhere.com/x"),
+            "https://docs.example.com/a": page("/a1", "/b"),
+            "https://docs.example.com/b": page("/b1"),
+        }
+
+    def discover(self, **kwargs) -> list[str]:
+        handler = serve_routes(
+            self.routes, headers={"content-type": "text/html; charset=utf-8"}
+        )
+        with patch_http_client("app.http_discovery", handler):
+            return asyncio.run(extract_links_http(self.start_url, **kwargs))
+
+    def test_single_page_keeps_internal_links(self):
+        """Depth 1 returns the start page's internal links in order."""
+        self.assertEqual(
+            self.discover(),
+            ["https://docs.example.com/a", "https://docs.example.com/b"],
+        )
+
+    def test_breadth_first_crawl(self):
+        """Depth 2 appends children level by level without duplicates."""
+        self.assertEqual(
+            self.discover(depth=2),
+            [
+                "https://docs.example.com/a",
+                "https://docs.example.com/b",
+                "https://docs.example.com/a1",
+                "https://docs.example.com/b1",
+            ],
+        )
+
+    @patch("app.http_discovery.extract_links_fast", new_callable=AsyncMock)
+    def test_js_rendered_start_page_escalates_to_browser(self, mock_fast):
+        """An SPA shell is handed to the browser-based discovery path."""
+        mock_fast.return_value = ["https://docs.example.com/rendered"]
+        self.routes[self.start_url] = '<body><div id="__next"></div></body>'
+
+        result = self.discover(depth=2)
+
+        self.assertEqual(result, ["https://docs.example.com/rendered"])
+        mock_fast.assert_awaited_once()
+        self.assertEqual(mock_fast.await_args.kwargs["depth"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
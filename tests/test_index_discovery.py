@@ -0,0 +1,83 @@
+"""Unit tests for index_discovery module.
+
+Tests objects.inv and llms.txt discovery with a mocked HTTP transport:
+- Sphinx inventories are decompressed and their std:doc entries resolved
+- The inventory closest to the start URL is found in a parent directory
+- llms.txt links are scoped, and Markdown twins map back to their pages
+- Sites without an index return an empty list
+"""
+
+import asyncio
+import unittest
+import zlib
+
+from helpers import patch_http_client, serve_routes
+
+from app.index_discovery import extract_links_inventory, extract_links_llms_txt
+
+
+def inventory(*entries: str) -> bytes:
+    """Build a version 2 Sphinx inventory from entry lines."""
+    header = (
+        b"# Sphinx inventory version 2\n"
+        b"# Project: Example\n"
+        b"# Version: 3.13\n"
+        b"# The remainder of this file is compressed using zlib.\n"
+    )
+    return header + zlib.compress("\n".join(entries).encode() + b"\n")
+
+
+class TestIndexDiscovery(unittest.TestCase):
+    """Test suite for extract_links_inventory and extract_links_llms_txt."""
+
+    def setUp(self):
+        self.start_url = "https://docs.example.com/3/library/"
+        self.routes: dict[str, bytes] = {}
+        self.requested: list[str] = []
+
+    def discover(self, extract, **kwargs) -> list[str]:
+        handler = serve_routes(self.routes, self.requested)
+        with patch_http_client("app.index_discovery", handler):
+            return asyncio.run(extract(self.start_url, **kwargs))
+
+    def test_inventory_documents_in_parent_directory(self):
+        """std:doc entries of the nearest inventory are returned and scoped."""
+        self.routes["https://docs.example.com/3/objects.inv"] = inventory(
+            "library/os std:doc -1 library/os.html os — Miscellaneous interfaces",
+            "os.path py:module 0 library/os.path.html#module-$ -",
+            "library/index std:doc -1 library/index.html The Standard Library",
+            "library/re std:doc -1 library/re.html#$ -",
+            "tutorial/index std:doc -1 tutorial/index.html Tutorial",
+        )
+        self.assertEqual(
+            self.discover(extract_links_inventory),
+            [
+                "https://docs.example.com/3/library/os.html",
+                "https://docs.example.com/3/library/re.html",
+            ],
+        )
+        self.assertIn("https://docs.example.com/objects.inv", self.requested)
+
+    def test_llms_txt_links(self):
+        """Linked pages are scoped, and .md twins map to the HTML page."""
+        self.start_url = "https://docs.example.com/"
+        self.routes["https://docs.example.com/llms.txt"] = (
+            b"# Example\n\n> Docs for Example.\n\n## Guides\n\n"
+            b"- [Install](https://docs.example.com/install.md): Setup steps\n"
+            b"- [Config](/config/#options)\n"
+            b"- [Source](https://github.com/example/example)\n"
+        )
+        self.assertEqual(
+            self.discover(extract_links_llms_txt),
+            ["https://docs.example.com/install", "https://docs.example.com/config/"],
+        )
+
+    def test_no_index(self):
+        """Missing files and HTML soft-404s yield an empty list."""
+        self.routes["https://docs.example.com/llms.txt"] = b"<!DOCTYPE html><p>404"
+        self.assertEqual(self.discover(extract_links_inventory), [])
+        self.assertEqual(self.discover(extract_links_llms_txt), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Unit tests for the discovery link graph and importance ordering.
+
+Tests LinkGraph and its frontier integration:
+- Edges are recorded once per page, including links to known pages
+- PageRank matches a dense reference solution and sums to 1, even without edges
+- URLs are ordered by score with stable ties
+- CSV edge lists and NPZ adjacency arrays export correctly
+"""
+
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from app.frontier import CrawlFrontier
+from app.link_graph import LinkGraph
+from app.utils.validation import validate_url_order
+
+BASE = "https://docs.example.com"
+
+
+def sample_graph() -> LinkGraph:
+    """Home links to a and b, every page links back to a."""
+    graph = LinkGraph()
+    graph.add_links(f"{BASE}/", [f"{BASE}/a", f"{BASE}/b", f"{BASE}/a/"])
+    graph.add_links(f"{BASE}/a", [f"{BASE}/", f"{BASE}/c"])
+    graph.add_links(f"{BASE}/b", [f"{BASE}/a"])
+    graph.add_links(f"{BASE}/c", [f"{BASE}/a", f"{BASE}/c"])
+    return graph
+
+
+class TestLinkGraph(unittest.TestCase):
+    """Tests for LinkGraph scores and ordering."""
+
+    def test_edges_are_canonical_and_unique(self):
+        """Spelling variants and self-links do not add edges."""
+        graph = sample_graph()
+
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(graph.edge_count, 6)
+        self.assertEqual(graph.in_degree().tolist(), [1.0, 3.0, 1.0, 1.0])
+
+    def test_pagerank_matches_dense_solution(self):
+        """Power iteration agrees with solving the Google matrix directly."""
+        graph = sample_graph()
+        n, damping = len(graph), 0.85
+        sources, targets = graph.edges()
+        transition = np.zeros((n, n))
+        out_degree = np.bincount(sources, minlength=n)
+        transition[targets, sources] = 1 / out_degree[sources]
+        expected = np.linalg.solve(
+            np.eye(n) - damping * transition, np.full(n, (1 - damping) / n)
+        )
+
+        rank = graph.pagerank(damping=damping, tolerance=1e-12)
+
+        np.testing.assert_allclose(rank, expected, atol=1e-9)
+        self.assertAlmostEqual(rank.sum(), 1.0)
+
+    def test_pagerank_without_edges_is_uniform(self):
+        """A graph of pages that link nowhere ranks them all equally."""
+        graph = LinkGraph()
+        graph.add_links(f"{BASE}/", [])
+        graph.add_links(f"{BASE}/a", [f"{BASE}/a"])
+
+        rank = graph.pagerank()
+
+        self.assertEqual(graph.edge_count, 0)
+        np.testing.assert_allclose(rank, [0.5, 0.5])
+        self.assertEqual(
+            graph.rank_urls([f"{BASE}/a", f"{BASE}/"], "pagerank")[0], f"{BASE}/a"
+        )
+
+    def test_rank_urls_puts_most_linked_first(self):
+        """Higher scores come first; ties and unknown URLs keep their order."""
+        graph = sample_graph()
+        urls = [f"{BASE}/b", f"{BASE}/c", f"{BASE}/a", f"{BASE}/unknown"]
+
+        ranked = graph.rank_urls(urls, "indegree")
+
+        self.assertEqual(
+            ranked, [f"{BASE}/a", f"{BASE}/b", f"{BASE}/c", f"{BASE}/unknown"]
+        )
+        self.assertEqual(graph.rank_urls(urls, "pagerank")[0], f"{BASE}/a")
+        self.assertFalse(validate_url_order("alphabetical")[0])
+
+    def test_export_csv_and_npz(self):
+        """Both export formats describe the same edges."""
+        graph = sample_graph()
+        with tempfile.TemporaryDirectory() as tmp:
+            graph.save(Path(tmp) / "links.csv")
+            graph.save(Path(tmp) / "links.npz")
+
+            with open(Path(tmp) / "links.csv", newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            data = np.load(Path(tmp) / "links.npz")
+            urls, indptr, indices = data["urls"], data["indptr"], data["indices"]
+
+        self.assertEqual(rows[0], ["source", "target"])
+        npz_edges = {
+            (urls[i], urls[j])
+            for i in range(len(urls))
+            for j in indices[indptr[i] : indptr[i + 1]]
+        }
+        self.assertEqual(npz_edges, {tuple(row) for row in rows[1:]})
+
+
+class TestFrontierGraph(unittest.TestCase):
+    """Tests for link recording inside CrawlFrontier."""
+
+    def test_links_to_known_pages_are_recorded(self):
+        """Duplicates are not queued again but still count as links."""
+        graph = LinkGraph()
+        with CrawlFrontier(":memory:", f"{BASE}/", graph=graph) as frontier:
+            frontier.add_many([f"{BASE}/a", f"{BASE}/b"], 1, f"{BASE}/")
+            added = frontier.add_many([f"{BASE}/b", f"{BASE}/c"], 2, f"{BASE}/a")
+
+        self.assertEqual(added, [f"{BASE}/c"])
+        self.assertEqual(graph.edge_count, 4)
+        self.assertEqual(
+            graph.rank_urls([f"{BASE}/a", f"{BASE}/b"], "indegree")[0], f"{BASE}/b"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
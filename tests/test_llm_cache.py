@@ -0,0 +1,117 @@
+"""Unit tests for the LLM result cache.
+
+Tests LlmCache and run_llm_filter's cache argument:
+- Keys change with the HTML, model, instruction and chunk size
+- Hits and misses are counted per run and kept across reopening
+- The least recently used entries are evicted once the size limit is passed
+- A cached page makes no LLM call on the next run
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.llm_cache import LlmCache, cache_key
+from app.processing import run_llm_filter
+
+MODEL = "openrouter/mistralai/codestral-2501"
+
+
+class FakeLLMConfig:
+    provider = MODEL
+
+
+class CountingFilter:
+    """Stands in for LLMContentFilter, counting calls to the LLM."""
+
+    llm_config = FakeLLMConfig()
+    instruction = "Extract the docs"
+    chunk_token_threshold = 8192
+
+    def __init__(self):
+        self.calls = 0
+
+    def filter_content(self, html: str) -> list[str]:
+        self.calls += 1
+        return [f"# Page {self.calls}"]
+
+
+class TestLlmCache(unittest.TestCase):
+    """Tests for LlmCache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "cache.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_covers_every_input(self):
+        key = cache_key("<p>a</p>", MODEL, "prompt", 8192)
+        self.assertEqual(key, cache_key("<p>a</p>", MODEL, "prompt", 8192))
+        self.assertEqual(
+            len(
+                {
+                    key,
+                    cache_key("<p>b</p>", MODEL, "prompt", 8192),
+                    cache_key("<p>a</p>", "openai/gpt-4o", "prompt", 8192),
+                    cache_key("<p>a</p>", MODEL, "other prompt", 8192),
+                    cache_key("<p>a</p>", MODEL, "prompt", 4096),
+                }
+            ),
+            5,
+        )
+
+    def test_hits_misses_and_lifetime_stats(self):
+        """Counters are per run, and stats add them to earlier runs."""
+        with LlmCache(self.path) as cache:
+            self.assertIsNone(cache.get("k"))
+            cache.put("k", "# Cached")
+            self.assertEqual(cache.get("k"), "# Cached")
+        with LlmCache(self.path) as cache:
+            self.assertEqual(cache.get("k"), "# Cached")
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+            stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual((stats["entries"], stats["bytes"]), (1, len("# Cached")))
+
+    def test_least_recently_used_are_evicted_first(self):
+        with LlmCache(self.path, max_bytes=250) as cache:
+            for name in "abc":
+                cache.put(name, name * 100)
+                if name == "b":
+                    cache.get("a")  # "b" is now the least recently used
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a"), "a" * 100)
+            self.assertEqual(cache.stats()["bytes"], 200)
+            self.assertEqual(cache.prune(0), (2, 200))
+
+
+class TestRunLlmFilterCache(unittest.TestCase):
+    """Tests for run_llm_filter with a cache."""
+
+    def test_repeat_run_makes_no_llm_call(self):
+        llm_filter = CountingFilter()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.db"
+
+            async def run() -> list[str | None]:
+                with LlmCache(path) as cache:
+                    return [
+                        await run_llm_filter(
+                            llm_filter, html, "https://docs.example.com/", cache=cache
+                        )
+                        for html in ("<p>one</p>", "<p>two</p>", "<p>one</p>")
+                    ]
+
+            first = asyncio.run(run())
+            second = asyncio.run(run())
+
+        self.assertEqual(first, ["# Page 1", "# Page 2", "# Page 1"])
+        self.assertEqual(second, first)
+        self.assertEqual(llm_filter.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
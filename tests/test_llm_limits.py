@@ -0,0 +1,106 @@
+"""Unit tests for LLM rate limiting.
+
+Tests LlmRateLimiter, rate_limiter_for and run_llm_filter:
+- A spent token budget delays the next call until it has refilled
+- Calls larger than a minute's budget are capped instead of waiting forever
+- Limiters are shared per provider
+- Filter calls run on the given executor and are charged per estimated chunk
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.llm_limits import LlmRateLimiter, provider_of, rate_limiter_for
+from app.processing import run_llm_filter
+
+
+class FakeFilter:
+    """Stands in for LLMContentFilter, recording the thread it ran on."""
+
+    chunk_token_threshold = 100
+
+    def __init__(self):
+        self.threads: list[str] = []
+
+    def filter_content(self, html: str) -> list[str]:
+        self.threads.append(threading.current_thread().name)
+        return ["# Page", "More"]
+
+
+class RecordingLimiter(LlmRateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[tuple[int, int]] = []
+
+    async def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        self.calls.append((requests, tokens))
+
+
+class TestLlmRateLimiter(unittest.TestCase):
+    """Tests for LlmRateLimiter and rate_limiter_for."""
+
+    def test_spent_budget_waits_for_refill(self):
+        """After a full minute's tokens, the next call waits for its share."""
+        limiter = LlmRateLimiter(tpm=600)  # 10 tokens per second
+
+        async def run() -> float:
+            await limiter.acquire(tokens=600)
+            start = time.perf_counter()
+            await limiter.acquire(tokens=3)
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        self.assertGreaterEqual(elapsed, 0.25)
+        self.assertLess(elapsed, 0.6)
+        self.assertGreater(limiter.waited, 0)
+
+    def test_oversized_call_and_no_limits(self):
+        """A call above the budget takes the whole bucket; no limits never wait."""
+        limiter = LlmRateLimiter(rpm=6000, tpm=600)
+
+        async def run() -> float:
+            start = time.perf_counter()
+            await limiter.acquire(requests=2, tokens=50_000)
+            await LlmRateLimiter().acquire(requests=10**6, tokens=10**9)
+            return time.perf_counter() - start
+
+        self.assertLess(asyncio.run(run()), 0.05)
+
+    def test_limiters_are_shared_per_provider(self):
+        first = rate_limiter_for("openrouter/mistralai/codestral-2501", rpm=60)
+        same = rate_limiter_for("openrouter/openai/gpt-4o", rpm=60)
+        other = rate_limiter_for("anthropic/claude-3-haiku", rpm=60)
+
+        self.assertIs(first, same)
+        self.assertIsNot(first, other)
+        self.assertEqual(provider_of("gpt-4"), "openai")
+
+
+class TestRunLlmFilter(unittest.TestCase):
+    """Tests for run_llm_filter's executor and limiter arguments."""
+
+    def test_shared_executor_and_chunk_estimate(self):
+        """The filter runs on the given pool and is charged per chunk."""
+        llm_filter = FakeFilter()
+        limiter = RecordingLimiter()
+        html = "<p>" + "x" * 997  # 1000 chars, about 250 tokens
+
+        async def run() -> str | None:
+            with ThreadPoolExecutor(thread_name_prefix="llm-test") as executor:
+                return await run_llm_filter(
+                    llm_filter, html, "https://docs.example.com/", executor, limiter
+                )
+
+        markdown = asyncio.run(run())
+
+        self.assertEqual(markdown, "# Page\n\n---\n\nMore")
+        self.assertTrue(llm_filter.threads[0].startswith("llm-test"))
+        self.assertEqual(limiter.calls, [(3, 250)])
+
+
+if __name__ == "__main__":
+    unittest.main()
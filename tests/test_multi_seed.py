@@ -0,0 +1,174 @@
+"""Unit tests for multi-seed discovery (`scribe discover --seeds`).
+
+Tests SharedCrawler and the seed batching in the CLI:
+- Several browser crawls share a single lazily started browser
+- Seeds on one host run serially while other hosts proceed concurrently
+- Merged output keeps seed order and drops URLs found under several seeds
+- --per-seed writes one file per seed next to the output file
+"""
+
+import argparse
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from helpers import FakeCrawler
+
+from app.cli import _discover_seeds, discover_command
+from app.fast_discovery import SharedCrawler, extract_links_fast
+
+
+class FakeBrowser(FakeCrawler):
+    """Serves one child link below every page."""
+
+    def links(self, url: str) -> list[str]:
+        return [f"{url}child"]
+
+
+class CleanConsoleStub:
+    """Swallows console output from the discovery helpers."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestSharedCrawler(unittest.TestCase):
+    """Tests for SharedCrawler."""
+
+    def setUp(self):
+        FakeBrowser.reset()
+
+    def test_concurrent_crawls_launch_one_browser(self):
+        """Two deep crawls started together reuse the same browser."""
+
+        async def run() -> tuple[list[list[str]], int]:
+            async with SharedCrawler() as browser:
+                results = await asyncio.gather(
+                    extract_links_fast(
+                        "https://a.example.com/", depth=2, browser=browser
+                    ),
+                    extract_links_fast(
+                        "https://b.example.com/", depth=2, browser=browser
+                    ),
+                )
+            return list(results), browser.launches
+
+        with patch("app.fast_discovery.AsyncWebCrawler", FakeBrowser):
+            results, launches = asyncio.run(run())
+
+        self.assertEqual(
+            results[0],
+            ["https://a.example.com/child", "https://a.example.com/childchild"],
+        )
+        self.assertEqual(launches, 1)
+        self.assertEqual((FakeBrowser.launches, FakeBrowser.closes), (1, 1))
+
+    def test_unused_browser_is_never_started(self):
+        """Seeds answered without a browser cost no launch."""
+
+        async def run() -> int:
+            async with SharedCrawler() as browser:
+                pass
+            return browser.launches
+
+        with patch("app.fast_discovery.AsyncWebCrawler", FakeBrowser):
+            self.assertEqual(asyncio.run(run()), 0)
+        self.assertEqual(FakeBrowser.closes, 0)
+
+
+def seed_args(seeds: list[str], output_file: str = "urls.txt", **overrides):
+    values = dict(
+        start_url=None,
+        output_file=output_file,
+        verbose=False,
+        seeds=seeds,
+        per_seed=False,
+        seed_concurrency=4,
+        bloom_capacity=None,
+    )
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class TestSeedDiscovery(unittest.TestCase):
+    """Tests for discovering a batch of seeds."""
+
+    seeds = [
+        "https://a.example.com/one/",
+        "https://a.example.com/two/",
+        "https://b.example.com/",
+        "https://c.example.com/",
+    ]
+
+    def test_same_host_seeds_run_serially(self):
+        """A host never has two seeds in flight; other hosts overlap it."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        overall = {"now": 0, "peak": 0}
+
+        async def fake_discovery(args, console, on_discovered=None, browser=None):
+            host = args.start_url.split("/")[2]
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            overall["now"] += 1
+            overall["peak"] = max(overall["peak"], overall["now"])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            overall["now"] -= 1
+            if host == "c.example.com":
+                raise RuntimeError("unreachable")
+            return [f"{args.start_url}page"]
+
+        async def run() -> list[list[str]]:
+            async with SharedCrawler() as browser:
+                return await _discover_seeds(
+                    seed_args(self.seeds), CleanConsoleStub(), browser
+                )
+
+        with patch("app.cli._run_discovery", fake_discovery):
+            results = asyncio.run(run())
+
+        self.assertEqual(peak["a.example.com"], 1)
+        self.assertEqual(overall["peak"], 3)
+        self.assertEqual(results[1], ["https://a.example.com/two/page"])
+        self.assertEqual(results[3], [])
+
+    def run_command(self, tmp: str, **overrides) -> int:
+        async def fake_discovery(args, console, on_discovered=None, browser=None):
+            return [f"{args.start_url}page", "https://b.example.com/shared"]
+
+        args = seed_args(self.seeds[1:3], str(Path(tmp) / "urls.txt"), **overrides)
+        with patch("app.cli._run_discovery", fake_discovery):
+            return asyncio.run(discover_command(args))
+
+    def test_merged_output_keeps_seed_order(self):
+        """URLs follow seed order and shared URLs are written once."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(self.run_command(tmp), 0)
+            lines = (Path(tmp) / "urls.txt").read_text().split()
+
+        self.assertEqual(
+            lines,
+            [
+                "https://a.example.com/two/page",
+                "https://b.example.com/shared",
+                "https://b.example.com/page",
+            ],
+        )
+
+    def test_per_seed_output_files(self):
+        """Each seed gets its own complete list."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(self.run_command(tmp, per_seed=True), 0)
+            files = sorted(p.name for p in Path(tmp).iterdir())
+            first = (Path(tmp) / files[0]).read_text().split()
+
+        self.assertEqual(len(files), 2)
+        self.assertTrue(all(name.startswith("urls-") for name in files))
+        self.assertEqual(first[-1], "https://b.example.com/shared")
+
+
+if __name__ == "__main__":
+    unittest.main()
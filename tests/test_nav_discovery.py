@@ -0,0 +1,126 @@
+"""Unit tests for navigation-first discovery and the TOC extractor.
+
+Tests extract_nav_toc with a mocked HTTP transport:
+- Sidebar links keep their titles, nesting levels and document order
+- A complete TOC is read from the start page plus a few spot checks
+- Collapsed sidebars are expanded with children placed after their section
+- Pages without a navigation tree return an empty list
+"""
+
+import asyncio
+import unittest
+
+from helpers import patch_http_client, serve_routes
+
+from app.nav_discovery import extract_nav_toc
+from app.utils.html_scan import TocEntry, TocExtractor
+
+BASE = "https://docs.example.com"
+TOP = ["intro", "install", "guide/", "api/", "faq", "changelog"]
+CHILDREN = {"guide/": ["guide/basics", "guide/advanced"], "api/": ["api/client"]}
+
+
+def sidebar(expanded: set[str]) -> str:
+    """Sphinx-style sidebar showing the children of the expanded sections."""
+    items = []
+    for path in TOP:
+        sub = ""
+        if path in expanded:
+            sub = "<ul>" + "".join(
+                f'<li><a href="/{child}">{child}</a></li>' for child in CHILDREN[path]
+            )
+            sub += "</ul>"
+        items.append(f'<li class="toctree-l1"><a href="/{path}">{path}</a>{sub}</li>')
+    return (
+        f'<div class="sphinxsidebar" role="navigation"><ul>{"".join(items)}</ul></div>'
+    )
+
+
+def page(nav: str) -> str:
+    header = '<nav class="top"><a href="/">Home</a></nav>'
+    return f"<html><body>{header}{nav}<main><p>Text</p></main></body></html>"
+
+
+class TestTocExtractor(unittest.TestCase):
+    """Tests for the incremental TocExtractor."""
+
+    def test_levels_titles_and_containers(self):
+        """Each navigation container is a separate, ordered entry list."""
+        html = page(sidebar({"guide/"}))
+        extractor = TocExtractor(f"{BASE}/")
+        for start in range(0, len(html), 11):
+            extractor.feed(html[start : start + 11])
+        extractor.close()
+
+        header, toc = extractor.containers
+        self.assertEqual(header, [TocEntry(f"{BASE}/", "Home", 1)])
+        self.assertEqual(toc[2], TocEntry(f"{BASE}/guide/", "guide/", 1))
+        self.assertEqual(toc[3], TocEntry(f"{BASE}/guide/basics", "guide/basics", 2))
+        self.assertEqual(toc[5].url, f"{BASE}/api/")
+
+
+class TestNavDiscovery(unittest.TestCase):
+    """Tests for extract_nav_toc."""
+
+    def setUp(self):
+        self.fetched: list[str] = []
+        self.routes: dict[str, str] = {}
+
+    def serve(self, collapsed: bool) -> None:
+        everything = set(CHILDREN)
+        self.routes[f"{BASE}/"] = page(sidebar(set() if collapsed else everything))
+        for path in TOP + [c for children in CHILDREN.values() for c in children]:
+            section = path.split("/")[0] + "/" if "/" in path else None
+            expanded = {section} & everything if collapsed else everything
+            self.routes[f"{BASE}/{path}"] = page(sidebar(expanded))
+
+    def discover(self, **kwargs) -> list[TocEntry]:
+        handler = serve_routes(
+            self.routes, self.fetched, headers={"content-type": "text/html"}
+        )
+        with patch_http_client("app.nav_discovery", handler):
+            return asyncio.run(extract_nav_toc(f"{BASE}/", **kwargs))
+
+    def expected_order(self) -> list[str]:
+        order = []
+        for path in TOP:
+            order.append(f"{BASE}/{path}")
+            order.extend(f"{BASE}/{child}" for child in CHILDREN.get(path, []))
+        return order
+
+    def test_complete_toc_needs_no_crawl(self):
+        """A full sidebar is trusted after a few spot checks."""
+        self.serve(collapsed=False)
+
+        toc = self.discover(check_pages=2)
+
+        self.assertEqual([entry.url for entry in toc], self.expected_order())
+        self.assertEqual(len(self.fetched), 3)
+        self.assertEqual(toc[3].level, 2)
+
+    def test_collapsed_sidebar_is_expanded_in_reading_order(self):
+        """Children revealed on section pages follow their section."""
+        self.serve(collapsed=True)
+
+        toc = self.discover()
+
+        self.assertEqual([entry.url for entry in toc], self.expected_order())
+        self.assertEqual({entry.level for entry in toc}, {1, 2})
+
+    def test_max_pages_truncates(self):
+        """max_pages caps the TOC without changing its order."""
+        self.serve(collapsed=True)
+
+        toc = self.discover(max_pages=4)
+
+        self.assertEqual([entry.url for entry in toc], self.expected_order()[:4])
+
+    def test_page_without_sidebar(self):
+        """A header-only page is not mistaken for a table of contents."""
+        self.routes[f"{BASE}/"] = page("")
+
+        self.assertEqual(self.discover(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,305 @@
+"""Unit tests for the discovery-to-scraping pipeline of `scribe process`.
+
+Tests UrlChannel, Stage, stream_politely and the crawl_breadth_first hook:
+- URLs are de-duplicated, --start-at is honoured and close ends iteration
+- Stages run their workers concurrently and block producers when full
+- Pages are fetched while the URL source is still being produced
+- Skipped (unchanged) pages are yielded without being fetched
+- A slow scraper holds discovery back instead of letting it run ahead
+- Discovery reports each newly queued URL as soon as the frontier accepts it
+- `process` feeds crawled and sitemap URLs to the scraper without a temp file
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import unittest
+from contextlib import aclosing
+from unittest.mock import patch
+
+from helpers import FakeCrawler
+
+from app.cli import process_command
+from app.frontier import CrawlFrontier, crawl_breadth_first
+from app.pipeline import Stage, UrlChannel
+from app.politeness import HostScheduler, stream_politely
+
+BASE = "https://docs.example.com"
+
+
+class TestUrlChannel(unittest.TestCase):
+    """Tests for UrlChannel."""
+
+    def test_dedup_start_at_and_close(self):
+        """Repeated URLs are dropped and the first `start_at` are skipped."""
+
+        async def run() -> list[str]:
+            channel = UrlChannel(maxsize=2, start_at=1)
+
+            async def produce():
+                await channel.put_many([f"{BASE}/a", f"{BASE}/b", f"{BASE}/a"])
+                await channel.put_many([f"{BASE}/c", f"{BASE}/b", f"{BASE}/d"])
+                channel.close()
+
+            producer = asyncio.create_task(produce())
+            received = [url async for url in channel]
+            await producer
+            self.assertEqual(len(channel), 3)
+            return received
+
+        self.assertEqual(asyncio.run(run()), [f"{BASE}/b", f"{BASE}/c", f"{BASE}/d"])
+
+
+class TestStage(unittest.TestCase):
+    """Tests for Stage."""
+
+    def test_workers_overlap_and_drain(self):
+        """Items are handled concurrently and all of them before exit."""
+        handled: list[int] = []
+        running = peak = 0
+
+        async def handle(item: int) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            handled.append(item)
+
+        async def run() -> float:
+            start = time.perf_counter()
+            async with Stage(handle, concurrency=4, maxsize=2) as stage:
+                for item in range(8):
+                    await stage.put(item)
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        self.assertEqual(sorted(handled), list(range(8)))
+        self.assertEqual(peak, 4)
+        # Two rounds of four; one at a time would take 0.4s
+        self.assertLess(elapsed, 0.25)
+
+    def test_full_queue_blocks_producer(self):
+        """put waits once workers are busy and the queue is full; errors are skipped."""
+        handled: list[int] = []
+
+        async def run() -> bool:
+            gate = asyncio.Event()
+
+            async def handle(item: int) -> None:
+                await gate.wait()
+                if item == 0:
+                    raise ValueError("boom")
+                handled.append(item)
+
+            async with Stage(handle, concurrency=1, maxsize=2) as stage:
+                for item in range(3):
+                    await stage.put(item)
+                try:
+                    await asyncio.wait_for(stage.put(3), timeout=0.05)
+                    blocked = False
+                except asyncio.TimeoutError:
+                    blocked = True
+                gate.set()
+                await stage.put(3)
+            return blocked
+
+        with patch("app.pipeline.logger") as logger:
+            blocked = asyncio.run(run())
+
+        self.assertTrue(blocked)
+        logger.error.assert_called_once()
+        self.assertEqual(handled, [1, 2, 3])
+
+
+class TestStreamPolitely(unittest.TestCase):
+    """Tests for stream_politely."""
+
+    def setUp(self):
+        FakeCrawler.reset()
+
+    def test_pages_are_yielded_before_the_source_ends(self):
+        """The first page arrives while discovery is still producing URLs."""
+        crawler = FakeCrawler()
+
+        async def run() -> tuple[list[tuple[int, str]], int]:
+            channel = UrlChannel()
+            produced_when_first_yielded = -1
+
+            async def produce():
+                for i in range(5):
+                    await channel.put_many([f"{BASE}/{i}"])
+                    await asyncio.sleep(0.02)
+                channel.close()
+
+            producer = asyncio.create_task(produce())
+            scheduler = HostScheduler(rate=1000, respect_robots=False)
+            seen = []
+            async for index, url, result in stream_politely(
+                crawler, channel, None, scheduler
+            ):
+                if produced_when_first_yielded < 0:
+                    produced_when_first_yielded = len(channel)
+                self.assertEqual(result.url, url)
+                seen.append((index, url))
+            await producer
+            return seen, produced_when_first_yielded
+
+        seen, produced = asyncio.run(run())
+
+        self.assertEqual(sorted(seen), [(i, f"{BASE}/{i}") for i in range(5)])
+        self.assertLess(produced, 5)
+
+    def test_skipped_urls_are_not_fetched(self):
+        """URLs the skip predicate accepts come back with a None result."""
+        crawler = FakeCrawler()
+        urls = [f"{BASE}/same", f"{BASE}/new"]
+
+        async def is_unchanged(url: str) -> bool:
+            return url.endswith("/same")
+
+        async def run() -> dict[str, object]:
+            scheduler = HostScheduler(rate=1000, respect_robots=False)
+            return {
+                url: result
+                async for _, url, result in stream_politely(
+                    crawler, urls, None, scheduler, skip=is_unchanged
+                )
+            }
+
+        results = asyncio.run(run())
+
+        self.assertIsNone(results[f"{BASE}/same"])
+        self.assertEqual(crawler.fetched, [f"{BASE}/new"])
+
+    def test_slow_consumer_blocks_discovery(self):
+        """Discovery waits for a slow scraper instead of running to the end."""
+        site = {f"{BASE}/": [f"{BASE}/{i}" for i in range(200)]}
+        site.update({f"{BASE}/{i}": [f"{BASE}/{i}/child"] for i in range(200)})
+        crawler = FakeCrawler()
+
+        async def fetch_links(url: str) -> list[str]:
+            return site.get(url, [])
+
+        async def run() -> tuple[int, bool]:
+            channel = UrlChannel(maxsize=8)
+            with CrawlFrontier(":memory:", f"{BASE}/") as frontier:
+                discovery = asyncio.create_task(
+                    crawl_breadth_first(
+                        frontier, fetch_links, depth=3, on_discovered=channel.put_many
+                    )
+                )
+                scheduler = HostScheduler(rate=1000, burst=1000, respect_robots=False)
+                stream = stream_politely(
+                    crawler, channel, None, scheduler, concurrency=2
+                )
+                consumed = 0
+                async with aclosing(stream):
+                    async for _ in stream:
+                        consumed += 1
+                        if consumed == 5:
+                            break
+                        await asyncio.sleep(0.01)
+                queued, finished = len(channel), discovery.done()
+                discovery.cancel()
+            return queued, finished
+
+        queued, finished = asyncio.run(run())
+
+        self.assertFalse(finished)
+        self.assertLess(queued, 40)
+
+
+class TestDiscoveryHook(unittest.TestCase):
+    """Tests for the on_discovered hook of crawl_breadth_first."""
+
+    def test_new_urls_are_reported_per_page(self):
+        """Each crawled page reports only the URLs it added to the frontier."""
+        site = {
+            f"{BASE}/": [f"{BASE}/a", f"{BASE}/b"],
+            f"{BASE}/a": [f"{BASE}/b", f"{BASE}/c"],
+            f"{BASE}/b": [],
+        }
+        reported: list[list[str]] = []
+
+        async def fetch_links(url: str) -> list[str]:
+            return site.get(url, [])
+
+        async def on_discovered(urls: list[str]) -> None:
+            reported.append(urls)
+
+        async def run() -> list[str]:
+            with CrawlFrontier(":memory:", f"{BASE}/") as frontier:
+                await crawl_breadth_first(
+                    frontier, fetch_links, depth=2, on_discovered=on_discovered
+                )
+                return frontier.ordered_urls()
+
+        ordered = asyncio.run(run())
+
+        self.assertEqual(reported, [[f"{BASE}/a", f"{BASE}/b"], [f"{BASE}/c"]])
+        self.assertEqual([u for batch in reported for u in batch], ordered)
+
+
+class TestProcessPipeline(unittest.TestCase):
+    """Tests for the pipelined process_command."""
+
+    def run_process(self, stream: bool) -> tuple[dict, list[str]]:
+        """Run process_command with fake discovery and a recording scraper."""
+        urls = [f"{BASE}/a", f"{BASE}/b", f"{BASE}/c"]
+        scraped: list[str] = []
+
+        async def fake_discovery(args, console, on_discovered=None):
+            if stream:
+                for url in urls:
+                    await on_discovered([url])
+            return urls
+
+        async def fake_scraper(
+            urls_to_scrape, args, output_dir, browser_config, positions=None
+        ):
+            async for url in urls_to_scrape:
+                scraped.append(url)
+            return {"successful_urls": list(scraped), "failed_urls": []}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            args = argparse.Namespace(
+                start_url=f"{BASE}/",
+                output_dir=tmp,
+                start_at=1,
+                fast=True,
+                verbose=False,
+                depth=2,
+                max_pages=None,
+                concurrency=4,
+                strategy="crawl",
+                include=None,
+                exclude=None,
+                auto_scope=False,
+                pipeline=True,
+            )
+            with (
+                patch("app.cli._run_discovery", fake_discovery),
+                patch("app.cli.process_urls_fast", fake_scraper),
+            ):
+                summary = asyncio.run(process_command(args))
+        return summary, scraped
+
+    def test_crawled_urls_stream_into_scraper(self):
+        """URLs reported during the crawl are scraped once, after --start-at."""
+        summary, scraped = self.run_process(stream=True)
+
+        self.assertEqual(scraped, [f"{BASE}/b", f"{BASE}/c"])
+        self.assertEqual(summary["successful_urls"], scraped)
+
+    def test_sitemap_results_are_forwarded(self):
+        """Discovery that only returns a list still reaches the scraper."""
+        _, scraped = self.run_process(stream=False)
+
+        self.assertEqual(scraped, [f"{BASE}/b", f"{BASE}/c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
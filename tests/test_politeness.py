@@ -0,0 +1,245 @@
+"""Unit tests for the per-host politeness scheduler.
+
+Tests HostScheduler and stream_politely:
+- Token-bucket bursts followed by evenly spaced requests
+- robots.txt Crawl-delay and Request-rate, fetched once per host
+- Different hosts proceeding in parallel
+- A host waiting out its delay not holding a fetch slot, nor bursting after one
+- Results tagged with their input index
+- Streamed pages arrive before the batch is done, with bounded work in flight
+- A bounded URL channel is read only as fast as pages are consumed
+"""
+
+import asyncio
+import time
+import unittest
+from contextlib import aclosing
+
+import httpx
+from helpers import FakeCrawler, mock_client, serve_routes
+
+from app.constants import MAX_CRAWL_DELAY
+from app.pipeline import UrlChannel
+from app.politeness import HostScheduler, stream_politely
+
+
+def robots_client(robots: dict[str, str], calls: list[str]) -> httpx.AsyncClient:
+    """Client serving the given robots.txt bodies by host (404 otherwise)."""
+    routes = {f"https://{host}/robots.txt": body for host, body in robots.items()}
+    return mock_client(serve_routes(routes, calls))
+
+
+class TestHostScheduler(unittest.TestCase):
+    """Tests for HostScheduler."""
+
+    def test_burst_then_rate(self):
+        """The first `burst` requests pass at once, later ones wait 1/rate."""
+
+        async def run() -> float:
+            scheduler = HostScheduler(rate=20, burst=2, respect_robots=False)
+            start = time.perf_counter()
+            for _ in range(4):
+                await scheduler.acquire("https://docs.example.com/page")
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    def test_crawl_delay_from_robots_is_cached(self):
+        """Crawl-delay lowers the host rate and robots.txt is read once."""
+        calls: list[str] = []
+        robots = {"slow.example.com": "User-agent: *\nCrawl-delay: 2\n"}
+
+        async def run() -> HostScheduler:
+            scheduler = HostScheduler(client=robots_client(robots, calls))
+            await scheduler.acquire("https://slow.example.com/a")
+            await scheduler.acquire("https://fast.example.com/a")
+            return scheduler
+
+        scheduler = asyncio.run(run())
+
+        self.assertEqual(scheduler.host_rate("https://slow.example.com/b"), 0.5)
+        self.assertEqual(scheduler.host_rate("https://fast.example.com/b"), 4.0)
+        self.assertEqual(
+            calls,
+            [
+                "https://slow.example.com/robots.txt",
+                "https://fast.example.com/robots.txt",
+            ],
+        )
+
+    def test_request_rate_and_cap(self):
+        """Request-rate is honoured and absurd delays are capped."""
+        robots = {
+            "rate.example.com": "User-agent: *\nRequest-rate: 1/5\n",
+            "huge.example.com": "User-agent: *\nCrawl-delay: 86400\n",
+        }
+
+        async def run() -> HostScheduler:
+            scheduler = HostScheduler(client=robots_client(robots, []))
+            await scheduler.acquire("https://rate.example.com/")
+            await scheduler.acquire("https://huge.example.com/")
+            return scheduler
+
+        scheduler = asyncio.run(run())
+
+        self.assertEqual(scheduler.host_rate("https://rate.example.com/"), 0.2)
+        self.assertEqual(
+            scheduler.host_rate("https://huge.example.com/"), 1 / MAX_CRAWL_DELAY
+        )
+
+
+class TestStreamPolitely(unittest.TestCase):
+    """Tests for stream_politely."""
+
+    def setUp(self):
+        FakeCrawler.reset(delay=0.01)
+
+    def test_hosts_run_in_parallel_and_index_is_kept(self):
+        """Two throttled hosts take as long as one, and results keep their index."""
+        urls = [f"https://{host}.example.com/{i}" for i in range(3) for host in "ab"]
+        crawler = FakeCrawler()
+
+        async def run():
+            scheduler = HostScheduler(rate=10, burst=1, respect_robots=False)
+            start = time.perf_counter()
+            stream = stream_politely(crawler, urls, None, scheduler)
+            results = [item async for item in stream]
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(run())
+
+        self.assertEqual(sorted(index for index, _, _ in results), list(range(6)))
+        self.assertTrue(all(urls[i] == url == r.url for i, url, r in results))
+        # Each host needs ~0.2s for three requests at 10/s; run serially it'd be ~0.4s
+        self.assertLess(elapsed, 0.35)
+        a_starts = sorted(t for u, t in crawler.started.items() if "//a." in u)
+        self.assertGreaterEqual(a_starts[1] - a_starts[0], 0.09)
+
+    def test_waiting_host_does_not_hold_a_fetch_slot(self):
+        """A page whose host is ready starts while another host waits."""
+        urls = [
+            "https://a.example.com/0",
+            "https://a.example.com/1",
+            "https://b.example.com/0",
+        ]
+        crawler = FakeCrawler()
+
+        async def run() -> float:
+            scheduler = HostScheduler(rate=5, burst=1, respect_robots=False)
+            start = time.perf_counter()
+            stream = stream_politely(crawler, urls, None, scheduler, concurrency=2)
+            async for _ in stream:
+                # The unconsumed page keeps the other fetch slot taken
+                await asyncio.sleep(0.3)
+            return start
+
+        start = asyncio.run(run())
+
+        # a/1 waits 0.2s for its host; b/0 must not queue behind it for a slot
+        self.assertLess(crawler.started[urls[2]] - start, 0.15)
+
+    def test_slot_contention_keeps_host_spacing(self):
+        """Requests that waited for a fetch slot still keep their host's rate."""
+        urls = [f"https://a.example.com/{i}" for i in range(4)]
+        crawler = FakeCrawler()
+
+        async def run():
+            scheduler = HostScheduler(rate=10, burst=1, respect_robots=False)
+            stream = stream_politely(crawler, urls, None, scheduler, concurrency=2)
+            paused = False
+            async for _ in stream:
+                if not paused:
+                    # Both slots stay taken while the host's bucket refills
+                    paused = True
+                    await asyncio.sleep(0.3)
+
+        asyncio.run(run())
+
+        starts = sorted(crawler.started.values())
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        self.assertGreaterEqual(min(gaps), 0.09)
+
+    def test_stream_bounds_work_in_flight(self):
+        """A slow consumer gets the first page early and caps checks and fetches."""
+        urls = [f"https://a.example.com/{i}" for i in range(60)]
+        crawler = FakeCrawler()
+        checking = fetched = 0
+        peaks = {"checks": 0, "unconsumed": 0}
+
+        async def skip(url):
+            nonlocal checking
+            checking += 1
+            peaks["checks"] = max(peaks["checks"], checking)
+            await asyncio.sleep(0)
+            checking -= 1
+            return url.endswith("0")
+
+        async def run():
+            nonlocal fetched
+            scheduler = HostScheduler(rate=1000, burst=100, respect_robots=False)
+            stream = stream_politely(
+                crawler, urls, None, scheduler, concurrency=4, skip=skip
+            )
+            seen = []
+            async for index, url, result in stream:
+                if not seen:
+                    first_fetched = len(crawler.started)
+                seen.append((index, url, result))
+                if result is not None:
+                    fetched += 1
+                    peaks["unconsumed"] = max(
+                        peaks["unconsumed"], len(crawler.started) - fetched
+                    )
+                await asyncio.sleep(0.005)
+            return seen, first_fetched
+
+        seen, first_fetched = asyncio.run(run())
+
+        self.assertEqual(sorted(index for index, _, _ in seen), list(range(60)))
+        self.assertTrue(all(urls[index] == url for index, url, _ in seen))
+        self.assertEqual(sum(result is None for _, _, result in seen), 6)
+        self.assertLessEqual(first_fetched, 4)
+        self.assertLessEqual(peaks["checks"], 4)
+        self.assertLessEqual(peaks["unconsumed"], 4)
+
+    def test_stream_reads_channel_at_consumer_pace(self):
+        """Routed but unfetched URLs are bounded, so the channel is not drained."""
+        crawler = FakeCrawler()
+        concurrency, maxsize = 4, 8
+        lead = []
+
+        async def run():
+            channel = UrlChannel(maxsize=maxsize)
+            produced = 0
+
+            async def produce():
+                nonlocal produced
+                for i in range(1000):
+                    await channel.put_many([f"https://a.example.com/{i}"])
+                    produced += 1
+                channel.close()
+
+            producer = asyncio.create_task(produce())
+            scheduler = HostScheduler(rate=1000, burst=1000, respect_robots=False)
+            stream = stream_politely(
+                crawler, channel, None, scheduler, concurrency=concurrency
+            )
+            async with aclosing(stream):
+                async for _ in stream:
+                    lead.append(produced - len(lead))
+                    if len(lead) == 20:
+                        break
+                    await asyncio.sleep(0.002)
+            producer.cancel()
+
+        asyncio.run(run())
+
+        # Channel, feeder, pending queue, checkers, routed and unconsumed pages
+        self.assertLessEqual(max(lead), maxsize + 1 + 4 * concurrency)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests for HEAD probing of URLs before rendering.
+
+Tests UrlProber with a mocked HTTP transport:
+- Non-HTML content types and definitive 4xx answers are dropped
+- Inconclusive answers (errors, 5xx, 405, no content type) keep the URL
+- Verdicts are cached, so repeated URLs are probed once
+- Probes waiting for a free slot still keep to the host's rate
+"""
+
+import asyncio
+import time
+import unittest
+
+import httpx
+from helpers import patch_http_client
+
+from app.politeness import HostScheduler
+from app.probe import UrlProber
+
+BASE = "https://docs.example.com"
+RESPONSES = {
+    "/guide/": (200, "text/html; charset=utf-8"),
+    "/page.xhtml": (200, "application/xhtml+xml"),
+    "/download": (200, "application/pdf"),
+    "/gone": (404, "text/html"),
+    "/removed": (410, ""),
+    "/no-head": (405, ""),
+    "/flaky": (503, "text/html"),
+    "/untyped": (200, ""),
+}
+
+
+class TestUrlProber(unittest.TestCase):
+    """Tests for UrlProber."""
+
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/timeout":
+            raise httpx.ReadTimeout("slow", request=request)
+        status, content_type = RESPONSES[request.url.path]
+        headers = {"content-type": content_type} if content_type else {}
+        return httpx.Response(status, headers=headers)
+
+    def probe(self, *batches: list[str]) -> tuple[list[list[str]], UrlProber]:
+        async def run() -> tuple[list[list[str]], UrlProber]:
+            scheduler = HostScheduler(rate=1000, respect_robots=False)
+            async with UrlProber(scheduler) as prober:
+                results = [await prober.filter(batch) for batch in batches]
+            return results, prober
+
+        with patch_http_client("app.probe", self.handler):
+            return asyncio.run(run())
+
+    def test_drops_non_html_and_dead_urls(self):
+        """Only renderable pages and inconclusive answers survive, in order."""
+        urls = [f"{BASE}{path}" for path in [*RESPONSES, "/timeout"]]
+
+        (kept,), prober = self.probe(urls)
+
+        self.assertEqual(
+            kept,
+            [
+                f"{BASE}/guide/",
+                f"{BASE}/page.xhtml",
+                f"{BASE}/no-head",
+                f"{BASE}/flaky",
+                f"{BASE}/untyped",
+                f"{BASE}/timeout",
+            ],
+        )
+        self.assertEqual(prober.dropped, {"not html": 1, "dead": 2})
+        self.assertEqual(prober.probed, len(RESPONSES))
+        self.assertEqual({r.method for r in self.requests}, {"HEAD"})
+
+    def test_verdicts_are_cached_across_batches(self):
+        """A URL seen in several batches is probed once and judged the same."""
+        gone, guide = f"{BASE}/gone", f"{BASE}/guide/"
+
+        results, prober = self.probe([gone, guide, gone], [guide, gone])
+
+        self.assertEqual(results, [[guide], [guide]])
+        self.assertEqual((prober.probed, len(self.requests)), (2, 2))
+        self.assertEqual(prober.total_dropped, 1)
+
+    def test_slot_contention_keeps_host_spacing(self):
+        """Probes queued behind busy slots do not fire back to back."""
+        urls = [f"{BASE}/{i}" for i in range(4)]
+        durations = {"/0": 0.5, "/1": 0.4}
+        started: list[float] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            started.append(time.perf_counter())
+            await asyncio.sleep(durations.get(request.url.path, 0))
+            return httpx.Response(200, headers={"content-type": "text/html"})
+
+        async def run() -> None:
+            scheduler = HostScheduler(rate=10, burst=1, respect_robots=False)
+            async with UrlProber(scheduler, concurrency=2) as prober:
+                await prober.filter(urls)
+
+        with patch_http_client("app.probe", handler):
+            asyncio.run(run())
+
+        # Both slots free up together; the last two probes must stay 0.1s apart
+        gaps = [b - a for a, b in zip(started, started[1:], strict=False)]
+        self.assertGreaterEqual(min(gaps), 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Unit tests for redirect- and alias-aware de-duplication.
+
+Tests final_page_url and RedirectMap:
+- A page's rel=canonical target names it, else its final redirected URL
+- The first URL to reach a final page claims it; later ones are duplicates
+- Redirects persist, so the next run skips duplicates before fetching
+- Redirects that disappeared are dropped from the map
+- A URL that failed to save its page releases the claim to later aliases
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.redirects import RedirectMap, final_page_url
+
+PAGE = "https://docs.example.com/guide/"
+HTTP_PAGE = "http://docs.example.com/guide"
+MOVED = "https://docs.example.com/old-guide"
+
+
+def crawl_result(html="", redirected_url=None):
+    return SimpleNamespace(html=html, redirected_url=redirected_url)
+
+
+class TestFinalPageUrl(unittest.TestCase):
+    """Tests for naming the page a crawl result holds."""
+
+    def test_canonical_link_names_the_page(self):
+        """Relative canonical links resolve against the final URL."""
+        html = (
+            '<html><head><link rel="stylesheet" href="/s.css">'
+            '<link rel="Canonical" href="../guide/#top"></head><body></body></html>'
+        )
+        result = crawl_result(html, redirected_url=MOVED)
+        self.assertEqual(final_page_url(HTTP_PAGE, result), PAGE)
+
+    def test_redirect_target_without_canonical(self):
+        """Pages without a canonical link are named by their final URL."""
+        body_link = '<body><link rel="canonical" href="/elsewhere"></body>'
+        self.assertEqual(final_page_url(MOVED, crawl_result(body_link, PAGE)), PAGE)
+        self.assertEqual(final_page_url(PAGE, crawl_result()), PAGE)
+
+    def test_canonical_to_site_root_is_ignored_on_deeper_pages(self):
+        """A site-wide canonical link to the homepage does not merge all pages."""
+        html = '<head><link rel="canonical" href="https://docs.example.com/"></head>'
+        self.assertEqual(final_page_url(PAGE, crawl_result(html)), PAGE)
+
+
+class TestRedirectMap(unittest.TestCase):
+    """Tests for RedirectMap claims and persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_redirect_to_saved_page_is_duplicate(self):
+        """A URL redirecting onto an already claimed page is not saved again."""
+        redirects = RedirectMap(self.output_dir)
+        self.assertIsNone(redirects.claim(PAGE, PAGE))
+        self.assertEqual(redirects.claim(HTTP_PAGE, PAGE), PAGE)
+        self.assertIsNone(redirects.claim(PAGE, PAGE))
+        self.assertEqual(redirects.duplicates, {HTTP_PAGE: PAGE})
+
+    def test_released_page_can_be_saved_by_alias(self):
+        """After the owner fails, the next URL reaching the page claims it."""
+        redirects = RedirectMap(self.output_dir)
+        self.assertFalse(redirects.skip_duplicate(PAGE))
+        redirects.release(PAGE)
+
+        self.assertIsNone(redirects.claim(HTTP_PAGE, PAGE))
+        self.assertEqual(redirects.claim(MOVED, PAGE), HTTP_PAGE)
+        self.assertEqual(redirects.duplicates, {MOVED: HTTP_PAGE})
+
+    def test_known_redirects_skip_fetching_next_run(self):
+        """Saved redirects let a later run recognize duplicates up front."""
+        first = RedirectMap(self.output_dir)
+        first.claim(MOVED, PAGE)
+        first.save()
+
+        second = RedirectMap(self.output_dir)
+        self.assertEqual(second.resolve(MOVED), PAGE)
+        self.assertFalse(second.skip_duplicate(PAGE))
+        self.assertTrue(second.skip_duplicate(MOVED))
+        self.assertEqual(second.resolved, 1)
+        self.assertEqual(second.owner(MOVED), PAGE)
+        self.assertIsNone(second.owner(PAGE))
+        self.assertIsNone(second.claim(PAGE, PAGE))
+
+    def test_removed_redirect_is_forgotten(self):
+        """A URL that no longer redirects is dropped from the saved map."""
+        first = RedirectMap(self.output_dir)
+        first.claim(MOVED, PAGE)
+        first.save()
+
+        second = RedirectMap(self.output_dir)
+        second.claim(MOVED, MOVED)
+        second.save()
+        self.assertEqual(RedirectMap(self.output_dir).resolve(MOVED), MOVED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Unit tests for conditional revalidation of scraped pages.
+
+Tests ValidatorStore and Revalidator with a mocked HTTP transport:
+- Validators persist across runs and only apply to matching settings
+- Pages whose previous Markdown is missing are always re-scraped
+- 304 responses mark pages unchanged; anything else re-scrapes them
+- Reused output is renamed when a page's list position changes
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+from helpers import patch_http_client
+
+from app.politeness import HostScheduler
+from app.revalidation import Revalidator, ValidatorStore, settings_variant
+
+URL_A = "https://docs.example.com/a"
+URL_B = "https://docs.example.com/b"
+
+
+class TestValidatorStore(unittest.TestCase):
+    """Tests for ValidatorStore persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name)
+        (self.output_dir / "001_a.md").write_text("# A", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_validators_round_trip(self):
+        """Saved validators become conditional headers on the next run."""
+        store = ValidatorStore(self.output_dir, "fast")
+        store.record(URL_A, {"ETag": '"v1"', "Last-Modified": "Mon"}, "001_a.md")
+        store.save()
+
+        reloaded = ValidatorStore(self.output_dir, "fast")
+        self.assertEqual(
+            reloaded.conditional_headers(URL_A),
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"},
+        )
+
+    def test_other_settings_or_missing_output_are_not_reused(self):
+        """A different model/prompt or a deleted file forces a re-scrape."""
+        store = ValidatorStore(self.output_dir, settings_variant(False, "m1", "p"))
+        store.record(URL_A, {"etag": '"v1"'}, "001_a.md")
+        store.record(URL_B, {"etag": '"v2"'}, "002_b.md")
+        store.save()
+
+        other = ValidatorStore(self.output_dir, settings_variant(False, "m2", "p"))
+        same = ValidatorStore(self.output_dir, settings_variant(False, "m1", "p"))
+        self.assertEqual(other.conditional_headers(URL_A), {})
+        self.assertEqual(same.conditional_headers(URL_A), {"If-None-Match": '"v1"'})
+        self.assertEqual(same.conditional_headers(URL_B), {})
+
+    def test_keep_renames_moved_output(self):
+        """Reused Markdown follows the page to its new list position."""
+        store = ValidatorStore(self.output_dir, "fast")
+        store.record(URL_A, {"etag": '"v1"'}, "001_a.md")
+
+        store.keep(URL_A, "005_a.md")
+
+        self.assertTrue((self.output_dir / "005_a.md").is_file())
+        self.assertFalse((self.output_dir / "001_a.md").exists())
+
+
+class TestRevalidator(unittest.TestCase):
+    """Tests for Revalidator."""
+
+    def test_only_304_responses_are_unchanged(self):
+        """Matching ETags give 304; changed or unknown pages are re-scraped."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"current"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<html>new</html>")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            for name in ("001_a.md", "002_b.md"):
+                (output_dir / name).write_text("# old", encoding="utf-8")
+            store = ValidatorStore(output_dir, "fast")
+            store.record(URL_A, {"etag": '"current"'}, "001_a.md")
+            store.record(URL_B, {"etag": '"stale"'}, "002_b.md")
+
+            async def run() -> tuple[list[bool], Revalidator]:
+                scheduler = HostScheduler(rate=1000, respect_robots=False)
+                urls = [URL_A, URL_B, "https://docs.example.com/new"]
+                async with Revalidator(store, scheduler) as revalidator:
+                    verdicts = [await revalidator.is_unchanged(url) for url in urls]
+                return verdicts, revalidator
+
+            with patch_http_client("app.revalidation", handler):
+                verdicts, revalidator = asyncio.run(run())
+
+        self.assertEqual(verdicts, [True, False, False])
+        self.assertEqual(revalidator.unchanged, {URL_A})
+        self.assertEqual((revalidator.checked, len(requests)), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Unit tests for include/exclude scope rules.
+
+Tests ScopeRules and where it is applied:
+- Prefix, glob and regex rules, and skipped counts by reason
+- Auto-scope to the start URL's host and directory
+- Skipping links to downloads and media by file extension
+- Filtering links before they enter the crawl frontier, counting each once
+- Scraped files keep their input numbers when rules drop URLs
+"""
+
+import argparse
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.cli import scrape_command
+from app.frontier import CrawlFrontier
+from app.utils.scope import ScopeRules
+from app.utils.validation import validate_scope_rules
+
+BASE = "https://docs.djangoproject.com"
+
+
+class TestScopeRules(unittest.TestCase):
+    """Tests for ScopeRules matching."""
+
+    def test_exclude_prefix_glob_and_regex(self):
+        """Each rule form rejects what it should and nothing else."""
+        rules = ScopeRules(
+            exclude=["/en/5.2/releases/", "*/internals/*", "re:^/(fr|ja)/"]
+        )
+
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/topics/http/"))
+        self.assertFalse(rules.allows(f"{BASE}/en/5.2/releases/5.2/"))
+        self.assertFalse(rules.allows(f"{BASE}/en/dev/internals/contributing/"))
+        self.assertFalse(rules.allows(f"{BASE}/fr/5.2/intro/"))
+        self.assertEqual(rules.skipped["exclude"], 3)
+
+    def test_include_rules_are_required_when_given(self):
+        """With include rules, only matching paths are allowed."""
+        rules = ScopeRules(include=["/en/5.2/topics/*", "re:/howto/"])
+
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/topics/db/"))
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/howto/deployment/"))
+        self.assertFalse(rules.allows(f"{BASE}/en/5.2/ref/models/"))
+        self.assertEqual(rules.skipped["include"], 1)
+
+    def test_auto_scope_uses_start_directory(self):
+        """Auto-scope keeps the start host and directory only."""
+        rules = ScopeRules(start_url=f"{BASE}/en/5.2/index.html")
+
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/intro/"))
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2"))
+        self.assertFalse(rules.allows(f"{BASE}/en/dev/intro/"))
+        self.assertFalse(rules.allows("https://code.djangoproject.com/en/5.2/"))
+        self.assertEqual(rules.total_skipped, 2)
+
+    def test_empty_rules_allow_everything(self):
+        """No rules means a falsy ScopeRules that never rejects."""
+        rules = ScopeRules()
+
+        self.assertFalse(rules)
+        self.assertEqual(
+            rules.filter([f"{BASE}/a", f"{BASE}/b"]), [f"{BASE}/a", f"{BASE}/b"]
+        )
+
+    def test_skip_files_rejects_downloads(self):
+        """File links are rejected by extension; query strings do not count."""
+        rules = ScopeRules(skip_files=True)
+
+        self.assertTrue(rules)
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/intro/"))
+        self.assertTrue(rules.allows(f"{BASE}/en/5.2/intro/index.html?v=1.zip"))
+        self.assertFalse(rules.allows(f"{BASE}/m/docs/django-docs-5.2-en.ZIP"))
+        self.assertFalse(rules.allows(f"{BASE}/s/img/logo.svg#top"))
+        self.assertEqual(rules.skipped["file type"], 2)
+
+    def test_invalid_regex_fails_validation(self):
+        """Broken regular expressions are reported before any crawling."""
+        self.assertTrue(validate_scope_rules(["/en/", "re:^/en/(5|dev)/"])[0])
+        self.assertFalse(validate_scope_rules(["re:(unclosed"])[0])
+
+    def test_regex_rules_compile_on_their_own(self):
+        """Inline flags and repeated group names work across several rules."""
+        rules = ["re:(?i)/releases/", "re:^/(?P<lang>fr)/", "re:^/(?P<lang>ja)/"]
+        self.assertTrue(validate_scope_rules(rules)[0])
+
+        scope = ScopeRules(exclude=rules)
+
+        self.assertFalse(scope.allows(f"{BASE}/en/5.2/Releases/5.2/"))
+        self.assertFalse(scope.allows(f"{BASE}/ja/5.2/intro/"))
+        self.assertTrue(scope.allows(f"{BASE}/EN/5.2/intro/"))
+
+
+class TestFrontierScope(unittest.TestCase):
+    """Tests for scope filtering inside CrawlFrontier."""
+
+    def test_excluded_links_are_never_queued(self):
+        """Rejected links are neither stored nor counted as discovered."""
+        rules = ScopeRules(exclude=["/en/5.2/releases/"])
+        start = f"{BASE}/en/5.2/"
+        with CrawlFrontier(":memory:", start, scope=rules) as frontier:
+            added = frontier.add_many(
+                [f"{start}intro/", f"{start}releases/5.2/", f"{start}faq/"], 1, start
+            )
+
+            self.assertEqual(added, [f"{start}intro/", f"{start}faq/"])
+            self.assertEqual(len(frontier), 2)
+        self.assertEqual(rules.skipped["exclude"], 1)
+
+    def test_repeated_links_are_counted_once(self):
+        """Links seen again on later pages do not inflate the skipped count."""
+        rules = ScopeRules(exclude=["/en/5.2/releases/"])
+        start = f"{BASE}/en/5.2/"
+        links = [f"{start}intro/", f"{start}releases/5.2/", f"{start}intro"]
+        with CrawlFrontier(":memory:", start, scope=rules) as frontier:
+            frontier.add_many(links, 1, start)
+            added = frontier.add_many(links, 2, f"{start}intro/")
+
+        self.assertEqual(added, [])
+        self.assertEqual(rules.total_skipped, 1)
+
+
+class TestScrapeScope(unittest.TestCase):
+    """Tests for scope rules in scrape_command."""
+
+    def test_dropped_urls_do_not_renumber_files(self):
+        """Positions count from the input file, after --start-at and exclusions."""
+        urls = [f"{BASE}/en/5.2/{page}/" for page in ["a", "b", "c", "d", "e"]]
+        calls = []
+
+        async def fake_scrape(args, urls, console, positions=None):
+            calls.append((urls, positions))
+            return {"successful_urls": urls, "failed_urls": []}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = Path(tmp) / "urls.txt"
+            input_file.write_text("\n".join(urls))
+            args = argparse.Namespace(
+                fast=True,
+                verbose=False,
+                input_file=str(input_file),
+                start_at=1,
+                exclude=["/en/5.2/c/"],
+            )
+            with patch("app.cli._scrape_urls", fake_scrape):
+                asyncio.run(scrape_command(args))
+
+        self.assertEqual(calls, [([urls[1], urls[3], urls[4]], [2, 4, 5])])
+
+
+if __name__ == "__main__":
+    unittest.main()
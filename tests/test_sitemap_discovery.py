@@ -0,0 +1,136 @@
+"""Unit tests for sitemap_discovery module.
+
+Tests sitemap-first discovery with a mocked HTTP transport:
+- robots.txt Sitemap declarations and well-known fallbacks
+- Sitemap index fan-out with deterministic shard order
+- Gzipped shards and lastmod filtering
+- Scoping to the start URL's host and directory
+"""
+
+import asyncio
+import gzip
+import unittest
+from datetime import datetime, timezone
+
+from helpers import patch_http_client, serve_routes
+
+from app.sitemap_discovery import extract_links_sitemap, parse_lastmod
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*entries: tuple[str, str | None]) -> bytes:
+    """Build a <urlset> document from (loc, lastmod) pairs."""
+    body = "".join(
+        f"<url><loc>{loc}</loc>"
+        + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "")
+        + "</url>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0"?><urlset {NS}>{body}</urlset>'.encode()
+
+
+def sitemap_index(*entries: tuple[str, str | None]) -> bytes:
+    """Build a <sitemapindex> document from (loc, lastmod) pairs."""
+    body = "".join(
+        f"<sitemap><loc>{loc}</loc>"
+        + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "")
+        + "</sitemap>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0"?><sitemapindex {NS}>{body}</sitemapindex>'.encode()
+
+
+class TestSitemapDiscovery(unittest.TestCase):
+    """Test suite for extract_links_sitemap."""
+
+    def setUp(self):
+        self.start_url = "https://docs.example.com/en/stable/"
+        self.routes: dict[str, bytes] = {}
+
+    def discover(self, **kwargs) -> list[str]:
+        with patch_http_client("app.sitemap_discovery", serve_routes(self.routes)):
+            return asyncio.run(extract_links_sitemap(self.start_url, **kwargs))
+
+    def test_robots_declared_index_fans_out_in_order(self):
+        """Shards listed in an index are merged in index order and scoped."""
+        self.routes = {
+            "https://docs.example.com/robots.txt": (
+                b"User-agent: *\nSitemap: https://docs.example.com/sitemap-index.xml\n"
+            ),
+            "https://docs.example.com/sitemap-index.xml": sitemap_index(
+                ("https://docs.example.com/shard1.xml", None),
+                ("https://docs.example.com/shard2.xml.gz", None),
+            ),
+            "https://docs.example.com/shard1.xml": urlset(
+                ("https://docs.example.com/en/stable/intro/", None),
+                ("https://docs.example.com/en/stable/intro/#top", None),
+                ("https://docs.example.com/fr/stable/intro/", None),
+            ),
+            "https://docs.example.com/shard2.xml.gz": gzip.compress(
+                urlset(
+                    ("https://docs.example.com/en/stable/ref/", None),
+                    ("https://other.example.com/en/stable/ref/", None),
+                )
+            ),
+        }
+
+        result = self.discover()
+
+        self.assertEqual(
+            result,
+            [
+                "https://docs.example.com/en/stable/intro/",
+                "https://docs.example.com/en/stable/ref/",
+            ],
+        )
+
+    def test_well_known_location_fallback(self):
+        """Without robots.txt declarations, /sitemap.xml is probed."""
+        self.routes = {
+            "https://docs.example.com/sitemap.xml": urlset(
+                ("https://docs.example.com/en/stable/a/", None),
+            ),
+        }
+
+        self.assertEqual(self.discover(), ["https://docs.example.com/en/stable/a/"])
+
+    def test_no_sitemap_returns_empty_list(self):
+        """An empty list signals the caller to fall back to crawling."""
+        self.assertEqual(self.discover(), [])
+
+    def test_since_filters_by_lastmod(self):
+        """Entries older than `since` are dropped; undated entries are kept."""
+        self.routes = {
+            "https://docs.example.com/sitemap.xml": urlset(
+                ("https://docs.example.com/en/stable/old/", "2024-01-01"),
+                ("https://docs.example.com/en/stable/new/", "2025-06-01T10:00:00Z"),
+                ("https://docs.example.com/en/stable/undated/", None),
+            ),
+        }
+
+        result = self.discover(since=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual(
+            result,
+            [
+                "https://docs.example.com/en/stable/new/",
+                "https://docs.example.com/en/stable/undated/",
+            ],
+        )
+
+    def test_parse_lastmod_formats(self):
+        """W3C date and datetime variants parse to aware datetimes."""
+        self.assertEqual(
+            parse_lastmod("2025-01-31"), datetime(2025, 1, 31, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            parse_lastmod("2025-01-31T12:00:00Z"),
+            datetime(2025, 1, 31, 12, tzinfo=timezone.utc),
+        )
+        self.assertIsNone(parse_lastmod("yesterday"))
+        self.assertIsNone(parse_lastmod(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for URL template clustering and --sample runs.
+
+Tests the clustering helpers and the sampling step of `scribe scrape`:
+- URLs reduce to templates by section, segment shape and depth
+- Samples are spread evenly over each cluster
+- Sample results are summarized per cluster with full-run estimates
+"""
+
+import argparse
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.cli import scrape_command
+from app.url_clusters import cluster_report, cluster_urls, sample_clusters, url_template
+
+BASE = "https://docs.djangoproject.com/en/5.2"
+
+
+class TestUrlTemplates(unittest.TestCase):
+    """Tests for url_template and cluster_urls."""
+
+    def test_templates_by_section_shape_and_depth(self):
+        """Same-shaped pages share a template; deeper pages do not."""
+        self.assertEqual(
+            url_template(f"{BASE}/releases/5.1.3/"),
+            "docs.djangoproject.com/releases/{version}",
+        )
+        self.assertEqual(
+            url_template(f"{BASE}/ref/models/fields/"),
+            url_template("https://docs.djangoproject.com/en/dev/ref/forms/api/"),
+        )
+        self.assertNotEqual(
+            url_template(f"{BASE}/ref/models/"), url_template(f"{BASE}/ref/models/q/")
+        )
+        self.assertEqual(
+            url_template("https://example.com/issues/1234/index.html"),
+            "example.com/issues/{n}",
+        )
+
+    def test_clusters_keep_first_appearance_order(self):
+        urls = [f"{BASE}/topics/a/", f"{BASE}/ref/a/", f"{BASE}/topics/b/"]
+
+        clusters = cluster_urls(urls)
+
+        self.assertEqual(list(clusters.values()), [[urls[0], urls[2]], [urls[1]]])
+
+
+class TestSampling(unittest.TestCase):
+    """Tests for sample_clusters and cluster_report."""
+
+    def test_sample_is_spread_over_each_cluster(self):
+        """Large clusters are sampled evenly, small ones completely."""
+        topics = [f"{BASE}/topics/page-{i}/" for i in range(10)]
+        clusters = {"topics": topics, "faq": [f"{BASE}/faq/"]}
+
+        sample = sample_clusters(clusters, per_cluster=3)
+
+        self.assertEqual(sample, [topics[0], topics[3], topics[6], f"{BASE}/faq/"])
+
+    def test_report_extrapolates_per_cluster(self):
+        """Per-page averages are scaled to each cluster's full size."""
+        topics = [f"{BASE}/topics/page-{i}/" for i in range(10)]
+        clusters = {"topics": topics}
+        summary = {
+            "failed_urls": [(topics[5], "timeout")],
+            "page_stats": {
+                topics[0]: {"seconds": 2.0, "chars": 1000},
+                topics[5]: {"seconds": 4.0, "chars": 0},
+            },
+        }
+
+        (stats,) = cluster_report(clusters, [topics[0], topics[5]], summary)
+
+        self.assertEqual((stats.sampled, stats.failed), (2, 1))
+        self.assertEqual(stats.failure_rate, 0.5)
+        self.assertEqual(stats.estimated_seconds, 30.0)
+        self.assertEqual(stats.estimated_chars, 5000.0)
+
+
+class TestSampleCommand(unittest.TestCase):
+    """Tests for scrape --sample."""
+
+    def test_scrape_processes_only_the_sample(self):
+        """Only sampled URLs reach the scraper, and the report is attached."""
+        urls = [f"{BASE}/topics/page-{i}/" for i in range(6)] + [f"{BASE}/faq/"]
+        scraped: list[list[str]] = []
+        numbers: list[list[int] | None] = []
+
+        async def fake_scrape(args, urls, console, positions=None):
+            scraped.append(urls)
+            numbers.append(positions)
+            return {"successful_urls": urls, "failed_urls": [], "page_stats": {}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = Path(tmp) / "urls.txt"
+            input_file.write_text("\n".join(urls))
+            args = argparse.Namespace(
+                fast=True,
+                verbose=False,
+                input_file=str(input_file),
+                start_at=0,
+                sample=2,
+                revalidate=True,
+            )
+            with patch("app.cli._scrape_urls", fake_scrape):
+                summary = asyncio.run(scrape_command(args))
+
+        self.assertEqual(scraped, [[urls[0], urls[3], urls[6]]])
+        self.assertEqual(numbers, [[1, 4, 7]])
+        self.assertEqual([c.sampled for c in summary["clusters"]], [2, 1])
+        self.assertFalse(args.revalidate)
+
+
+if __name__ == "__main__":
+    unittest.main()
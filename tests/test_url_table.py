@@ -0,0 +1,74 @@
+"""Unit tests for the compact URL table.
+
+Tests UrlTable:
+- URLs are stored once, in insertion order, and read back unchanged
+- Slices and comparisons behave like a list of the same URLs
+- Lookups stay exact while the hash index grows
+- Depth and status columns follow their records
+- Directory prefixes are stored once
+"""
+
+import unittest
+
+from app.utils.url_table import UrlTable
+
+BASE = "https://docs.example.com/en/5.2/ref/"
+
+
+class TestUrlTable(unittest.TestCase):
+    """Tests for UrlTable storage and lookups."""
+
+    def test_add_and_read_back(self):
+        """Duplicates are rejected and URLs round-trip, queries and all."""
+        table = UrlTable()
+        urls = [
+            f"{BASE}models.html",
+            "https://docs.example.com/",
+            f"{BASE}search?q=a/b",
+            "https://docs.example.com/ünïcode/page",
+        ]
+        self.assertEqual([table.add(url) for url in urls], [0, 1, 2, 3])
+        self.assertIsNone(table.add(f"{BASE}models.html"))
+        self.assertEqual(list(table), urls)
+        self.assertEqual(table[-1], urls[-1])
+        self.assertEqual(table.index(f"{BASE}search?q=a/b"), 2)
+        self.assertNotIn(f"{BASE}models", table)
+
+    def test_slices_and_equality(self):
+        """A table slices into lists and equals a list with the same order."""
+        table = UrlTable()
+        urls = [f"{BASE}page_{i}.html" for i in range(5)]
+        for url in urls:
+            table.add(url)
+
+        self.assertEqual(table[1:4], urls[1:4])
+        self.assertEqual(table[::-2], urls[::-2])
+        self.assertEqual(table, urls)
+        self.assertNotEqual(table, urls[::-1])
+        self.assertNotEqual(table, urls[:4])
+
+    def test_growth_keeps_lookups_exact(self):
+        """Every URL is still found after the index has been rebuilt."""
+        table = UrlTable()
+        urls = [f"{BASE}section-{i // 50}/page_{i}.html" for i in range(5000)]
+        for depth, url in enumerate(urls):
+            table.add(url, depth=depth % 4)
+        self.assertEqual(len(table), 5000)
+        self.assertTrue(all(table.index(url) == i for i, url in enumerate(urls)))
+        self.assertIsNone(table.index(f"{BASE}section-0/page_5000.html"))
+        self.assertEqual(table.depths[4999], 4999 % 4)
+
+    def test_columns_and_prefixes(self):
+        """Depth/status columns are per record and prefixes are interned."""
+        table = UrlTable()
+        table.add(f"{BASE}a", depth=2, status=1)
+        table.add(f"{BASE}b", depth=3)
+        table.statuses[1] = 2
+        self.assertEqual(list(table.depths), [2, 3])
+        self.assertEqual(list(table.statuses), [1, 2])
+        self.assertEqual(table._prefixes, [BASE])
+        self.assertGreater(table.nbytes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
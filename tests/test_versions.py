@@ -0,0 +1,115 @@
+"""Unit tests for versioned-docs de-duplication.
+
+Tests split_version, VersionFilter and their use in ScopeRules:
+- Version and language prefixes are detected without eating page sections
+- A pinned version drops other versions but keeps unversioned pages
+- Each logical page keeps the first version seen as its representative
+- API versions, numbered sections and one-off prefixes are never collapsed
+"""
+
+import unittest
+
+from app.utils.scope import ScopeRules
+from app.utils.validation import validate_pin_version
+from app.utils.versions import VersionFilter, split_version
+
+BASE = "https://docs.djangoproject.com"
+
+
+class TestSplitVersion(unittest.TestCase):
+    """Tests for detecting version and language segments."""
+
+    def test_version_and_language_prefixes(self):
+        """Common documentation layouts split into page path and variant."""
+        cases = {
+            "/en/5.2/topics/http/": ("/topics/http/", ("en", "5.2")),
+            "/en/dev/": ("/", ("en", "dev")),
+            "/fr/3/library/os.html": ("/library/os.html", ("fr", "3")),
+            "/3.12/library/": ("/library/", ("3.12",)),
+            "/pt-br/stable/intro/": ("/intro/", ("pt-br", "stable")),
+            "/v2/users/": ("/users/", ("v2",)),
+        }
+        for path, expected in cases.items():
+            with self.subTest(path=path):
+                self.assertEqual(split_version(path), expected)
+
+    def test_unversioned_paths_are_untouched(self):
+        """Sections, dates and deeper version-like segments are not prefixes."""
+        paths = [
+            "/go/intro/",
+            "/en-US/docs/Web/",
+            "/2024/05/post/",
+            "/",
+            "/api/v2/users",
+            "/ch/01/intro",
+            "/guide/en/5.2/",
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(split_version(path), (path, ()))
+
+
+class TestVersionFilter(unittest.TestCase):
+    """Tests for pinning and collapsing versions."""
+
+    def test_first_version_seen_represents_the_page(self):
+        """Other versions and translations of a page are collapsed."""
+        versions = VersionFilter()
+        for prefix in ["en/5.2", "en/dev", "fr/5.2"]:
+            for page in ["intro", "faq", "howto"]:
+                versions.check(f"{BASE}/{prefix}/{page}/")
+
+        self.assertIsNone(versions.check(f"{BASE}/en/5.2/topics/http/"))
+        self.assertEqual(versions.check(f"{BASE}/en/dev/topics/http"), "other version")
+        self.assertEqual(versions.check(f"{BASE}/fr/5.2/topics/http/"), "other version")
+        self.assertIsNone(versions.check(f"{BASE}/en/5.2/topics/http/index.html"))
+        self.assertIsNone(versions.check(f"{BASE}/en/dev/topics/new-in-dev/"))
+
+    def test_sections_are_not_collapsed(self):
+        """API versions, numbered sections and rarely seen prefixes are kept."""
+        versions = VersionFilter()
+        urls = [
+            f"{BASE}/api/v1/users",
+            f"{BASE}/api/v2/users",
+            f"{BASE}/1/index.html",
+            f"{BASE}/2/index.html",
+            f"{BASE}/ch/01/intro",
+            f"{BASE}/ch/02/intro",
+            f"{BASE}/en/5.2/intro/",
+            f"{BASE}/en/dev/intro/",
+        ]
+
+        self.assertEqual([versions.check(url) for url in urls], [None] * len(urls))
+
+    def test_pin_keeps_unversioned_pages(self):
+        """Only the pinned version survives; pages without a version pass."""
+        versions = VersionFilter(pin="en/5.2", collapse=False)
+
+        self.assertIsNone(versions.check(f"{BASE}/en/5.2/intro/"))
+        self.assertEqual(versions.check(f"{BASE}/en/dev/intro/"), "version")
+        self.assertEqual(versions.check(f"{BASE}/fr/5.2/intro/"), "version")
+        self.assertIsNone(versions.check(f"{BASE}/community/"))
+
+    def test_scope_rules_count_collapsed_pages(self):
+        """ScopeRules reports pinned-out and collapsed URLs separately."""
+        rules = ScopeRules(collapse_versions=True, pin_version="5.2")
+        urls = [
+            f"{BASE}/{prefix}/{page}/"
+            for prefix in ["en/5.2", "en/dev", "ja/5.2"]
+            for page in ["intro", "faq", "howto"]
+        ]
+
+        # ja/5.2 is only collapsed from its third page on
+        self.assertEqual(rules.filter(urls), urls[:3] + urls[6:8])
+        self.assertEqual(rules.skipped, {"version": 3, "other version": 1})
+
+    def test_pin_validation(self):
+        """Only version-like pins are accepted."""
+        for pin in ["5.2", "dev", "en/5.2", "v3", "3"]:
+            self.assertTrue(validate_pin_version(pin)[0], pin)
+        for pin in ["", "/", "topics", "en/topics"]:
+            self.assertFalse(validate_pin_version(pin)[0], pin)
+
+
+if __name__ == "__main__":
+    unittest.main()